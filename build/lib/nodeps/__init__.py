@@ -0,0 +1,35 @@
+"""NoDeps Helpers and Utils Module.
+
+Submodules are imported on first access to one of their names, since ``nodeps.pth`` imports
+this package at interpreter startup (see :func:`nodeps._lazy.lazy`).
+"""
+import os
+import sys
+
+from ._lazy import SetupFinder, lazy
+
+__getattr__, __dir__ = lazy(__name__, ("extras", "ipython_variables", "modules", "setup"))
+
+_nodeps_module_path = os.path.dirname(os.path.abspath(__file__))
+_ipythondir = os.path.join(_nodeps_module_path, "ipython_dir")
+_ipython_profile_default_dir = os.path.join(_ipythondir, "profile_default")
+_virtual_env = os.environ.get("VIRTUAL_ENV")
+_virtual_env_src = os.path.join(os.path.dirname(_virtual_env), "src") if _virtual_env else None
+
+os.environ["IPYTHONDIR"] = _ipythondir
+os.environ["PIP_ROOT_USER_ACTION"] = "ignore"
+os.environ["PY_IGNORE_IMPORTMISMATCH"] = "1"
+os.environ["PYTHONDONTWRITEBYTECODE"] = ""
+os.environ["PYTHONSTARTUP"] = os.path.join(_ipython_profile_default_dir, "python_startup.py")
+
+# Same as :func:`nodeps.ipython_variables.to_sys_path` without importing IPython.
+for _path in (
+    _ipython_profile_default_dir,
+    os.path.dirname(_nodeps_module_path),
+    os.getcwd() if _virtual_env else None,
+    _virtual_env_src if _virtual_env_src and os.path.isdir(_virtual_env_src) else None,
+):
+    if _path is not None and _path not in sys.path:
+        sys.path.insert(0, _path)
+
+SetupFinder.install()
@@ -0,0 +1,168 @@
+"""NoDeps Lazy Module.
+
+Caveats:
+    Imported from ``nodeps.pth`` at interpreter startup, so only standard library modules which are already
+    imported by :mod:`site` can be imported at module level.
+"""
+from __future__ import annotations
+
+__all__ = (
+    "SetupFinder",
+    "lazy",
+)
+
+import importlib
+import sys
+
+TYPE_CHECKING = False
+"""Avoids importing :mod:`typing` at startup."""
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class SetupFinder:
+    """A meta path finder that imports :mod:`nodeps.setup` when pip, pipx or setuptools commands are imported.
+
+    :mod:`nodeps.setup` patches pip, pipx and setuptools for the post install and .pth files,
+    it is expensive to import and not needed by most processes, so it is deferred until one of the
+    modules it patches is imported. It is removed from :data:`sys.meta_path` the first time it is used.
+
+    Caveats:
+        setuptools must be imported before pip, otherwise ``_distutils_hack`` fails to override distutils.
+
+    Examples:
+        >>> import sys
+        >>> import nodeps
+        >>> from nodeps._lazy import SetupFinder
+        >>>
+        >>> assert SetupFinder in sys.meta_path or "nodeps.setup" in sys.modules
+    """
+
+    modules = frozenset({
+        "pip",
+        "pipx.commands.common",
+        "setuptools.command.build_py",
+    })
+    """Modules which trigger the import of :mod:`nodeps.setup` once executed."""
+    package = __name__.rpartition(".")[0]
+
+    # noinspection PyMethodOverriding,PyMethodParameters,PyUnresolvedReferences
+    @classmethod
+    def find_spec(cls, fullname, path, target=None):
+        """Find spec with the rest of the finders and import :mod:`nodeps.setup` after the module is executed."""
+        if fullname not in cls.modules or cls not in sys.meta_path:
+            return None
+        sys.meta_path.remove(cls)
+
+        import importlib.util
+
+        # nodeps[pth] extras
+        if fullname == "pip" and importlib.util.find_spec("setuptools") is not None:
+            import setuptools  # type: ignore[attr-defined] # noqa: F401
+
+        spec = importlib.util.find_spec(fullname)
+        if spec is not None and spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            exec_module = spec.loader.exec_module
+
+            def _exec_module(module):
+                exec_module(module)
+                parent, _, child = fullname.rpartition(".")
+                if parent:
+                    # The import system binds the submodule to the parent package only after it is loaded.
+                    setattr(sys.modules[parent], child, module)
+                importlib.import_module(f"{cls.package}.setup")
+
+            spec.loader.exec_module = _exec_module
+        return spec
+
+    @classmethod
+    def install(cls) -> None:
+        """Add to :data:`sys.meta_path` or import :mod:`nodeps.setup` if a patched module is already imported."""
+        if not cls.modules.isdisjoint(sys.modules):
+            importlib.import_module(f"{cls.package}.setup")
+        elif cls not in sys.meta_path:
+            # noinspection PyTypeChecker
+            sys.meta_path.insert(0, cls)
+
+
+def _names(package: str, submodule: str) -> tuple[str, ...]:
+    """Names in ``__all__`` of a submodule.
+
+    The ``__all__`` statement is parsed from the source without importing the submodule when it is
+    the only module level ``__all__`` statement and assigns a literal tuple or list, otherwise the submodule
+    is imported (i.e.: computed ``__all__`` or lazy packages).
+    """
+    import ast
+    import importlib.util
+
+    name = f"{package}.{submodule}"
+    spec = importlib.util.find_spec(name)
+    try:
+        lines = spec.loader.get_source(name).splitlines(keepends=True)
+    except (AttributeError, ImportError, OSError):
+        lines = []
+    if len(starts := [i for i, line in enumerate(lines) if line.startswith("__all__")]) == 1:
+        start = starts[0]
+        # The statement ends in a line with a closing bracket, which may also be in a string or comment.
+        for end in (i for i in range(start, len(lines)) if ")" in lines[i] or "]" in lines[i]):
+            try:
+                node = ast.parse("".join(lines[start:end + 1])).body[0]
+            except SyntaxError:
+                continue
+            if isinstance(node, ast.Assign | ast.AnnAssign) and isinstance(node.value, ast.Tuple | ast.List):
+                try:
+                    return tuple(ast.literal_eval(node.value))
+                except ValueError:
+                    pass
+            break
+    return tuple(importlib.import_module(name).__all__)
+
+
+def lazy(package: str, submodules: tuple[str, ...]) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """PEP 562 module ``__getattr__`` and ``__dir__`` for a package which imports submodules on demand.
+
+    The name to submodule index is built from ``__all__`` of each submodule the first time
+    a name not yet in the package globals is accessed, and the value is stored in the package globals,
+    so the submodule is only imported when one of its names is used.
+
+    Examples:
+        >>> import sys
+        >>> import nodeps
+        >>>
+        >>> assert nodeps.Path.__module__ == "nodeps.modules.path"
+        >>> assert "Path" in nodeps.__all__
+        >>> assert "Path" in dir(nodeps)
+
+    Args:
+        package: package name (``__name__``)
+        submodules: submodules names, in the order used for ``__all__``
+
+    Returns:
+        Module ``__getattr__`` and ``__dir__`` functions.
+    """
+    index = {}
+
+    def __getattr__(name: str):  # noqa: N807
+        module = sys.modules[package]
+        if name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+        if name.startswith("_") and name != "__all__":
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        if not index:
+            for submodule in submodules:
+                index.update(dict.fromkeys(_names(package, submodule), submodule))
+        if name == "__all__":
+            value = tuple(index)
+        elif submodule := index.get(name):
+            value = getattr(importlib.import_module(f"{package}.{submodule}"), name)
+        else:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(sys.modules[package]), *submodules, *__getattr__("__all__")})
+
+    return __getattr__, __dir__
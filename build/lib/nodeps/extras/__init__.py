@@ -0,0 +1,4 @@
+"""NoDeps Extras Module."""
+from .._lazy import lazy
+
+__getattr__, __dir__ = lazy(__name__, ("ansi", "debug", "echo", "log", "pickle", "pretty", "repo", "url"))
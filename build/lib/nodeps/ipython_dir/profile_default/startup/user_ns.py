@@ -0,0 +1 @@
+test_rich = [True, 1, "a"]  # noqa: INP001, D100
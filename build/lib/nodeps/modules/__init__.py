@@ -0,0 +1,21 @@
+"""NoDeps Modules Module."""
+from .._lazy import lazy
+
+__getattr__, __dir__ = lazy(__name__, (
+    "benchmarks",
+    "classes",
+    "constants",
+    "daemon",
+    "datas",
+    "enums",
+    "env",
+    "errors",
+    "functions",
+    "gh",
+    "gitconfig",
+    "metapath",
+    "path",
+    "project",
+    "seteuid",
+    "typings",
+))
@@ -0,0 +1,172 @@
+"""Constants Module."""
+__all__ = (
+    "AIOGH_LIMIT",
+    "AUTHOR",
+    "BENCHMARK_BUDGETS",
+    "CACHE_BENCHMARK_NUMBER",
+    "CI",
+    "DAEMON_SOCKET",
+    "DOCKER",
+    "DOCKER_COMMAND",
+    "EXECUTABLE",
+    "EXECUTABLE_SITE",
+    "GIT",
+    "GIT_DEFAULT_SCHEME",
+    "GITHUB_DOMAIN",
+    "GITHUB_ID",
+    "GITHUB_TOKEN",
+    "GITHUB_URL",
+    "GITURL_BENCHMARK_SIZE",
+    "LINUX",
+    "LOCAL",
+    "MACOS",
+    "NODEPS_EXECUTABLE",
+    "NODEPS_PIP_POST_INSTALL_FILENAME",
+    "NODEPS_PROJECT_NAME",
+    "NODEPS_TOP",
+    "PICKLE_MAXSIZE",
+    "PICKLE_SCHEMA",
+    "PY_MAJOR_MINOR",
+    "PYTHON_VERSIONS",
+    "PYTHON_DEFAULT_VERSION",
+    "RUNNING_IN_VENV",
+    "SUDO",
+    "USER",
+    "URLJSON_TIMEOUT",
+    "URLJSON_WORKERS",
+    "EMAIL",
+    "PW_ROOT",
+    "PW_USER",
+)
+
+import os
+import pathlib
+import pwd
+import shutil
+import sys
+from typing import TYPE_CHECKING
+
+_nodeps_module_dir = pathlib.Path(__file__).parent.parent
+
+AIOGH_LIMIT = 8
+"""Maximum number of repositories running at the same time with :func:`nodeps.aiogh`."""
+AUTHOR = "José Antonio Puértolas Montañés"
+BENCHMARK_BUDGETS = {
+    f"import {_nodeps_module_dir.name}": 50.0,
+    f"{_nodeps_module_dir.name}.pth": 50.0,
+}
+"""Default budgets in milliseconds for :func:`nodeps.benchmark`."""
+CACHE_BENCHMARK_NUMBER = 1_000
+"""Default number of calls for :func:`nodeps.benchmark_cache`."""
+CI = bool(os.environ.get("CI"))
+"""True if running in CI."""
+DAEMON_SOCKET = os.environ.get(
+    "NODEPS_DAEMON_SOCKET",
+    str(pathlib.Path(os.environ.get("XDG_RUNTIME_DIR") or f"/tmp/nodeps-{os.getuid()}", "nodeps.sock")),  # noqa: S108
+)
+"""Daemon unix socket path, in a private (0700) directory, can be set with ``$NODEPS_DAEMON_SOCKET``."""
+EXECUTABLE = pathlib.Path(sys.executable)
+GIT = os.environ.get("GIT", "j5pu")
+"""GitHub user name"""
+GIT_DEFAULT_SCHEME = "https"
+GITHUB_DOMAIN = "github.com"
+GITHUB_ID = "159632576"
+"""GitHub numeric ID."""
+GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN", os.environ.get("GH_TOKEN", os.environ.get("TOKEN")))
+"""GitHub Token"""
+GITHUB_URL = {
+    "api": f"https://api.{GITHUB_DOMAIN}",
+    "git+file": "git+file://",
+    "git+https": f"git+https://{GITHUB_DOMAIN}/",
+    "git+ssh": f"git+ssh://git@{GITHUB_DOMAIN}/",
+    "https": f"https://{GITHUB_DOMAIN}/",
+    "ssh": f"git@{GITHUB_DOMAIN}:",
+}
+"""
+GitHub: api, git+file, git+https, git+ssh, https, ssh and git URLs
+(join directly the user or path without '/' or ':')
+"""
+GITURL_BENCHMARK_SIZE = 100_000
+"""Default number of urls for :func:`nodeps.benchmark_giturl`."""
+LINUX = sys.platform == "linux"
+"""Is Linux? sys.platform == 'linux'"""
+MACOS = sys.platform == "darwin"
+"""Is macOS? sys.platform == 'darwin'"""
+NODEPS_EXECUTABLE = "p"
+"""NoDeps Executable Name"""
+NODEPS_PIP_POST_INSTALL_FILENAME = "_post_install.py"
+"""Filename that will be searched after pip installs a package."""
+NODEPS_PROJECT_NAME = _nodeps_module_dir.name
+"""NoDeps Project Name"""
+PICKLE_MAXSIZE = int(os.environ.get("PICKLE_MAXSIZE", str(256 * 1024**2)))
+"""Maximum bytes of :meth:`nodeps.Path.pickle` files before the least recently used are evicted."""
+PICKLE_SCHEMA = 1
+"""Format stamp of :meth:`nodeps.Path.pickle` files, files with other stamp are discarded."""
+PY_MAJOR_MINOR = f"{sys.version_info[0]}.{sys.version_info[1]}"
+"""Major.Minor Python running version."""
+PYTHON_VERSIONS = (
+    os.environ.get("PYTHON_DEFAULT_VERSION", "3.11"),
+    "3.12",
+)
+"""Python versions for venv, etc."""
+PYTHON_DEFAULT_VERSION = PYTHON_VERSIONS[0]
+"""Python default version for venv, etc."""
+RUNNING_IN_VENV = sys.base_prefix != sys.prefix
+"""Tue if running in a virtual env."""
+SUDO = str(rv) if (rv := pathlib.Path("/usr/bin/sudo")).exists() else ""
+"""Sudo command path if exists."""
+USER = os.getenv("USER", "root")
+""""Environment Variable $USER or root if not USER variable"""
+URLJSON_TIMEOUT = 30
+"""Seconds to wait for :func:`nodeps.urljson` to connect and for each read."""
+URLJSON_WORKERS = 16
+"""Maximum number of concurrent requests in :func:`nodeps.urljson_many`."""
+
+EMAIL = f"{GITHUB_ID}+{GIT}@users.noreply.{GITHUB_DOMAIN}"
+
+if TYPE_CHECKING:
+    DOCKER: bool
+    DOCKER_COMMAND: bool
+    EXECUTABLE_SITE: pathlib.Path
+    LOCAL: bool
+    NODEPS_TOP: pathlib.Path | None
+    PW_ROOT: pwd.struct_passwd
+    PW_USER: pwd.struct_passwd
+
+_LAZY = {
+    "DOCKER": lambda: bool((_p := pathlib.Path("/proc/self/mountinfo")).is_file() and "/docker" in _p.read_text()),
+    "DOCKER_COMMAND": lambda: bool(shutil.which("docker", mode=os.X_OK)),
+    "EXECUTABLE_SITE": lambda: pathlib.Path(EXECUTABLE).resolve(),
+    "LOCAL": lambda: not CI and not __getattr__("DOCKER"),
+    "NODEPS_TOP": lambda: _p if ((_p := pathlib.Path(
+        os.environ.get("GITHUB_WORKSPACE", _nodeps_module_dir.parent.parent))) / ".git").exists() else None,
+    "PW_ROOT": lambda: pwd.getpwnam("root"),
+    "PW_USER": lambda: pwd.getpwnam(USER),
+}
+"""Constants which need syscalls, computed on first access and memoized in the module globals.
+
+DOCKER: True if running inside container.
+DOCKER_COMMAND: True if docker install.
+EXECUTABLE_SITE: resolved :data:`EXECUTABLE`.
+LOCAL: True if not running in CI nor DOCKER container.
+NODEPS_TOP: NoDeps Git Repository Top if exists, else None.
+PW_ROOT: root password database entry.
+PW_USER: :data:`USER` password database entry.
+"""
+
+
+def __getattr__(name: str):
+    """Computes and memoizes lazy constants (PEP 562).
+
+    Examples:
+        >>> from nodeps.modules import constants
+        >>>
+        >>> assert constants.EXECUTABLE_SITE == constants.EXECUTABLE.resolve()
+        >>> assert "EXECUTABLE_SITE" in vars(constants)
+        >>> assert constants.PW_ROOT.pw_uid == 0
+    """
+    if (func := _LAZY.get(name)) is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value = func()
+    return value
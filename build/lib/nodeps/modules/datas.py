@@ -0,0 +1,108 @@
+"""DataClasses Module."""
+__all__ = (
+    "IdName",
+    "GitStatus",
+    "GitSync",
+    "GroupUser",
+    "PickleInfo",
+)
+
+import dataclasses
+
+
+@dataclasses.dataclass
+class GitStatus:
+    """Git SHA and status.
+
+    Attributes:
+        base: base SHA
+        dirty: is repository dirty including untracked files
+        diverge: need push and pull. It considers is dirty.
+        local: local SHA
+        pull: needs pull
+        push: needs push
+        remote: remote SHA
+    """
+    base: str = ""
+    dirty: bool = False
+    diverge: bool = False
+    local: str = ""
+    pull: bool = False
+    push: bool = False
+    remote: str = ""
+
+
+@dataclasses.dataclass
+class GitSync:
+    """Git sync result of a repository.
+
+    Attributes:
+        name: repository name
+        pulled: pulled
+        pushed: committed if dirty and pushed
+        skipped: nothing to sync
+        diverged: not synced because it needs pull and push or pull and is dirty
+        error: exception raised by sync
+        duration: seconds
+    """
+    name: str = ""
+    pulled: bool = False
+    pushed: bool = False
+    skipped: bool = False
+    diverged: bool = False
+    error: str = ""
+    duration: float = 0.0
+
+    @property
+    def state(self) -> str:
+        r"""Summary: error and its first line, diverged, pushed and/or pulled, or skipped.
+
+        Examples:
+            >>> from nodeps import GitSync
+            >>>
+            >>> assert GitSync(pulled=True, pushed=True).state == "pushed, pulled"
+            >>> assert GitSync(error="RuntimeError: Diverged\nstatus").state == "error: RuntimeError: Diverged"
+        """
+        if self.error:
+            return f"error: {self.error.splitlines()[0]}"
+        if self.diverged:
+            return "diverged"
+        return ", ".join(k for k in ("pushed", "pulled") if getattr(self, k)) or "skipped"
+
+
+@dataclasses.dataclass
+class IdName:
+    """Id and Name dataclass."""
+    id: int  # noqa: A003
+    name: str
+
+
+@dataclasses.dataclass
+class GroupUser:
+    """GroupUser class."""
+    group: IdName
+    user: IdName
+
+
+@dataclasses.dataclass
+class PickleInfo:
+    """Statistics of :meth:`nodeps.Path.pickle` cache.
+
+    Attributes:
+        hits: loads found
+        misses: loads not found, including expired and stale
+        expired: loads with ttl expired
+        stale: loads discarded for schema or version stamp, or unpickling error
+        writes: dumps
+        evictions: files removed because of :data:`nodeps.PICKLE_MAXSIZE`
+        entries: files in the directory
+        size: bytes in the directory
+    """
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    stale: int = 0
+    writes: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size: int = 0
@@ -0,0 +1,1443 @@
+"""GH Module."""
+__all__ = (
+    "GIT_CONFIG_GLOBAL",
+    "GIT_FETCH_TTL",
+    "GITHUB_WORKERS",
+    "GITURL_CACHE_SIZE",
+    "GitUrl",
+    "GitUrlRecord",
+    "Gh",
+    "aioclone",
+    "aiogh",
+    "aiogh_sync",
+    "clone",
+    "git_config_global",
+)
+
+import asyncio
+import contextlib
+import dataclasses
+import functools
+import os
+import subprocess
+import tempfile
+import time
+import urllib.error
+from collections.abc import Callable, Iterable
+from typing import ClassVar, Protocol, runtime_checkable
+
+from . import constants
+from .classes import ColorLogger
+from .constants import AIOGH_LIMIT, CI, EMAIL, GIT, GITHUB_TOKEN, GITHUB_URL, NODEPS_PROJECT_NAME
+from .datas import GitStatus, GitSync
+from .enums import Bump
+from .errors import CmdError, InvalidArgumentError
+from .functions import aiocmd, cmd, stdout, urljson, urljson_many
+from .gitconfig import (
+    git_branch,
+    git_dir,
+    git_global_config,
+    git_ref,
+    git_remote_url,
+    git_superproject,
+    git_tags,
+    git_top,
+)
+from .path import Path
+from .platforms import (
+    PLATFORMS_INDEX,
+    AssemblaPlatform,
+    BasePlatform,
+    BitbucketPlatform,
+    FriendCodePlatform,
+    GitHubPlatform,
+    GitLabPlatform,
+    dispatch,
+)
+
+GITHUB_WORKERS = 16
+"""Maximum number of concurrent GitHub API requests in :meth:`GitUrl.github_many`."""
+GITURL_CACHE_SIZE = 4096
+"""Maximum number of urls in :meth:`GitUrl.parse` cache."""
+GIT_FETCH_TTL = 60
+"""Seconds since the last fetch (``FETCH_HEAD`` modification time) in which :meth:`Gh.status` with ``fetch=None``
+does not fetch, used by the status commands (i.e.: prompts)."""
+GIT_CONFIG_GLOBAL = {
+    "init.defaultBranch": "main",
+    "pull.rebase": "false",
+    "user.email": EMAIL,
+    "user.name": GIT,
+}
+
+
+@runtime_checkable
+class _SupportsWorkingDir(Protocol):
+    """Protocol Class to support Repo class."""
+
+    @property
+    def working_dir(self):
+        return
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitUrlRecord:
+    """Parsed Git URL record, shared by the :class:`GitUrl` instances with the same url.
+
+    Attributes are the :class:`GitUrl` attributes set when the url matches a platform pattern.
+    """
+    _user: str = ""
+    access_token: str = ""
+    branch: str = ""
+    domain: str = ""
+    groups_path: str = ""
+    owner: str = ""
+    ownerrepo: str = ""
+    path: str = ""
+    pathname: str = ""
+    path_raw: str = ""
+    platform: str = ""
+    port: str = ""
+    protocol: str = ""
+    repo: str = ""
+    url: str = ""
+    username: str = ""
+    protocols: tuple[str, ...] = ()
+    platform_obj: (
+            AssemblaPlatform | BasePlatform | BitbucketPlatform | FriendCodePlatform | GitHubPlatform | GitLabPlatform
+            | None
+    ) = None
+
+    def format(self, protocol: str) -> str:
+        """Reformat URL to protocol.
+
+        Raises:
+            KeyError: if the platform does not support the protocol.
+        """
+        return self.platform_obj.FORMATTERS[protocol](self)
+
+
+_GITURL_RECORD_ATTRS = tuple(k for k in GitUrlRecord.__slots__ if k not in ("platform_obj", "protocols"))
+"""Attributes of :class:`GitUrlRecord` set in :class:`GitUrl` as is."""
+
+
+def _giturl_parse(url: str) -> GitUrlRecord | None:
+    """Parse url with the first platform pattern that matches.
+
+    Raises:
+        InvalidArgumentError: if git+file does not have an absolute path.
+
+    Returns:
+        Parsed record or None if no pattern matches.
+    """
+    for name, plat, protocol, regex in dispatch(url):
+        # Match current regex against URL
+        if not (match := regex.match(url)):
+            # Skip if not matched
+            continue
+
+        # Skip if domain is bad
+        domain = match.group("domain")
+
+        if plat.DOMAINS and domain not in plat.DOMAINS:
+            continue
+        if plat.SKIP_DOMAINS and domain in plat.SKIP_DOMAINS:
+            continue
+
+        # add in platform defaults and matches as dictionary
+        parsed_info = {**plat.DEFAULTS, **plat.clean_data(match.groupdict(default=""))}
+
+        owner = f"{parsed_info['owner']}/" if parsed_info.get("owner") else ""
+
+        if protocol == "ssh" and "ssh" not in parsed_info["protocols"]:
+            parsed_info["protocols"].append(protocol)
+
+        if protocol == "file" and not domain.startswith("/"):
+            raise InvalidArgumentError(url)
+
+        return GitUrlRecord(**{
+            **parsed_info,
+            "url": url.removesuffix(".git")
+            if protocol != "file"
+            else url
+            if url.endswith(".git")
+            else f"{url}.git",
+            "platform": name,
+            "protocol": protocol,
+            "protocols": tuple(parsed_info["protocols"]),
+            "ownerrepo": f"{owner}{parsed_info['repo']}",
+            "platform_obj": plat,
+        })
+    return None
+
+
+@dataclasses.dataclass
+class GitUrl:
+    """Parsed Git URL Helper Class.
+
+    Attributes:
+        data: Url, path or user (to be used with name), default None for cwd. Does not have .git unless is git+file
+        repo: Repo name. If not None it will use data as the owner if not None, otherwise $GIT.
+
+    Examples:
+            >>> import nodeps
+            >>> from nodeps import GitUrl
+            >>> from nodeps import Path
+            >>> from nodeps import NODEPS_PROJECT_NAME, CI
+            >>> from nodeps import NODEPS_MODULE_PATH
+            >>>
+            >>> p = GitUrl()
+            >>> p1 = GitUrl(nodeps.__file__)
+            >>> p2 = GitUrl(repo=NODEPS_PROJECT_NAME)
+            >>> p.host, p.owner, p.repo, p.protocol, p.protocols, p.platform, p.pathname, p.ownerrepo
+            ('github.com', 'j5pu', 'nodeps', 'https', ['https'], 'github', '/j5pu/nodeps', 'j5pu/nodeps')
+            >>> assert p2.url == p1.url == p.url == "https://github.com/j5pu/nodeps"
+            >>> if not CI:
+            ...     assert NODEPS_MODULE_PATH == p1._path
+            >>>
+            >>> u = 'git@bitbucket.org:AaronO/some-repo.git'
+            >>> p = GitUrl(u)
+            >>> p.host, p.owner, p.repo, p.protocol, p.protocols, p.platform, p.pathname, p.ownerrepo
+            ('bitbucket.org', 'AaronO', 'some-repo', 'ssh', ['ssh'], 'bitbucket', 'AaronO/some-repo.git',\
+ 'AaronO/some-repo')
+            >>> assert p.normalized == u
+            >>> assert p.url == u.removesuffix(".git")
+            >>> assert p.ownerrepo == "AaronO/some-repo"
+            >>>
+            >>> u = "https://github.com/cpython/cpython"
+            >>> p = GitUrl(u)
+            >>> p.host, p.owner, p.repo, p.protocol, p.protocols, p.platform, p.pathname, p.ownerrepo
+            ('github.com', 'cpython', 'cpython', 'https', ['https'], 'github', '/cpython/cpython', 'cpython/cpython')
+            >>> assert p.normalized == u + ".git"
+            >>> assert p.url == u
+            >>>
+            >>> p1 = GitUrl(data="cpython", repo="cpython")
+            >>> assert p == p1
+            >>>
+            >>> u = "git+https://github.com/cpython/cpython"
+            >>> p = GitUrl(u)
+            >>> p.host, p.owner, p.repo, p.protocol, p.protocols, p.platform, p.pathname, p.ownerrepo
+            ('github.com', 'cpython', 'cpython', 'https', ['git', 'https'], 'github', '/cpython/cpython',\
+ 'cpython/cpython')
+            >>> p.normalized, p.url, p.url2githttps
+            ('https://github.com/cpython/cpython.git', 'git+https://github.com/cpython/cpython',\
+ 'git+https://github.com/cpython/cpython.git')
+            >>> assert p.normalized == u.removeprefix("git+") + ".git"
+            >>> assert p.url == u
+            >>> assert p.url2githttps == u + ".git"
+            >>>
+            >>> u = "git+ssh://git@github.com/cpython/cpython"
+            >>> p = GitUrl(u)
+            >>> p.host, p.owner, p.repo, p.protocol, p.protocols, p.platform, p.pathname, p.ownerrepo
+            ('github.com', 'cpython', 'cpython', 'ssh', ['git', 'ssh'], 'github', '/cpython/cpython', 'cpython/cpython')
+            >>> p.normalized, p.url, p.url2githttps
+            ('git@github.com:cpython/cpython.git', 'git+ssh://git@github.com/cpython/cpython',\
+ 'git+https://github.com/cpython/cpython.git')
+            >>> assert p.normalized == 'git@github.com:cpython/cpython.git'
+            >>> assert p.url == u
+            >>> assert p.url2gitssh == u + ".git"
+            >>>
+            >>> u = "git@github.com:cpython/cpython"
+            >>> p = GitUrl(u)
+            >>> p.host, p.owner, p.repo, p.protocol, p.protocols, p.platform, p.pathname, p.ownerrepo
+            ('github.com', 'cpython', 'cpython', 'ssh', ['ssh'], 'github', 'cpython/cpython', 'cpython/cpython')
+            >>> p.normalized, p.url, p.url2git
+            ('git@github.com:cpython/cpython.git', 'git@github.com:cpython/cpython',\
+ 'git://github.com/cpython/cpython.git')
+            >>> assert p.normalized == u + ".git"
+            >>> assert p.url == u
+            >>>
+            >>> u = "https://domain.com/cpython/cpython"
+            >>> p = GitUrl(u)
+            >>> p.host, p.owner, p.repo, p.protocol, p.protocols, p.platform, p.pathname, p.ownerrepo
+            ('domain.com', 'cpython', 'cpython', 'https', ['https'], 'gitlab', '/cpython/cpython', 'cpython/cpython')
+            >>> p.normalized, p.url, p.url2https
+            ('https://domain.com/cpython/cpython.git', 'https://domain.com/cpython/cpython',\
+ 'https://domain.com/cpython/cpython.git')
+            >>> assert p.normalized == u + ".git"
+            >>> assert p.url == u
+            >>>
+            >>> u = "git+https://domain.com/cpython/cpython"
+            >>> p = GitUrl(u)
+            >>> p.host, p.owner, p.repo, p.protocol, p.protocols, p.platform, p.pathname, p.ownerrepo
+            ('domain.com', 'cpython', 'cpython', 'https', ['git', 'https'], 'gitlab', '/cpython/cpython',\
+ 'cpython/cpython')
+            >>> p.normalized, p.url, p.url2githttps
+            ('https://domain.com/cpython/cpython.git', 'git+https://domain.com/cpython/cpython',\
+ 'git+https://domain.com/cpython/cpython.git')
+            >>> assert p.normalized == u.removeprefix("git+") + ".git"
+            >>> assert p.url == u
+            >>> assert p.url2githttps == u + ".git"
+            >>>
+            >>> u = "git+ssh://git@domain.com/cpython/cpython"
+            >>> p = GitUrl(u)
+            >>> p.host, p.owner, p.repo, p.protocol, p.protocols, p.platform, p.pathname, p.ownerrepo
+            ('domain.com', 'cpython', 'cpython', 'ssh', ['git', 'ssh'], 'gitlab', '/cpython/cpython', 'cpython/cpython')
+            >>> p.normalized, p.url, p.url2gitssh
+            ('git@domain.com:cpython/cpython.git', 'git+ssh://git@domain.com/cpython/cpython',\
+ 'git+ssh://git@domain.com/cpython/cpython.git')
+            >>> assert p.normalized == "git@domain.com:cpython/cpython.git"
+            >>> assert p.url == u
+            >>> assert p.url2gitssh == u + ".git"
+            >>>
+            >>> u = "git@domain.com:cpython/cpython"
+            >>> p = GitUrl(u)
+            >>> p.host, p.owner, p.repo, p.protocol, p.protocols, p.platform, p.pathname, p.ownerrepo
+            ('domain.com', 'cpython', 'cpython', 'ssh', ['ssh'], 'gitlab', 'cpython/cpython', 'cpython/cpython')
+            >>> p.normalized, p.url, p.url2ssh
+            ('git@domain.com:cpython/cpython.git', 'git@domain.com:cpython/cpython',\
+ 'git@domain.com:cpython/cpython.git')
+            >>> assert p.normalized == u + ".git"
+            >>> assert p.url == u
+            >>> assert p.url2ssh == u + ".git"
+            >>>
+            >>> u = "git+file:///tmp/cpython.git"
+            >>> p = GitUrl(u)
+            >>> p.host, p.owner, p.repo, p.protocol, p.protocols, p.platform, p.pathname, p.ownerrepo
+            ('/tmp', '', 'cpython', 'file', ['git', 'file'], 'base', '/cpython.git', 'cpython')
+            >>> p.normalized, p.url
+            ('git+file:///tmp/cpython.git', 'git+file:///tmp/cpython.git')
+            >>>
+            >>> p = GitUrl("git+file:///tmp/cpython")
+            >>> p.host, p.owner, p.repo, p.protocol, p.protocols, p.platform, p.pathname, p.ownerrepo
+            ('/tmp', '', 'cpython', 'file', ['git', 'file'], 'base', '/cpython', 'cpython')
+            >>> p.normalized, p.url
+            ('git+file:///tmp/cpython.git', 'git+file:///tmp/cpython.git')
+            >>> assert p.normalized == u
+            >>> assert p.url == u
+    """
+
+    data: dataclasses.InitVar[str | Path | _SupportsWorkingDir | None] = ""
+    """Url, path or user (to be used with name), default None for cwd. Does not have .git unless is git+file"""
+    repo: str = dataclasses.field(default="", hash=True)
+    """Repo name. If not None it will use data as the owner if not None, otherwise $GIT."""
+
+    _platform_obj: (
+            AssemblaPlatform | BasePlatform | BitbucketPlatform | FriendCodePlatform | GitHubPlatform | GitLabPlatform
+    ) = dataclasses.field(default_factory=lambda: PLATFORMS_INDEX["base"], init=False)
+    _path: Path | None = dataclasses.field(default=None, init=False)
+    """Path from __post_init__ method when path is provided in url argument."""
+    _user: str = dataclasses.field(default="", init=False)
+    access_token: str = dataclasses.field(default="", init=False)
+    branch: str = dataclasses.field(default="", init=False)
+    domain: str = dataclasses.field(default="", init=False)
+    groups_path: str = dataclasses.field(default="", init=False)
+    owner: str = dataclasses.field(default="", hash=True, init=False)
+    ownerrepo: str = dataclasses.field(default="", init=False)
+    path: str = dataclasses.field(default="", init=False)
+    pathname: str = dataclasses.field(default="", init=False)
+    path_raw: str = dataclasses.field(default="", init=False)
+    platform: str = dataclasses.field(default="", init=False)
+    protocol: str = dataclasses.field(default="", init=False)
+    protocols: list[str] = dataclasses.field(default_factory=list, init=False)
+    port: str = dataclasses.field(default="", init=False)
+    url: str | Path = dataclasses.field(default="", hash=True, init=False)
+    username: str = dataclasses.field(default="", init=False)
+    _formats: dict[str, tuple[tuple[str, ...], str]] = dataclasses.field(default_factory=dict, init=False,
+                                                                          repr=False, compare=False)
+    """Memo of :meth:`format` by protocol: attributes used in the url and url."""
+    api_repos_url: ClassVar[str] = f"{GITHUB_URL['api']}/repos"
+    parse: ClassVar[Callable[[str], GitUrlRecord | None]] = staticmethod(
+        functools.lru_cache(maxsize=GITURL_CACHE_SIZE)(_giturl_parse)
+    )
+    """Parse url, LRU cached by url (use ``GitUrl.parse.cache_info()`` for hits, misses and size)."""
+
+    def __post_init__(self, data: str | Path | _SupportsWorkingDir | None):  # noqa: PLR0912, PLR0915
+        """Post Init."""
+        if not isinstance(data, str | os.PathLike | None) and isinstance(data, _SupportsWorkingDir):
+            data = data.working_dir
+        self.url = "" if data is None else str(data)  # because of CLI g default Path is None
+        self._path = None
+
+        if self.repo:
+            self.url = f"https://github.com/{self.url or GIT}/{self.repo}"
+        elif not self.url:
+            self._path = Path.cwd().absolute()
+        elif (_path := Path(self.url)).exists():
+            if _path.installed():  # GitHub Action and docker is using the installed path.
+                if workspace := os.environ.get("GITHUB_WORKSPACE"):
+                    self._path = Path(workspace)
+                else:
+                    self._path = Path.cwd().absolute()
+            else:
+                self._path = _path.to_parent()
+        self.url = git_remote_url(self._path) if self._path else self.url
+
+        if self.url is None:
+            msg = f"Invalid argument: {data=}, {self.repo=}"
+            raise InvalidArgumentError(msg)
+
+        try:
+            record = self.parse(self.url)
+        except InvalidArgumentError:
+            msg = f"Invalid argument, git+file should have an absolute path: {data=}, {self.repo=}"
+            raise InvalidArgumentError(msg) from None
+
+        if record is not None:
+            for k in _GITURL_RECORD_ATTRS:
+                setattr(self, k, getattr(record, k))
+            self.protocols = list(record.protocols)
+            self._platform_obj = record.platform_obj
+
+        if not self.repo and self._path:
+            self.repo = self._path.name
+
+    @classmethod
+    def parse_many(cls, urls: Iterable[str]) -> dict[str, list[str | None]]:
+        """Parse urls in columns, without creating :class:`GitUrl` instances.
+
+        Urls are stripped and are not checked as paths. Rows which can not be parsed or are not valid
+        have the error message in the "error" column and None in the others.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>>
+            >>> rv = GitUrl.parse_many(["git@github.com:Org/Repo.git", "invalid", "https://gitlab.com/a/b/c\\n"])
+            >>> rv["owner"], rv["repo"], rv["platform"]
+            (['Org', None, 'a'], ['Repo', None, 'c'], ['github', None, 'gitlab'])
+            >>> rv["url2https"]
+            ['https://github.com/Org/Repo.git', None, 'https://gitlab.com/a/b/c.git']
+            >>> rv["error"]
+            [None, "Invalid url: 'invalid'", None]
+
+        Args:
+            urls: iterable of urls, i.e.: lines of a file
+
+        Returns:
+            Dictionary of column name and list of values, with a row for each url.
+        """
+        rewrites = {f"url2{protocol.replace('+', '')}": protocol for protocol in ("git", "git+https", "git+ssh",
+                                                                                "https", "ssh")}
+        rv = {key: [] for key in ("url", "host", "owner", "repo", "protocol", "platform", *rewrites, "error")}
+        for url in urls:
+            url = url.strip()
+            error = None
+            try:
+                record = cls.parse(url)
+            except InvalidArgumentError:
+                record, error = None, f"Invalid argument, git+file should have an absolute path: {url!r}"
+            if record is None or not (record.domain and record.repo):
+                record, error = None, error or f"Invalid url: {url!r}"
+            rv["url"].append(url)
+            rv["host"].append(record and record.domain)
+            rv["owner"].append(record and record.owner)
+            rv["repo"].append(record and record.repo)
+            rv["protocol"].append(record and record.protocol)
+            rv["platform"].append(record and record.platform)
+            for key, protocol in rewrites.items():
+                rv[key].append(
+                    record.format(protocol) if record and protocol in record.platform_obj.FORMATS else None
+                )
+            rv["error"].append(error)
+        return rv
+
+    def admin(self, user: str = GIT, rm: bool = False) -> bool:
+        """Check if user has admin permissions.
+
+        Examples:
+            >>> import nodeps
+            >>> from nodeps import GitUrl
+            >>> from nodeps import NODEPS_PROJECT_NAME
+            >>>
+            >>> assert GitUrl(nodeps.__file__).admin() is True
+            >>> assert GitUrl(nodeps.__file__).admin("foo") is False
+
+        Arguments:
+            user: default $GIT
+            rm: use pickle cache or remove it before
+
+        Returns:
+            bool
+        """
+        try:
+            return (
+                    urljson(f"{self.api_repos_url}/{self.ownerrepo}/collaborators/{user}/permission",
+                            rm=rm)["permission"]
+                    == "admin"
+            )
+        except urllib.error.HTTPError as err:
+            if err.code == 403 and err.reason == "Forbidden":  # noqa: PLR2004
+                return False
+            raise
+
+    def default(self, rm: bool = False) -> str:
+        """Default remote branch.
+
+        Examples:
+            >>> import nodeps
+            >>> from nodeps import GitUrl
+            >>>
+            >>> assert GitUrl(nodeps.__file__).default() == "main"
+
+        Args:
+            rm: remove cache
+
+        Returns:
+            bool
+        """
+        return self.github(rm=rm)["default_branch"]
+
+    def format(self, protocol):  # noqa: A003
+        """Reformat URL to protocol, memoized.
+
+        Urls are built with the platform ``FORMATTERS`` compiled from ``FORMATS``, and memoized by protocol
+        in the instance while the attributes used in the url (``FORMAT_KEYS``) do not change.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>>
+            >>> p = GitUrl("git@github.com:Org/Private-repo.git")
+            >>> p.format("https")
+            'https://github.com/Org/Private-repo.git'
+            >>> assert p.format("https") is p.url2https
+            >>> p.owner = "Other"
+            >>> p.url2https
+            'https://github.com/Other/Private-repo.git'
+
+        Raises:
+            KeyError: if the platform does not support the protocol.
+        """
+        key = self._platform_obj.FORMAT_KEYS[protocol](self)
+        if (memo := self._formats.get(protocol)) is None or memo[0] != key:
+            memo = self._formats[protocol] = key, self._platform_obj.FORMATTERS[protocol](self)
+        return memo[1]
+
+    def github(
+            self,
+            rm: bool = False,
+    ) -> dict[str, str | list | dict[str, str | list | dict[str, str | list]]]:
+        """GitHub repos api.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>> from nodeps import NODEPS_PROJECT_NAME
+            >>>
+            >>> assert GitUrl().github()["name"] == NODEPS_PROJECT_NAME
+
+        Returns:
+            dict: pypi information
+            rm: use pickle cache or remove it.
+        """
+        return urljson(f"{self.api_repos_url}/{self.ownerrepo}", rm=rm)
+
+    @classmethod
+    def github_many(
+            cls,
+            data: "Iterable[str | Path | _SupportsWorkingDir | GitUrl]",
+            user: str | None = GIT,
+            repos: bool = True,
+            rm: bool = False,
+            workers: int = GITHUB_WORKERS,
+    ) -> dict[str, dict[str, bool | str | Exception]]:
+        """GitHub metadata of many repositories with concurrent requests.
+
+        Fills the same cache as :meth:`admin`, :meth:`default`, :meth:`github` and :meth:`public`,
+        so they do not request again. Repositories are requested once by owner and repo,
+        and cached responses are not requested unless ``rm``.
+
+        Examples:
+            >>> import nodeps
+            >>> from nodeps import GitUrl
+            >>>
+            >>> rv = GitUrl.github_many([nodeps.__file__, "https://github.com/octocat/Hello-World"])
+            >>> assert rv["octocat/Hello-World"]["public"] is True  # doctest: +SKIP
+
+        Args:
+            data: urls, paths or :class:`GitUrl` instances
+            user: user to check admin permission, None to not request permissions (default: $GIT)
+            repos: request repos api for default branch and visibility
+            rm: remove cache
+            workers: maximum number of concurrent requests (default: :data:`GITHUB_WORKERS`)
+
+        Returns:
+            Dictionary of owner/repo and dictionary with "admin", "default" and "public" values requested,
+            or "error" with the exception raised by the request.
+        """
+        items = {}
+        for item in data:
+            item = item if isinstance(item, GitUrl) else cls(item)
+            items.setdefault(item.ownerrepo, item)
+
+        urls = [url for ownerrepo in items for url in (
+            *([f"{cls.api_repos_url}/{ownerrepo}"] if repos else []),
+            *([f"{cls.api_repos_url}/{ownerrepo}/collaborators/{user}/permission"] if user else []),
+        )]
+        responses = dict(zip(urls, urljson_many(urls, rm=rm, workers=workers), strict=True))
+
+        rv = {}
+        for ownerrepo in items:
+            rv[ownerrepo] = value = {}
+            try:
+                if repos:
+                    if isinstance(github := responses[f"{cls.api_repos_url}/{ownerrepo}"], Exception):
+                        raise github
+                    value |= {"default": github["default_branch"], "public": github["visibility"] == "public"}
+                if user:
+                    permission = responses[f"{cls.api_repos_url}/{ownerrepo}/collaborators/{user}/permission"]
+                    if isinstance(permission, urllib.error.HTTPError) and permission.code == 403 \
+                            and permission.reason == "Forbidden":  # noqa: PLR2004
+                        value["admin"] = False
+                    elif isinstance(permission, Exception):
+                        raise permission
+                    else:
+                        value["admin"] = permission["permission"] == "admin"
+            except (OSError, KeyError, ValueError) as exception:
+                value.clear()
+                value["error"] = exception
+        return rv
+
+    @property
+    def groups(self):
+        """List of groups. GitLab only."""
+        if self.groups_path:
+            return self.groups_path.split("/")
+        return []
+
+    @property
+    def host(self):
+        """Alias property for domain."""
+        return self.domain
+
+    @property
+    def is_github(self):
+        """GitHub platform."""
+        return self.platform == "github"
+
+    @property
+    def is_bitbucket(self):
+        """BitBucket platform."""
+        return self.platform == "bitbucket"
+
+    @property
+    def is_friendcode(self):
+        """FriendCode platform."""
+        return self.platform == "friendcode"
+
+    @property
+    def is_assembla(self):
+        """Assembla platform."""
+        return self.platform == "assembla"
+
+    @property
+    def is_gitlab(self):
+        """GitLab platform."""
+        return self.platform == "gitlab"
+
+    @property
+    def name(self):
+        """Alias property for repo."""
+        return self.repo
+
+    @property
+    def normalized(self):
+        """Normalize URL with .git."""
+        return self.format(self.protocol)
+
+    def public(self, rm: bool = False) -> bool:
+        """Check if repo ius public.
+
+        Examples:
+            >>> import nodeps
+            >>> from nodeps import GitUrl
+            >>>
+            >>> assert GitUrl(nodeps.__file__).public() is True
+            >>> assert GitUrl(repo="pdf").public() is False
+
+        Args:
+            rm: remove cache
+
+        Returns:
+            bool
+        """
+        return self.github(rm=rm)["visibility"] == "public"
+
+    @property
+    def resource(self):
+        """Alias property for domain."""
+        return self.domain
+
+    @property
+    def url2git(self):
+        """Rewrite url to git.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>>
+            >>> url = 'git@github.com:Org/Private-repo.git'
+            >>> p = GitUrl(url)
+            >>> p.url2git
+            'git://github.com/Org/Private-repo.git'
+        """
+        return self.format("git")
+
+    @property
+    def url2githttps(self):
+        """Rewrite url to git.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>>
+            >>> url = 'git@github.com:Org/Private-repo.git'
+            >>> p = GitUrl(url)
+            >>> p.url2githttps
+            'git+https://github.com/Org/Private-repo.git'
+        """
+        return self.format("git+https")
+
+    @property
+    def url2gitssh(self):
+        """Rewrite url to git.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>>
+            >>> url = 'git@github.com:Org/Private-repo.git'
+            >>> p = GitUrl(url)
+            >>> p.url2gitssh
+            'git+ssh://git@github.com/Org/Private-repo.git'
+        """
+        return self.format("git+ssh")
+
+    @property
+    def url2https(self):
+        """Rewrite url to https.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>>
+            >>> url = 'git@github.com:Org/Private-repo.git'
+            >>> p = GitUrl(url)
+            >>> p.url2https
+            'https://github.com/Org/Private-repo.git'
+        """
+        return self.format("https")
+
+    @property
+    def url2ssh(self):
+        """Rewrite url to ssh.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>>
+            >>> url = 'git@github.com:Org/Private-repo.git'
+            >>> p = GitUrl(url)
+            >>> p.url2ssh
+            'git@github.com:Org/Private-repo.git'
+        """
+        return self.format("ssh")
+
+    @property
+    def urls(self):
+        """All supported urls for a repo.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>> url = 'git@github.com:Org/Private-repo.git'
+            >>>
+            >>> GitUrl(url).urls
+            {'git': 'git://github.com/Org/Private-repo.git',\
+ 'git+https': 'git+https://github.com/Org/Private-repo.git',\
+ 'git+ssh': 'git+ssh://git@github.com/Org/Private-repo.git',\
+ 'https': 'https://github.com/Org/Private-repo.git',\
+ 'ssh': 'git@github.com:Org/Private-repo.git'}
+        """
+        return {protocol: self.format(protocol) for protocol in self._platform_obj.PROTOCOLS}
+
+    @property
+    def user(self):
+        """Alias property for _user or owner. _user == "git for ssh."""
+        if hasattr(self, "_user"):
+            return self._user
+
+        return self.owner
+
+    @property
+    def valid(self):
+        """Checks if url is valid.
+
+        It is equivalent to :meth:`validate`.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>>
+            >>> url = 'git@github.com:Org/Private-repo.git'
+            >>> GitUrl(url).valid
+            True
+            >>> GitUrl.validate(url)
+            True
+
+        """
+        return all(
+            [
+                all(
+                    getattr(self, attr, None)
+                    for attr in (
+                        "domain",
+                        "repo",
+                    )
+                ),
+            ]
+        )
+
+    @classmethod
+    def validate(cls, data: str | Path | None = None, repo: str | None = None):
+        """Validate url.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>>
+            >>> u = 'git@bitbucket.org:AaronO/some-repo.git'
+            >>> p = GitUrl(u)
+            >>> p.host, p.owner, p.repo
+            ('bitbucket.org', 'AaronO', 'some-repo')
+            >>> assert p.valid is True
+            >>> assert GitUrl.validate(u) is True
+
+        Args:
+            data: user (when repo is provided, default GIT), url,
+                path to get from git config if exists, default None for cwd.
+            repo: repo to parse url from repo and get user from data
+        """
+        return cls(data=data, repo=repo).valid
+
+
+def _git_status(ahead: int, behind: int, dirty: bool, local: str, upstream: str, remote: str,
+                base: str = "") -> GitStatus:
+    """Git status instance from :meth:`Gh._porcelain` and the merge-base if diverged."""
+    if not upstream:
+        return GitStatus(dirty=dirty, local=local, push=bool(local))
+    if ahead and behind:
+        return GitStatus(base=base, dirty=dirty, diverge=True, local=local, pull=True, push=True, remote=remote)
+    if behind:
+        return GitStatus(base=local, dirty=dirty, diverge=dirty, local=local, pull=True, remote=remote)
+    if ahead:
+        return GitStatus(base=remote, dirty=dirty, local=local, push=True, remote=remote)
+    return GitStatus(dirty=dirty, local=local, remote=remote)
+
+
+@dataclasses.dataclass
+class Gh(GitUrl):
+    """Git Repo Class.
+
+    Examples:
+        >>> import os
+        >>> import pytest
+        >>> import nodeps
+        >>> from nodeps import Gh
+        >>>
+        >>> r = Gh()
+        >>> r.url # doctest: +ELLIPSIS
+        'https://github.com/.../nodeps'
+
+    Args:
+        owner: repo owner or Path
+        repo: repo name or repo path for git+file scheme (default: None)
+
+    Raises:
+        InvalidArgumentError: if GitUrl is not initialized with path
+    """
+
+    def __post_init__(self, data: str | Path | _SupportsWorkingDir | None = None):
+        """Post Init."""
+        super().__post_init__(data=data)
+        if not self._path:
+            msg = f"Path must be provided when initializing {self.__class__.__name__}: {data=}, {self.repo=}"
+            raise InvalidArgumentError(msg)
+
+        self.git = f"git -C '{self._path}'"
+        self.log = ColorLogger.logger(self.__class__.__qualname__)
+
+        git_config_global()
+
+    def _fetch(self, fetch: bool | None) -> bool:
+        """Fetch is needed: ``fetch`` or, if None, not fetched in the last :data:`GIT_FETCH_TTL` seconds."""
+        if fetch is None:
+            fetch = True
+            if gitdir := git_dir(self._path):
+                with contextlib.suppress(FileNotFoundError):
+                    fetch = time.time() - (gitdir[0] / "FETCH_HEAD").stat().st_mtime > GIT_FETCH_TTL
+        return fetch
+
+    def _porcelain(self, out: str) -> tuple[int, int, bool, str, str, str | None]:
+        """Ahead, behind, dirty, local SHA, upstream and upstream SHA from ``git status --porcelain=v2 --branch``.
+
+        Upstream SHA is read from the refs files (see :func:`nodeps.git_ref`), None if it can not be read.
+        """
+        ahead = behind = 0
+        dirty = False
+        local = upstream = ""
+        for line in out.splitlines():
+            if not line.startswith("# "):
+                dirty = True
+            elif line.startswith("# branch.oid "):
+                local = "" if (oid := line[len("# branch.oid "):]) == "(initial)" else oid
+            elif line.startswith("# branch.upstream "):
+                upstream = line[len("# branch.upstream "):]
+            elif line.startswith("# branch.ab "):
+                a, b = line[len("# branch.ab "):].split()
+                ahead, behind = int(a), -int(b)
+
+        if not upstream or (not ahead and not behind):
+            return ahead, behind, dirty, local, upstream, local
+        return ahead, behind, dirty, local, upstream, next(
+            (sha for ref in (f"refs/{upstream}", f"refs/tags/{upstream}", f"refs/heads/{upstream}",
+                             f"refs/remotes/{upstream}") if (sha := git_ref(self._path, ref))),
+            None,
+        )
+
+    def info(self, msg: str):
+        """Logger info."""
+        self.log.info(msg, extra={"extra": self.repo})
+
+    def warning(self, msg: str):
+        """Logger warning."""
+        self.log.warning(msg, extra={"extra": self.repo})
+
+    async def aiocommit(self, msg: str | None = None, force: bool = False, quiet: bool = True,
+                        fetch: bool | None = True) -> None:
+        """Async :meth:`commit`.
+
+        Raises:
+            CmdError: if git fails
+            RuntimeError: if diverged or dirty
+        """
+        status = await self.aiostatus(quiet=quiet, fetch=fetch)
+        if status.dirty:
+            if status.diverge and not force:
+                msg = f"Diverged: {status=}, {self.repo=}"
+                raise RuntimeError(msg)
+            if msg is None or msg == "":
+                msg = "fix: "
+            await self.aiogit("add", "-A")
+            await self.aiogit("commit", "-a", "--quiet" if quiet else "", "-m", msg)
+            self.info(self.commit.__name__)
+
+    async def aiocurrent(self) -> str:
+        """Async :meth:`current`, the branch is read from the HEAD file (see :func:`nodeps.git_branch`)."""
+        return self.current()
+
+    async def aiogit(self, *args: str) -> str:
+        """Async runs git command in the repository and returns stdout (empty args are ignored).
+
+        Examples:
+            >>> import asyncio
+            >>> from nodeps import Gh
+            >>>
+            >>> assert asyncio.run(Gh().aiogit("rev-parse", "--abbrev-ref", "HEAD")) == "main"
+
+        Raises:
+            CmdError: if git fails
+        """
+        p = await aiocmd("git", "-C", str(self._path), *filter(None, args))
+        return p.stdout.rstrip("\n") if p.stdout else ""
+
+    async def aiolatest(self) -> str:
+        """Async :meth:`latest`."""
+        latest = tags[-1] if (tags := git_tags(self._path)) else ""
+        if not latest:
+            latest = "0.0.0"
+            await self.aiocommit(msg=f"{self.latest.__name__}: {latest}", fetch=False)
+            await self._aiotag(latest)
+        return latest
+
+    async def aiopull(self, force: bool = False, quiet: bool = True, fetch: bool | None = True) -> None:
+        """Async :meth:`pull`.
+
+        Raises:
+            CmdError: if pull fails
+            RuntimeError: if diverged or dirty
+        """
+        status = await self.aiostatus(quiet=quiet, fetch=fetch)
+        if status.diverge and not force:
+            msg = f"Diverged: {status=}, {self.repo=}"
+            raise RuntimeError(msg)
+        if status.pull:
+            await self.aiogit("pull", "--force" if force else "", "--quiet" if quiet else "")
+            self.info(self.pull.__name__)
+
+    async def aiopush(self, force: bool = False, quiet: bool = True, fetch: bool | None = True) -> None:
+        """Async :meth:`push`.
+
+        Raises:
+            CmdError: if push fails
+            RuntimeError: if diverged
+        """
+        await self.aiocommit(force=force, quiet=quiet, fetch=fetch)
+        status = await self.aiostatus(quiet=quiet, fetch=False)
+        if status.push:
+            if status.pull and not force:
+                msg = f"Diverged: {status=}, {self.repo=}"
+                raise RuntimeError(msg)
+            await self.aiogit("push", "--force" if force else "", "--quiet" if quiet else "")
+            self.info(self.push.__name__)
+
+    async def aiostatus(self, quiet: bool = True, fetch: bool | None = True) -> GitStatus:
+        """Async :meth:`status`.
+
+        Examples:
+            >>> import asyncio
+            >>> from nodeps import Gh
+            >>>
+            >>> assert asyncio.run(Gh().aiostatus(fetch=False)) == Gh().status(fetch=False)
+        """
+        if self._fetch(fetch):
+            await self.aiogit("fetch", "--all", "--tags", "--prune", "--quiet" if quiet else "")
+        try:
+            out = await self.aiogit("status", "--porcelain=v2", "--branch")
+        except CmdError:
+            return GitStatus()
+        ahead, behind, dirty, local, upstream, remote = self._porcelain(out)
+        base = ""
+        if remote is None:
+            with contextlib.suppress(CmdError):
+                remote = await self.aiogit("rev-parse", "@{u}")
+        if upstream and ahead and behind:
+            with contextlib.suppress(CmdError):
+                base = await self.aiogit("merge-base", "@", "@{u}")
+        return _git_status(ahead, behind, dirty, local, upstream, remote or "", base)
+
+    async def aiosync(self) -> None:
+        """Async :meth:`sync`."""
+        await self.aiopush()
+        await self.aiopull(fetch=False)
+
+    async def _aiotag(self, tag: str, quiet: bool = True) -> None:
+        await self.aiogit("tag", tag)
+        await self.aiogit("push", "origin", tag, "--quiet" if quiet else "")
+        self.info(f"{self.tag.__name__}: {tag}")
+
+    async def aiotag(self, tag: str, quiet: bool = True) -> str | None:
+        """Async :meth:`tag`."""
+        if await self.aiolatest() == tag:
+            self.warning(f"{self.tag.__name__}: {tag} -> nothing to do")
+            return
+        await self._aiotag(tag, quiet=quiet)
+
+    def commit(self, msg: str | None = None, force: bool = False, quiet: bool = True,
+               fetch: bool | None = True) -> None:
+        """commit.
+
+        Args:
+            msg: commit message
+            force: commit if diverged
+            quiet: quiet
+            fetch: fetch before status, if None only if not fetched in the last :data:`GIT_FETCH_TTL` seconds
+
+        Raises:
+            CalledProcessError: if  fails
+            RuntimeError: if diverged or dirty
+        """
+        status = self.status(quiet=quiet, fetch=fetch)
+        # print(status, file=sys.stderr)
+        if status.dirty:
+            if status.diverge and not force:
+                msg = f"Diverged: {status=}, {self.repo=}"
+                raise RuntimeError(msg)
+            if msg is None or msg == "":
+                msg = "fix: "
+            self.git_check_call("add -A")
+            self.git_check_call(f"commit -a {'--quiet' if quiet else ''} -m '{msg}'")
+            self.info(self.commit.__name__)
+
+    def config_add(self, key: str, value: str) -> None:
+        """Add key and value to git repository config if not set."""
+        if subprocess.run(f"{self.git} config {key}", capture_output=True, shell=True).returncode != 0:
+            self.git_check_call(f"config {key} {value}")
+
+    def current(self) -> str:
+        """Current branch.
+
+        Examples:
+            >>> from nodeps import Gh
+            >>>
+            >>> assert Gh().current() == 'main'
+        """
+        return git_branch(self._path) or ""
+
+    def gh_check_call(self, line: str):
+        """Runs git command and raises exception if error (stdout is not captured and shown).
+
+        Examples:
+            >>> from nodeps import Gh
+            >>>
+            >>> assert Gh().gh_check_call("repo view") == 0  # doctest: +SKIP
+        """
+        return subprocess.check_call(f"gh {line}", shell=True, cwd=self._path)
+
+    def gh_stdout(self, line: str):
+        """Runs git command and returns stdout.
+
+        Examples:
+            >>> from nodeps import Gh
+            >>> from nodeps import NODEPS_PROJECT_NAME
+            >>>
+            >>> assert NODEPS_PROJECT_NAME in Gh().gh_stdout("repo view")  # doctest: +SKIP
+        """
+        return stdout(f"gh {line}", cwd=self._path)
+
+    def git_check_call(self, line: str):
+        """Runs git command and raises exception if error (stdout is not captured and shown).
+
+        Examples:
+            >>> from nodeps import Gh
+            >>>
+            >>> assert Gh().git_check_call("rev-parse --abbrev-ref HEAD") == 0
+
+        """
+        return subprocess.check_call(f"{self.git} {line}", shell=True)
+
+    def git_stdout(self, line: str):
+        """Runs git command and returns stdout.
+
+        Examples:
+            >>> from nodeps import Gh
+            >>>
+            >>> assert Gh().git_stdout("rev-parse --abbrev-ref HEAD") == "main"
+        """
+        return stdout(f"{self.git} {line}")
+
+    def latest(self) -> str:
+        """Latest tag in version order (see :func:`nodeps.git_tags`), creates and pushes 0.0.0 if no tags."""
+        latest = tags[-1] if (tags := git_tags(self._path)) else ""
+        if not latest:
+            latest = "0.0.0"
+            self.commit(msg=f"{self.latest.__name__}: {latest}", fetch=False)
+            self._tag(latest)
+        return latest
+
+    def _next(self, part: Bump = Bump.PATCH) -> str:
+        latest = self.latest()
+        v = "v" if latest.startswith("v") else ""
+        version = latest.replace(v, "").split(".")
+        match part:
+            case Bump.MAJOR:
+                index = 0
+            case Bump.MINOR:
+                index = 1
+            case _:
+                index = 2
+        version[index] = str(int(version[index]) + 1)
+        return f"{v}{'.'.join(version)}"
+
+    def next(self, part: Bump = Bump.PATCH, force: bool = False) -> str:  # noqa: A003
+        """Show next version based on fix: feat: or BREAKING CHANGE:.
+
+        Args:
+            part: part to increase if force
+            force: force bump
+        """
+        latest = self.latest()
+        out = self.git_stdout(f"log --pretty=format:'%s' {latest}..@")
+        if force:
+            return self._next(part)
+        if out:
+            if "breaking change:" in out.lower():
+                return self._next(Bump.MAJOR)
+            if "feat:" in out.lower():
+                return self._next(Bump.MINOR)
+            if "fix:" in out.lower():
+                return self._next()
+        return latest
+
+    def pull(self, force: bool = False, quiet: bool = True, fetch: bool | None = True) -> None:
+        """pull.
+
+        Args:
+            force: pull if diverged
+            quiet: quiet
+            fetch: fetch before status, if None only if not fetched in the last :data:`GIT_FETCH_TTL` seconds
+
+        Raises:
+            CalledProcessError: if pull fails
+            RuntimeError: if diverged or dirty
+        """
+        status = self.status(quiet=quiet, fetch=fetch)
+        if status.diverge and not force:
+            msg = f"Diverged: {status=}, {self.repo=}"
+            raise RuntimeError(msg)
+        if status.pull:
+            self.git_check_call(f"pull {'--force' if force else ''} {'--quiet' if quiet else ''}")
+            self.info(self.pull.__name__)
+
+    def push(self, force: bool = False, quiet: bool = True, fetch: bool | None = True) -> None:
+        """push.
+
+        Args:
+            force: push if diverged
+            quiet: quiet
+            fetch: fetch before status, if None only if not fetched in the last :data:`GIT_FETCH_TTL` seconds
+
+        Raises:
+            CalledProcessError: if push fails
+            RuntimeError: if diverged
+        """
+        self.commit(force=force, quiet=quiet, fetch=fetch)
+        status = self.status(quiet=quiet, fetch=False)
+        if status.push:
+            if status.pull and not force:
+                msg = f"Diverged: {status=}, {self.repo=}"
+                raise RuntimeError(msg)
+            self.git_check_call(f"push {'--force' if force else ''} {'--quiet' if quiet else ''}")
+            self.info(self.push.__name__)
+
+    def secrets(self, force: bool = False) -> int:
+        """Update GitHub repository secrets."""
+        if CI or constants.DOCKER:
+            return 0
+        if not self.secrets_names() or force:
+            self.gh_check_call(f"secret set GH_TOKEN --body {GITHUB_TOKEN}")
+            if (secrets := Path.home() / "secrets/profile.d/secrets.sh").is_file():
+                with tempfile.NamedTemporaryFile() as tmp:
+                    subprocess.check_call(
+                        f"grep -v GITHUB_ {secrets} > {tmp.name} && cd {self._path} && gh secret set -f {tmp.name}",
+                        shell=True,
+                    )
+                    self.info(self.secrets.__name__)
+        return 0
+
+    def secrets_names(self) -> list[str]:
+        """List GitHub repository secrets names."""
+        if rv := self.gh_stdout("secret list --jq .[].name  --json name"):
+            return rv.splitlines()
+        return []
+
+    def status(self, quiet: bool = True, fetch: bool | None = True) -> GitStatus:
+        """Git status instance from a single ``git status --porcelain=v2 --branch``, after fetch if ``fetch``.
+
+        Pull, push and diverge are from the ahead and behind counts. The upstream SHA is read from the refs files
+        (see :func:`nodeps.git_ref`), and ``merge-base`` only runs if the branch diverged.
+        A branch without upstream needs push.
+
+        Examples:
+            >>> from nodeps import Gh
+            >>>
+            >>> assert Gh().status(fetch=False).local == Gh().git_stdout("rev-parse @")
+
+        Args:
+            quiet: fetch quiet
+            fetch: fetch all remotes, tags and prune before if True (default), never if False, and if None
+                only if not fetched in the last :data:`GIT_FETCH_TTL` seconds (i.e.: prompts).
+        """
+        if self._fetch(fetch):
+            self.git_check_call(f"fetch --all --tags --prune {'--quiet' if quiet else ''}")
+        p = subprocess.run(["git", "-C", str(self._path), "status", "--porcelain=v2", "--branch"],
+                           capture_output=True, text=True)
+        if p.returncode != 0:
+            return GitStatus()
+        ahead, behind, dirty, local, upstream, remote = self._porcelain(p.stdout)
+        if remote is None:
+            remote = self.git_stdout("rev-parse @{u}") or ""
+        base = (self.git_stdout("merge-base @ @{u}") or "") if upstream and ahead and behind else ""
+        return _git_status(ahead, behind, dirty, local, upstream, remote, base)
+
+    def superproject(self) -> Path | None:
+        """Superproject top if submodule, otherwise top (see :func:`nodeps.git_superproject`)."""
+        return git_superproject(self._path) or self.top()
+
+    def _tag(self, tag: str, quiet: bool = True) -> None:
+        self.git_check_call(f"tag {tag}")
+        self.git_check_call(f"push origin {tag} {'--quiet' if quiet else ''}")
+        self.info(f"{self.tag.__name__}: {tag}")
+
+    def tag(self, tag: str, quiet: bool = True) -> str | None:
+        """Git tag."""
+        if self.latest() == tag:
+            self.warning(f"{self.tag.__name__}: {tag} -> nothing to do")
+            return
+        self._tag(tag, quiet=quiet)
+
+    def sync(self):
+        """Sync repository, fetching once."""
+        self.push()
+        self.pull(fetch=False)
+
+    def top(self) -> Path | None:
+        """Worktree top (see :func:`nodeps.git_top`)."""
+        return git_top(self._path)
+
+
+async def aiogh(
+        data: Iterable[str | Path | _SupportsWorkingDir | Gh],
+        method: str = "status",
+        *args,
+        limit: int = AIOGH_LIMIT,
+        **kwargs,
+) -> list:
+    """Async runs a :class:`Gh` async method in many repositories, at most ``limit`` at the same time.
+
+    Examples:
+        >>> import asyncio
+        >>> from nodeps import Gh, aiogh
+        >>>
+        >>> assert asyncio.run(aiogh([Gh()], "aiocurrent")) == ["main"]
+        >>> assert asyncio.run(aiogh(["/tmp"], "status"))[0].__class__.__name__ == "InvalidArgumentError"
+
+    Args:
+        data: repositories paths or :class:`Gh` instances
+        method: :class:`Gh` async method name, with or without the "aio" prefix (default: "status")
+        *args: method args
+        limit: maximum number of repositories running at the same time (default: :data:`AIOGH_LIMIT`)
+        **kwargs: method kwargs
+
+    Returns:
+        Results in the same order as ``data``, or the exception raised for the repository.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    method = method if method.startswith("aio") else f"aio{method}"
+
+    async def run(item):
+        async with semaphore:
+            return await getattr(item if isinstance(item, Gh) else Gh(item), method)(*args, **kwargs)
+
+    return await asyncio.gather(*[run(item) for item in data], return_exceptions=True)
+
+
+async def aiogh_sync(
+        data: Iterable[str | Path | _SupportsWorkingDir | Gh],
+        limit: int = AIOGH_LIMIT,
+        progress: Callable[[int, int, GitSync], None] | None = None,
+) -> list[GitSync]:
+    """Async sync (push and pull) many repositories, at most ``limit`` at the same time.
+
+    Each repository is fetched once, diverged repositories are not synced,
+    and an exception is reported in its result without stopping the rest.
+
+    Examples:
+        >>> import asyncio
+        >>> from nodeps import aiogh_sync
+        >>>
+        >>> rv = asyncio.run(aiogh_sync(["/tmp"]))
+        >>> assert rv[0].error.startswith("InvalidArgumentError")
+
+    Args:
+        data: repositories paths or :class:`Gh` instances
+        limit: maximum number of repositories running at the same time (default: :data:`AIOGH_LIMIT`)
+        progress: called with the number of repositories done, total and result when a repository is done
+
+    Returns:
+        Results in the same order as ``data``.
+    """
+    data = list(data)
+    semaphore = asyncio.Semaphore(limit)
+    done = 0
+
+    async def run(item):
+        nonlocal done
+        async with semaphore:
+            start = time.perf_counter()
+            rv = GitSync(name=item.repo if isinstance(item, Gh) else os.path.basename(
+                getattr(item, "working_dir", item)))
+            try:
+                gh = item if isinstance(item, Gh) else Gh(item)
+                status = await gh.aiostatus(fetch=True)
+                if status.diverge:
+                    rv.diverged = True
+                else:
+                    if status.dirty or status.push:
+                        await gh.aiopush(fetch=False)
+                        rv.pushed = True
+                    if status.pull:
+                        await gh.aiopull(fetch=False)
+                        rv.pulled = True
+            except Exception as exception:  # noqa: BLE001
+                rv.error = f"{exception.__class__.__name__}: {exception}".strip()
+            rv.skipped = not (rv.pulled or rv.pushed or rv.diverged or rv.error)
+            rv.duration = time.perf_counter() - start
+        done += 1
+        if progress:
+            progress(done, len(data), rv)
+        return rv
+
+    return await asyncio.gather(*[run(item) for item in data])
+
+
+async def aioclone(
+        owner: str | None = None,
+        repository: str = NODEPS_PROJECT_NAME,
+        path: Path | str | None = None,
+) -> Path:
+    """Async Clone Repository.
+
+    Examples:
+        >>> import asyncio
+        >>> from nodeps import Path
+        >>> from nodeps import aioclone
+        >>>
+        >>> with Path.tempdir() as tmp:
+        ...     directory = tmp / "1" / "2" / "3"
+        ...     rv = asyncio.run(aioclone("octocat", "Hello-World", path=directory))
+        ...     assert (rv / "README").exists()
+
+    Args:
+        owner: github owner, None to use GIT or USER environment variable if not defined (Default: `GIT`)
+        repository: github repository (Default: `PROJECT`)
+        path: path to clone (Default: `repo`)
+
+    Returns:
+        Path of cloned repository
+    """
+    path = path or Path.cwd() / repository
+    path = Path(path)
+    if not path.exists():
+        if not path.parent.exists():
+            path.parent.mkdir()
+        await aiocmd("git", "clone", GitUrl(owner, repository).url, path)
+    return path
+
+
+def clone(
+        owner: str | None = None,
+        repository: str = NODEPS_PROJECT_NAME,
+        path: Path | str = None,
+) -> Path:
+    """Clone Repository.
+
+    Examples:
+        >>> import os
+        >>> from nodeps import Path
+        >>> from nodeps import clone
+        >>>
+        >>> with Path.tempdir() as tmp:
+        ...     directory = tmp / "1" / "2" / "3"
+        >>> if not os.environ.get("CI"):
+        ...     rv = clone("octocat", "Hello-World", directory)
+        ...     assert (rv / "README").exists()
+
+    Args:
+        owner: github owner, None to use GIT or USER environment variable if not defined (Default: `GIT`)
+        repository: github repository (Default: `PROJECT`)
+        path: path to clone (Default: `repo`)
+
+    Returns:
+        CompletedProcess
+    """
+    path = path or Path.cwd() / repository
+    path = Path(path)
+    if not path.exists():
+        if not path.parent.exists():
+            path.parent.mkdir()
+        cmd("git", "clone", GitUrl(owner, repository).url, path)
+    return path
+
+
+def git_config_global():
+    """Sets values in git global config if not set.
+
+    The global config is read natively (see :func:`nodeps.git_global_config`), so git only runs to set
+    missing values, or for each key if the global config can not be parsed.
+    Files are parsed once per process and re-read when modified, :func:`nodeps.git_config_cache_clear`
+    clears the memo.
+
+    Examples:
+        >>> from nodeps import GIT_CONFIG_GLOBAL, git_config_global, git_global_config
+        >>>
+        >>> git_config_global()
+        >>> assert (config := git_global_config()) is None or all(key.lower() in config for key in GIT_CONFIG_GLOBAL)
+    """
+    config = git_global_config()
+    for key, value in GIT_CONFIG_GLOBAL.items():
+        if config is not None:
+            if key.lower() in config:
+                continue
+        elif subprocess.run(f"git config --global {key}", capture_output=True, shell=True).returncode == 0:
+            continue
+        subprocess.check_call(f"git config --global {key} {value}", shell=True)
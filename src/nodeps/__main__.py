@@ -1,42 +1,100 @@
 """CLI for nodeps."""
 
+import contextlib
 import copy
 import dataclasses
+import json
+import os
 import pathlib
+import subprocess
 import sys
-from typing import Annotated
-
-from .ipython_dir.profile_default.ipython_config import ipy
-from .ipython_variables import IPYTHONDIR, PYTHONSTARTUP
-from .modules import (
+import time
+from typing import Annotated, Optional
+
+from . import modules
+from .modules.constants import (
+    AIOGH_LIMIT,
+    BENCHMARK_BUDGETS,
+    CACHE_BENCHMARK_NUMBER,
+    DAEMON_SOCKET,
     GIT,
     GITHUB_URL,
+    GITURL_BENCHMARK_SIZE,
     NODEPS_EXECUTABLE,
     NODEPS_PROJECT_NAME,
     PYTHON_DEFAULT_VERSION,
     PYTHON_VERSIONS,
-    Bump,
-    Gh,
-    GitUrl,
-    Project,
-    ProjectRepos,
-    dict_sort,
-    mip,
-    pipmetapathfinder,
 )
+from .modules.enums import Bump, ProjectRepos
+from .modules.metapath import pipmetapathfinder
 
 with pipmetapathfinder():
     import typer.completion
 
 
+_COMPLETIONS_TTL = 3600
+"""Seconds after which the completions index is refreshed in the background."""
+
+
+def _completions_file() -> pathlib.Path:
+    return pathlib.Path("~/.pickle/completions.json").expanduser()
+
+
+def _completions_refresh(repos: list[str] | None = None) -> dict[str, list[str]]:
+    """Writes the completions index: repos names, schemes and python versions.
+
+    Called by the ``repos`` and ``completions`` commands with the repos names, and in the background by
+    :func:`_completions_index` to scan the repos when the index is stale.
+    """
+    if repos is None:
+        repos = modules.Project.repos(ProjectRepos.NAMES, rm=True) or []
+    index = {
+        "repos": repos,
+        "scheme": list(GITHUB_URL)[1:],
+        "versions": list(PYTHON_VERSIONS),
+    }
+    file = _completions_file()
+    file.parent.mkdir(exist_ok=True)
+    tmp = file.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(index))
+    tmp.replace(file)
+    file.with_suffix(".refresh").unlink(missing_ok=True)
+    return index
+
+
+def _completions_index(key: str, default: list[str] | tuple[str, ...] = ()) -> list[str]:
+    """Candidates from the completions index written by :func:`_completions_refresh`, or default if missing.
+
+    A missing index or older than :data:`_COMPLETIONS_TTL` is refreshed by a detached process, which never writes
+    the index if it fails. The ``.refresh`` marker file is created when the process is started and removed when
+    the index is written, so only one refresh is started per :data:`_COMPLETIONS_TTL`, even if it fails.
+    """
+    file = _completions_file()
+    marker = file.with_suffix(".refresh")
+    try:
+        index = json.loads(file.read_text())
+        stale = time.time() - file.stat().st_mtime > _COMPLETIONS_TTL
+    except (OSError, ValueError):
+        index, stale = {}, True
+    with contextlib.suppress(OSError):
+        if stale and (not marker.exists() or time.time() - marker.stat().st_mtime > _COMPLETIONS_TTL):
+            file.parent.mkdir(exist_ok=True)
+            marker.touch()
+            subprocess.Popen(
+                [sys.executable, "-c",
+                 f"from {NODEPS_PROJECT_NAME}.__main__ import _completions_refresh; _completions_refresh()"],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+    return index.get(key, default)
+
+
 def _scheme_completions(ctx: typer.Context, args: list[str], incomplete: str):
     if args:
         print(f"{args}", file=sys.stderr)
 
-    valid = list(GITHUB_URL)
-    valid.pop(0)
     provided = ctx.params.get("name") or []
-    for item in valid:
+    for item in _completions_index("scheme", list(GITHUB_URL)[1:]):
         if item.startswith(incomplete) and item not in provided:
             yield item
 
@@ -47,9 +105,7 @@ def _repos_completions(ctx: typer.Context, args: list[str], incomplete: str):
 
     provided = ctx.params.get("name") or []
 
-    # r = Project().repos(ProjectRepos.DICT)
-    # valid = list(r.keys()) + [str(item) for item in r.values()]
-    for item in Project().repos():
+    for item in _completions_index("repos"):
         if item.startswith(incomplete) and item not in provided:
             yield item
 
@@ -58,18 +114,91 @@ def _versions_completions(ctx: typer.Context, args: list[str], incomplete: str):
     if args:
         print(f"{args}", file=sys.stderr)
 
-    valid = PYTHON_VERSIONS
     provided = ctx.params.get("name") or []
-    for item in valid:
+    for item in _completions_index("versions", PYTHON_VERSIONS):
         if item.startswith(incomplete) and item not in provided:
             yield item
 
 
+class _LazyGroup(typer.core.TyperGroup):
+    """Group which converts to click only the commands used, from the command info table of its :class:`_Typer`."""
+
+    typer_instance: "_Typer"
+
+    def get_command(self, ctx: typer.Context, cmd_name: str):
+        """Converts the command to click the first time is used."""
+        if cmd_name not in self.commands and (info := self.typer_instance.table.get(cmd_name)):
+            self.add_command(typer.main.get_command_from_info(
+                info,
+                pretty_exceptions_short=self.typer_instance.pretty_exceptions_short,
+                rich_markup_mode=self.rich_markup_mode,
+            ))
+        return super().get_command(ctx, cmd_name)
+
+    def list_commands(self, ctx: typer.Context):
+        """Command names without converting the commands."""
+        return sorted(self.typer_instance.table)
+
+
+class _Typer(typer.Typer):
+    """Typer which only converts to click the command invoked, instead of all the commands.
+
+    Commands are registered in :attr:`table` instead of ``registered_commands``, so the group built by
+    :func:`typer.main.get_command` has no commands, and :class:`_LazyGroup` converts them when used.
+
+    Caveats:
+        The command functions are still defined when this module is imported, which is cheap compared
+        to importing typer and rich, and the modules used by a command are imported when it runs.
+    """
+
+    def __init__(self, **kwargs):
+        self.table: dict[str, typer.models.CommandInfo] = {}
+        super().__init__(cls=type(_LazyGroup.__name__, (_LazyGroup,), {"typer_instance": self}), **kwargs)
+
+    def command(self, name: str | None = None, **kwargs):
+        """Same as :meth:`typer.Typer.command` registering the command in :attr:`table`."""
+        decorator = super().command(name, **kwargs)
+
+        def register(f):
+            decorator(f)
+            info = self.registered_commands.pop()
+            self.table[info.name or typer.main.get_command_name(f.__name__)] = info
+            return f
+
+        return register
+
+
+_BenchmarkJSON = Annotated[Optional[pathlib.Path], typer.Option(  # noqa: UP045 (typer 0.9 does not support X | None)
+    help="Write JSON report to file",
+)]
+"""JSON report option of the benchmark commands."""
 _cwd = pathlib.Path.cwd()
+_FetchTTL = Annotated[Optional[bool], typer.Option(  # noqa: UP045 (typer 0.9 does not support X | None)
+    "--fetch/--no-fetch", help="Fetch before status  [default: if not fetched in the last minute]", show_default=False,
+)]
+"""Fetch option of the status commands, None uses :data:`nodeps.GIT_FETCH_TTL`."""
 _typer_options = {"add_completion": False, "context_settings": {"help_option_names": ["-h", "--help"]}}
 
-gh_g = typer.Typer(no_args_is_help=True, **_typer_options, name="g")
-project_p = typer.Typer(no_args_is_help=True, **_typer_options, name=NODEPS_EXECUTABLE)
+gh_g = _Typer(no_args_is_help=True, **_typer_options, name="g")
+project_p = _Typer(no_args_is_help=True, **_typer_options, name=NODEPS_EXECUTABLE)
+
+
+@gh_g.callback()
+def _gh_g():
+    """Git and GitHub repository commands."""
+
+
+@project_p.callback(invoke_without_command=True)
+def _project_p(
+        daemon: bool = typer.Option(False, "--daemon", help=f"Serve p and g commands on {DAEMON_SOCKET}"),
+):
+    """NoDeps project CLI."""
+    if daemon:
+        try:
+            modules.daemon_serve()
+        except RuntimeError as exception:
+            print(exception, file=sys.stderr)
+            raise typer.Exit(1) from exception
 
 _branch = typer.Typer(**_typer_options, name="branch")
 _browser = typer.Typer(**_typer_options, name="browser")
@@ -125,7 +254,7 @@ def admin_gh_g(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Can user admin repository."""
-    sys.exit(int(not GitUrl(data=data, repo=repo).admin(user=user, rm=rm)))
+    sys.exit(int(not modules.GitUrl(data=data, repo=repo).admin(user=user, rm=rm)))
 
 
 @project_p.command(name="admin")
@@ -141,7 +270,75 @@ def admin_project_p(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Can user admin repository."""
-    sys.exit(int(not Project(data, rm=rm).gh.admin(user=user, rm=rm)))
+    sys.exit(int(not modules.Project(data, rm=rm).gh.admin(user=user, rm=rm)))
+
+
+@project_p.command(name="benchmark")
+def benchmark_project_p(
+        name: Annotated[Optional[list[str]], typer.Argument(  # noqa: UP045
+            help="Measurements to run, default all"
+        )] = None,
+        budget: Annotated[Optional[list[str]], typer.Option(  # noqa: UP045
+            help="Budget in milliseconds: name=ms, i.e.: 'import nodeps=50'"
+        )] = None,
+        json: _BenchmarkJSON = None,
+        repeat: int = typer.Option(5, help="Number of runs, best is used"),
+):
+    """Import and startup time benchmark, exit code 1 if a budget is exceeded."""
+    budgets = BENCHMARK_BUDGETS.copy()
+    for item in budget or []:
+        key, _, value = item.rpartition("=")
+        budgets[key] = float(value)
+    b = modules.benchmark(names=name or None, budgets=budgets, repeat=repeat)
+    print(b.json(json))
+    for key, (value, limit) in b.exceeded.items():
+        print(f"{key}: {value:.2f} ms > {limit} ms", file=sys.stderr)
+    if b.exceeded:
+        raise typer.Exit(1)
+
+
+@project_p.command(name="benchmark-cache")
+def benchmark_cache_project_p(
+        number: int = typer.Option(CACHE_BENCHMARK_NUMBER, help="Number of calls"),
+        budget: Annotated[Optional[list[str]], typer.Option(  # noqa: UP045
+            help="Budget in microseconds: name=us, i.e.: 'cache hit dict=50'"
+        )] = None,
+        json: _BenchmarkJSON = None,
+        repeat: int = typer.Option(3, help="Number of runs, best is used"),
+):
+    """Cache decorator hit latency benchmark, exit code 1 if a budget is exceeded."""
+    budgets = {}
+    for item in budget or []:
+        key, _, value = item.rpartition("=")
+        budgets[key] = float(value)
+    b = modules.benchmark_cache(number=number, budgets=budgets, repeat=repeat)
+    print(b.json(json))
+    for key, (value, limit) in b.exceeded.items():
+        print(f"{key}: {value:.2f} us > {limit} us", file=sys.stderr)
+    if b.exceeded:
+        raise typer.Exit(1)
+
+
+@project_p.command(name="benchmark-giturl")
+def benchmark_giturl_project_p(
+        size: int = typer.Option(GITURL_BENCHMARK_SIZE, help="Number of urls"),
+        budget: Annotated[Optional[list[str]], typer.Option(  # noqa: UP045
+            help="Budget in the units of the results: name=value, i.e.: 'giturl parse=50'"
+        )] = None,
+        json: _BenchmarkJSON = None,
+        repeat: int = typer.Option(3, help="Number of runs, best is used"),
+):
+    """GitUrl parse and rewrite benchmark with the tests urls, exit code 1 if a budget is exceeded."""
+    budgets = {}
+    for item in budget or []:
+        key, _, value = item.rpartition("=")
+        budgets[key] = float(value)
+    b = modules.benchmark_giturl(size=size, budgets=budgets, repeat=repeat)
+    print(b.json(json))
+    for key, (value, limit) in b.exceeded.items():
+        print(f"{key}: {value:.2f} > {limit}", file=sys.stderr)
+    if b.exceeded:
+        raise typer.Exit(1)
 
 
 @gh_g.command(name="branch")
@@ -155,7 +352,7 @@ def branch_gh_g(
                                             "if not None, otherwise $GIT."),
 ):
     """Current branch."""
-    print(Gh(data=data, repo=repo).current())
+    print(modules.Gh(data=data, repo=repo).current())
 
 
 @project_p.command("branch")
@@ -170,7 +367,7 @@ def branch_project_p(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Current branch."""
-    print(Project(data, rm=rm).gh.current())
+    print(modules.Project(data, rm=rm).gh.current())
 
 
 @project_p.command()
@@ -186,7 +383,7 @@ def brew(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Clean project."""
-    Project(data, rm=rm).brew(command if command else None)
+    modules.Project(data, rm=rm).brew(command if command else None)
 
 
 @project_p.command()
@@ -205,7 +402,7 @@ def browser(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Build and serve the documentation with live reloading on file changes."""
-    Project(data, rm=rm).browser(version=version, quiet=quiet)
+    modules.Project(data, rm=rm).browser(version=version, quiet=quiet)
 
 
 @project_p.command()
@@ -224,7 +421,7 @@ def build(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Build a project `venv`, `completions`, `docs` and `clean`."""
-    Project(data, rm=rm).build(version=version, quiet=quiet, rm=rm)
+    modules.Project(data, rm=rm).build(version=version, quiet=quiet, rm=rm)
 
 
 @project_p.command()
@@ -241,7 +438,7 @@ def builds(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Build a project `venv`, `completions`, `docs` and `clean` for all versions."""
-    Project(data, rm=rm).builds(quiet=quiet, rm=rm)
+    modules.Project(data, rm=rm).builds(quiet=quiet, rm=rm)
 
 
 @project_p.command()
@@ -257,7 +454,7 @@ def buildrequires(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Build requirements."""
-    for item in Project(data, rm=rm).buildrequires():
+    for item in modules.Project(data, rm=rm).buildrequires():
         print(item)
 
 
@@ -272,7 +469,7 @@ def current_gh_g(
                                             "if not None, otherwise $GIT."),
 ):
     """Current branch."""
-    print(Gh(data=data, repo=repo).current())
+    print(modules.Gh(data=data, repo=repo).current())
 
 
 @project_p.command("current")
@@ -287,7 +484,7 @@ def current_project_p(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Current branch."""
-    print(Project(data, rm=rm).gh.current())
+    print(modules.Project(data, rm=rm).gh.current())
 
 
 @gh_g.command(name="default")
@@ -301,7 +498,7 @@ def default_gh_g(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Default branch."""
-    print(GitUrl(data=data, repo=repo).default(rm=rm))
+    print(modules.GitUrl(data=data, repo=repo).default(rm=rm))
 
 
 @project_p.command(name="default")
@@ -316,7 +513,7 @@ def default_project_p(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Default branch."""
-    print(Project(data, rm=rm).gh.default(rm=rm))
+    print(modules.Project(data, rm=rm).gh.default(rm=rm))
 
 
 @project_p.command()
@@ -332,11 +529,11 @@ def clean(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Clean project."""
-    Project(data, rm=rm).clean()
+    modules.Project(data, rm=rm).clean()
 
 
 @gh_g.command(name="commit")
-def commit_gh_g(
+def commit_gh_g(  # noqa: PLR0917
         data: Annotated[
             pathlib.Path,  # noqa: RUF013
             typer.Argument(help="Url, path or user (to be used with name), default None for cwd."),
@@ -346,9 +543,10 @@ def commit_gh_g(
         msg: str = typer.Option("", "-m", "--message", "--msg", help="Commit message"),
         quiet: bool = True,
         force: bool = typer.Option(False, help="Force commit if diverged"),
+        fetch: bool = typer.Option(True, "--fetch/--no-fetch", help="Fetch before status"),
 ):
     """Commit a project from path or name."""
-    Gh(data=data, repo=repo).commit(msg if msg else None, force=force, quiet=quiet)
+    modules.Gh(data=data, repo=repo).commit(msg if msg else None, force=force, quiet=quiet, fetch=fetch)
 
 
 @project_p.command()
@@ -364,9 +562,10 @@ def commit(
         msg: str = typer.Option("", "-m", "--message", "--msg", help="Commit message"),
         force: bool = typer.Option(False, help="Force commit if diverged"),
         quiet: bool = True,
+        fetch: bool = typer.Option(True, "--fetch/--no-fetch", help="Fetch before status"),
 ):
     """Commit a project from path or name."""
-    Project(data).gh.commit(msg if msg else None, force=force, quiet=quiet)
+    modules.Project(data).gh.commit(msg if msg else None, force=force, quiet=quiet, fetch=fetch)
 
 
 @project_p.command()
@@ -381,8 +580,9 @@ def completions(
         ] = _cwd,
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
-    """Generate completions to /usr/local/etc/bash_completion.d."""
-    Project(data, rm=rm).completions()
+    """Generate completions to /usr/local/etc/bash_completion.d and the repos completions index."""
+    modules.Project(data, rm=rm).completions()
+    _completions_refresh(modules.Project.repos(ProjectRepos.NAMES, rm=rm))
 
 
 @project_p.command()
@@ -397,7 +597,7 @@ def coverage(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Project coverage."""
-    Project(data, rm=rm).coverage()
+    modules.Project(data, rm=rm).coverage()
 
 
 @project_p.command()
@@ -413,7 +613,7 @@ def dependencies(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Project dependencies from path or name."""
-    for item in Project(data, rm=rm).dependencies():
+    for item in modules.Project(data, rm=rm).dependencies():
         print(item)
 
 
@@ -426,12 +626,13 @@ def dirty_gh_g(
         repo: str = typer.Option(None, help="Repo name. If not None it will use data as the owner "
                                             "if not None, otherwise $GIT."),
         quiet: bool = True,
+        fetch: _FetchTTL = None,
 ):
     """Is the repo dirty?: 0 if dirty."""
-    print(Gh(data=data, repo=repo).status(quiet=quiet), file=sys.stderr)
-    print(Gh(data=data, repo=repo).status(quiet=quiet).dirty, file=sys.stderr)
+    print(modules.Gh(data=data, repo=repo).status(quiet=quiet, fetch=fetch), file=sys.stderr)
+    print(modules.Gh(data=data, repo=repo).status(quiet=quiet, fetch=fetch).dirty, file=sys.stderr)
 
-    if Gh(data=data, repo=repo).status(quiet=quiet).dirty:
+    if modules.Gh(data=data, repo=repo).status(quiet=quiet, fetch=fetch).dirty:
         sys.exit(0)
     else:
         sys.exit(1)
@@ -448,9 +649,10 @@ def dirty(
             ),
         ] = _cwd,
         quiet: bool = True,
+        fetch: _FetchTTL = None,
 ):
     """Is the repo dirty?: 0 if dirty."""
-    if Project(data).gh.status(quiet=quiet).dirty:
+    if modules.Project(data).gh.status(quiet=quiet, fetch=fetch).dirty:
         sys.exit(0)
     else:
         sys.exit(1)
@@ -469,7 +671,7 @@ def distribution(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Clean project."""
-    print(Project(data, rm=rm).distribution())
+    print(modules.Project(data, rm=rm).distribution())
 
 
 @gh_g.command(name="diverge")
@@ -481,9 +683,10 @@ def diverge_gh_g(
         repo: str = typer.Option(None, help="Repo name. If not None it will use data as the owner "
                                             "if not None, otherwise $GIT."),
         quiet: bool = True,
+        fetch: _FetchTTL = None,
 ):
     """Does the repo diverge, dirty or need push and needpull?: 0: if diverge."""
-    if Gh(data=data, repo=repo).status(quiet=quiet).diverge:
+    if modules.Gh(data=data, repo=repo).status(quiet=quiet, fetch=fetch).diverge:
         sys.exit(0)
     else:
         sys.exit(1)
@@ -500,9 +703,10 @@ def diverge(
             ),
         ] = _cwd,
         quiet: bool = True,
+        fetch: _FetchTTL = None,
 ):
     """Does the repo diverge, dirty or need push and needpull?: 0: if diverge."""
-    if Project(data).gh.status(quiet=quiet).diverge:
+    if modules.Project(data).gh.status(quiet=quiet, fetch=fetch).diverge:
         sys.exit(0)
     else:
         sys.exit(1)
@@ -521,7 +725,7 @@ def docker(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Build and push to docker hub for python versions, latest will be PYTHON_DEFAULT_VERSION."""
-    Project(data, rm=rm).docker(quiet=quiet)
+    modules.Project(data, rm=rm).docker(quiet=quiet)
 
 
 @project_p.command()
@@ -540,7 +744,7 @@ def docs(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Build the documentation."""
-    Project(data, rm=rm).docs(version=version, quiet=quiet)
+    modules.Project(data, rm=rm).docs(version=version, quiet=quiet)
 
 
 @project_p.command()
@@ -557,7 +761,7 @@ def executable(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Shows executable being used."""
-    print(Project(data, rm=rm).executable(version=version))
+    print(modules.Project(data, rm=rm).executable(version=version))
 
 
 @project_p.command()
@@ -573,7 +777,7 @@ def extras(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Project extras."""
-    for item in Project(data, rm=rm).extras(as_list=True):
+    for item in modules.Project(data, rm=rm).extras(as_list=True):
         print(item)
 
 
@@ -589,7 +793,7 @@ def github_gh_g(
 ):
     """GitHub repos API."""
     from rich import print_json
-    print_json(data=GitUrl(data=data, repo=repo).github(rm=rm))
+    print_json(data=modules.GitUrl(data=data, repo=repo).github(rm=rm))
 
 
 @project_p.command(name="github")
@@ -605,13 +809,15 @@ def github_project_p(
 ):
     """GitHub repos API."""
     from rich import print_json
-    print_json(data=Project(data, rm=rm).gh.github(rm=rm))
+    print_json(data=modules.Project(data, rm=rm).gh.github(rm=rm))
 
 
 @project_p.command()
 @_ipy.command()
 def __ipy():
     """IPython."""
+    from .ipython_dir.profile_default.ipython_config import ipy  # noqa: PLC0415
+
     ipy()
 
 
@@ -619,6 +825,8 @@ def __ipy():
 @_ipythondir.command()
 def ipythondir():
     """IPython Profile :mod:`ipython_profile.profile_default.ipython_config`: `export IPYTHONDIR="$(ipythondir)"`."""
+    from .ipython_variables import IPYTHONDIR  # noqa: PLC0415
+
     print(IPYTHONDIR)
 
 
@@ -632,7 +840,7 @@ def latest_gh_g(
                                             "if not None, otherwise $GIT."),
 ):
     """Latest tag."""
-    print(Gh(data=data, repo=repo).latest())
+    print(modules.Gh(data=data, repo=repo).latest())
 
 
 @project_p.command()
@@ -647,14 +855,14 @@ def latest(
         ] = _cwd,
 ):
     """Latest tag."""
-    print(Project(data).gh.latest())
+    print(modules.Project(data).gh.latest())
 
 
 @project_p.command(name="mip")
 @_mip.command(name="mip")
 def __mip():
     """Public IP."""
-    print(mip())
+    print(modules.mip())
 
 
 @gh_g.command(name="needpull")
@@ -666,9 +874,10 @@ def needpull_gh_g(
         repo: str = typer.Option(None, help="Repo name. If not None it will use data as the owner "
                                             "if not None, otherwise $GIT."),
         quiet: bool = True,
+        fetch: _FetchTTL = None,
 ):
     """Does the repo need to be pulled?: 0 if needs pull."""
-    if Gh(data=data, repo=repo).status(quiet=quiet).pull:
+    if modules.Gh(data=data, repo=repo).status(quiet=quiet, fetch=fetch).pull:
         sys.exit(0)
     else:
         sys.exit(1)
@@ -685,9 +894,10 @@ def needpull(
             ),
         ] = _cwd,
         quiet: bool = True,
+        fetch: _FetchTTL = None,
 ):
     """Does the repo need to be pulled?: 0 if needs pull."""
-    if Project(data).gh.status(quiet=quiet).pull:
+    if modules.Project(data).gh.status(quiet=quiet, fetch=fetch).pull:
         sys.exit(0)
     else:
         sys.exit(1)
@@ -702,9 +912,10 @@ def needpush_gh_g(
         repo: str = typer.Option(None, help="Repo name. If not None it will use data as the owner "
                                             "if not None, otherwise $GIT."),
         quiet: bool = True,
+        fetch: _FetchTTL = None,
 ):
     """Does the repo need to be pushed?: 0 if needs push."""
-    if Gh(data=data, repo=repo).status(quiet=quiet).push:
+    if modules.Gh(data=data, repo=repo).status(quiet=quiet, fetch=fetch).push:
         sys.exit(0)
     else:
         sys.exit(1)
@@ -721,9 +932,10 @@ def needpush(
             ),
         ] = _cwd,
         quiet: bool = True,
+        fetch: _FetchTTL = None,
 ):
     """Does the repo need to be pushed?: 0 if needs push."""
-    if Project(data).gh.status(quiet=quiet).push:
+    if modules.Project(data).gh.status(quiet=quiet, fetch=fetch).push:
         sys.exit(0)
     else:
         sys.exit(1)
@@ -741,7 +953,7 @@ def next_gh_g(
         force: Annotated[bool, typer.Option(help="force bump")] = False,
 ):
     """Show next version based on fix: feat: or BREAKING CHANGE:."""
-    print(Gh(data=data, repo=repo).next(part=part, force=force))
+    print(modules.Gh(data=data, repo=repo).next(part=part, force=force))
 
 
 @project_p.command(name="next")
@@ -758,7 +970,7 @@ def __next(
         force: Annotated[bool, typer.Option(help="force bump")] = False,
 ):
     """Show next version based on fix: feat: or BREAKING CHANGE:."""
-    print(Project(data=data).gh.next(part=part, force=force))
+    print(modules.Project(data=data).gh.next(part=part, force=force))
 
 
 @project_p.command()
@@ -774,7 +986,7 @@ def post(
         uninstall: bool = typer.Option(False, help="Uninstall"),
 ):
     """Run post install for package: completions, brew and _post_install.py.."""
-    Project(data=data, rm=rm).post(uninstall=uninstall)
+    modules.Project(data=data, rm=rm).post(uninstall=uninstall)
 
 
 @gh_g.command(name="public")
@@ -788,7 +1000,7 @@ def public_gh_g(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Is repository public?."""
-    sys.exit(int(not GitUrl(data=data, repo=repo).public(rm=rm)))
+    sys.exit(int(not modules.GitUrl(data=data, repo=repo).public(rm=rm)))
 
 
 @project_p.command(name="public")
@@ -803,7 +1015,7 @@ def public_project_p(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Is repository public?"""
-    sys.exit(int(not Project(data, rm=rm).gh.public(rm=rm)))
+    sys.exit(int(not modules.Project(data, rm=rm).gh.public(rm=rm)))
 
 
 @project_p.command()
@@ -824,7 +1036,7 @@ def publish(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Publish runs runs `tests`, `commit`, `tag`, `push`, `twine` and `clean`."""
-    Project(data, rm=rm).publish(part=part, force=force, ruff=ruff, tox=tox, quiet=quiet, rm=rm)
+    modules.Project(data, rm=rm).publish(part=part, force=force, ruff=ruff, tox=tox, quiet=quiet, rm=rm)
 
 
 @gh_g.command(name="pull")
@@ -837,9 +1049,10 @@ def pull_gh_g(
                                             "if not None, otherwise $GIT."),
         force: bool = typer.Option(False, help="Force commit if diverged"),
         quiet: bool = True,
+        fetch: bool = typer.Option(True, "--fetch/--no-fetch", help="Fetch before status"),
 ):
     """Pull repo."""
-    Gh(data=data, repo=repo).pull(force=force, quiet=quiet)
+    modules.Gh(data=data, repo=repo).pull(force=force, quiet=quiet, fetch=fetch)
 
 
 @project_p.command()
@@ -854,9 +1067,10 @@ def pull(
         ] = _cwd,
         force: bool = typer.Option(False, help="Force commit if diverged"),
         quiet: bool = True,
+        fetch: bool = typer.Option(True, "--fetch/--no-fetch", help="Fetch before status"),
 ):
     """Pull repo."""
-    Project(data).gh.pull(force=force, quiet=quiet)
+    modules.Project(data).gh.pull(force=force, quiet=quiet, fetch=fetch)
 
 
 @gh_g.command(name="push")
@@ -869,9 +1083,10 @@ def push_gh_g(
                                             "if not None, otherwise $GIT."),
         force: bool = typer.Option(False, help="Force push"),
         quiet: bool = True,
+        fetch: bool = typer.Option(True, "--fetch/--no-fetch", help="Fetch before status"),
 ):
     """Push repo."""
-    Gh(data=data, repo=repo).push(force=force, quiet=quiet)
+    modules.Gh(data=data, repo=repo).push(force=force, quiet=quiet, fetch=fetch)
 
 
 @project_p.command()
@@ -886,9 +1101,10 @@ def push(
         ] = _cwd,
         force: bool = typer.Option(False, help="Force push"),
         quiet: bool = True,
+        fetch: bool = typer.Option(True, "--fetch/--no-fetch", help="Fetch before status"),
 ):
     """Push repo."""
-    Project(data).gh.push(force=force, quiet=quiet)
+    modules.Project(data).gh.push(force=force, quiet=quiet, fetch=fetch)
 
 
 @project_p.command()
@@ -904,7 +1120,7 @@ def pypi(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Pypi information for a package."""
-    print(Project(data, rm=rm).pypi(rm=rm))
+    print(modules.Project(data, rm=rm).pypi(rm=rm))
 
 
 @project_p.command()
@@ -921,7 +1137,7 @@ def pytest(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Run pytest."""
-    sys.exit(Project(data, rm=rm).pytest(version=version))
+    sys.exit(modules.Project(data, rm=rm).pytest(version=version))
 
 
 @project_p.command()
@@ -937,13 +1153,15 @@ def pytests(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Run pytest for all versions."""
-    sys.exit(Project(data, rm=rm).pytests())
+    sys.exit(modules.Project(data, rm=rm).pytests())
 
 
 @project_p.command()
 @_pythonstartup.command()
 def pythonstartup():
     """Python Startup :mod:`python_startup.__init__`: `export PYTHONSTARTUP="$(pythonstartup)"`."""
+    from .ipython_variables import PYTHONSTARTUP  # noqa: PLC0415
+
     print(PYTHONSTARTUP)
 
 
@@ -957,7 +1175,7 @@ def remote_gh_g(
                                             "if not None, otherwise $GIT."),
 ):
     """Remote url."""
-    print(Gh(data=data, repo=repo).url)
+    print(modules.Gh(data=data, repo=repo).url)
 
 
 @project_p.command()
@@ -972,12 +1190,12 @@ def remote(
         ] = _cwd,
 ):
     """Remote url."""
-    print(Project(data).gh.url)
+    print(modules.Project(data).gh.url)
 
 
 @project_p.command()
 @_repos.command()
-def repos(
+def repos(  # noqa: PLR0917
         data: Annotated[
             pathlib.Path,
             typer.Argument(
@@ -989,16 +1207,23 @@ def repos(
         sync: Annotated[bool, typer.Option(help="push or pull all repos")] = False,
         archive: Annotated[bool, typer.Option(help="look for repos under ~/Archive")] = False,
         rm: bool = typer.Option(False, help="Remove cache"),
-):
-    """Manage repos and projects under HOME and HOME/Archive."""
-    rv = Project(data, rm=rm).repos(ret=ret, sync=sync, archive=archive, rm=rm)
-    if sync is False:
-        if ret == ProjectRepos.PATHS:
-            for repo in rv:
-                print(str(repo))
-        else:
-            for repo in rv:
-                print(repo)
+        workers: Annotated[int, typer.Option(help="repos syncing at the same time")] = AIOGH_LIMIT,
+):
+    """Manage repos and projects under HOME and HOME/Archive, exits 1 if sync failed or diverged for any repo."""
+    rv = modules.Project(data, rm=rm).repos(ret=ret, sync=sync, archive=archive, rm=rm, workers=workers)
+    if sync:
+        width = max((len(result.name) for result in rv), default=0)
+        for result in rv:
+            print(f"{result.name:<{width}}  {result.duration:7.2f}s  {result.state}")
+        raise typer.Exit(int(any(result.error or result.diverged for result in rv)))
+    if ret == ProjectRepos.NAMES and not archive:
+        _completions_refresh(rv)
+    if ret == ProjectRepos.PATHS:
+        for repo in rv:
+            print(str(repo))
+    else:
+        for repo in rv:
+            print(repo)
 
 
 @project_p.command()
@@ -1019,7 +1244,7 @@ def requirement(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Requirements for package."""
-    rv = Project(data, rm=rm).requirement(version=version, install=install, upgrade=upgrade, quiet=quiet)
+    rv = modules.Project(data, rm=rm).requirement(version=version, install=install, upgrade=upgrade, quiet=quiet)
     if install or upgrade:
         return
     for item in rv:
@@ -1041,7 +1266,7 @@ def requirements(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Install requirements for all python versions."""
-    Project(data, rm=rm).requirements(upgrade=upgrade, quiet=quiet)
+    modules.Project(data, rm=rm).requirements(upgrade=upgrade, quiet=quiet)
 
 
 @project_p.command(name="ruff")
@@ -1057,7 +1282,7 @@ def _ruff(
                                              autocompletion=_versions_completions)] = PYTHON_DEFAULT_VERSION,
 ):
     """Run ruff."""
-    sys.exit(Project(data).ruff(version=version))
+    sys.exit(modules.Project(data).ruff(version=version))
 
 
 @gh_g.command(name="secrets")
@@ -1071,7 +1296,7 @@ def secrets_gh_g(
         force: bool = typer.Option(False, help="For update secrets, otherwise update if empty."),
 ):
     """Update GitHub repository secrets."""
-    Gh(data=data, repo=repo).secrets(force=force)
+    modules.Gh(data=data, repo=repo).secrets(force=force)
 
 
 @project_p.command()
@@ -1087,7 +1312,7 @@ def secrets(
         force: bool = typer.Option(False, help="For update secrets, otherwise update if empty."),
 ):
     """Update GitHub repository secrets."""
-    Project(data).gh.secrets(force=force)
+    modules.Project(data).gh.secrets(force=force)
 
 
 @gh_g.command(name="secrets-names")
@@ -1100,7 +1325,7 @@ def secrets_names_gh_g(
                                             "if not None, otherwise $GIT."),
 ):
     """List GitHub repository secrets names."""
-    for item in Gh(data=data, repo=repo).secrets_names():
+    for item in modules.Gh(data=data, repo=repo).secrets_names():
         print(item)
 
 
@@ -1116,7 +1341,7 @@ def secrets_names(
         ] = _cwd,
 ):
     """List GitHub repository secrets names."""
-    for item in Project(data).gh.secrets_names():
+    for item in modules.Project(data).gh.secrets_names():
         print(item)
 
 
@@ -1129,10 +1354,11 @@ def status_git_g(
         repo: str = typer.Option(None, help="Repo name. If not None it will use data as the owner "
                                             "if not None, otherwise $GIT."),
         quiet: bool = True,
+        fetch: _FetchTTL = None,
 ):
     """Git status for a project."""
     from rich import print_json
-    print_json(data=dataclasses.asdict(Gh(data=data, repo=repo).status(quiet=quiet)))
+    print_json(data=dataclasses.asdict(modules.Gh(data=data, repo=repo).status(quiet=quiet, fetch=fetch)))
 
 
 @project_p.command()
@@ -1146,10 +1372,11 @@ def status(
             ),
         ] = _cwd,
         quiet: bool = True,
+        fetch: _FetchTTL = None,
 ):
     """Git status for a project."""
     from rich import print_json
-    print_json(data=dataclasses.asdict(Project(data).gh.status(quiet=quiet)))
+    print_json(data=dataclasses.asdict(modules.Project(data).gh.status(quiet=quiet, fetch=fetch)))
 
 
 @gh_g.command(name="superproject")
@@ -1161,7 +1388,7 @@ def superproject_gh_g(
         repo: str = typer.Option(None, help="Repo name. If not None it will use data as the owner"),
 ):
     """Superproject path."""
-    print(Gh(data=data, repo=repo).superproject())
+    print(modules.Gh(data=data, repo=repo).superproject())
 
 
 @project_p.command()
@@ -1176,7 +1403,7 @@ def superproject(
         ] = _cwd,
 ):
     """Superproject path."""
-    print(Project(data).gh.superproject())
+    print(modules.Project(data).gh.superproject())
 
 
 @gh_g.command(name="sync")
@@ -1189,7 +1416,7 @@ def sync_gh_g(
                                             "if not None, otherwise $GIT."),
 ):
     """Sync repo."""
-    Gh(data=data, repo=repo).sync()
+    modules.Gh(data=data, repo=repo).sync()
 
 
 @project_p.command(name="sync")
@@ -1204,7 +1431,7 @@ def __sync(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Sync repo."""
-    Project(data, rm=rm).gh.sync()
+    modules.Project(data, rm=rm).gh.sync()
 
 
 @gh_g.command(name="tag")
@@ -1219,7 +1446,7 @@ def tag_gh_g(
         quiet: bool = True,
 ):
     """Latest tag."""
-    print(Gh(data=data, repo=repo).tag(tag=tag, quiet=quiet))
+    print(modules.Gh(data=data, repo=repo).tag(tag=tag, quiet=quiet))
 
 
 @project_p.command("tag")
@@ -1235,7 +1462,7 @@ def __tag(
         quiet: bool = True,
 ):
     """Tag repo."""
-    Project(data).gh.tag(tag=tag, quiet=quiet)
+    modules.Project(data).gh.tag(tag=tag, quiet=quiet)
 
 
 @project_p.command(name="test")
@@ -1255,7 +1482,7 @@ def test(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Test project, runs `build`, `ruff`, `pytest` and `tox`."""
-    sys.exit(Project(data, rm=rm).test(version=version, ruff=ruff, tox=tox, quiet=quiet))
+    sys.exit(modules.Project(data, rm=rm).test(version=version, ruff=ruff, tox=tox, quiet=quiet))
 
 
 @project_p.command(name="tests")
@@ -1274,7 +1501,7 @@ def tests(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Test project, runs `build`, `ruff`, `pytest` and `tox`."""
-    sys.exit(Project(data, rm=rm).tests(ruff=ruff, tox=tox, quiet=quiet))
+    sys.exit(modules.Project(data, rm=rm).tests(ruff=ruff, tox=tox, quiet=quiet))
 
 
 @gh_g.command(name="top")
@@ -1286,7 +1513,7 @@ def top_gh_g(
         repo: str = typer.Option(None, help="Repo name. If not None it will use data as the owner"),
 ):
     """Top path."""
-    print(Gh(data=data, repo=repo).top())
+    print(modules.Gh(data=data, repo=repo).top())
 
 
 @project_p.command()
@@ -1300,7 +1527,7 @@ def top(
         ] = _cwd,
 ):
     """Top path."""
-    print(Project(data).gh.top())
+    print(modules.Project(data).gh.top())
 
 
 @project_p.command(name="tox")
@@ -1314,7 +1541,7 @@ def _tox(
         ] = _cwd,
 ):
     """Run tox."""
-    sys.exit(Project(data).tox())
+    sys.exit(modules.Project(data).tox())
 
 
 @project_p.command()
@@ -1331,7 +1558,7 @@ def twine(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Run twine."""
-    sys.exit(Project(data, rm=rm).twine(part=part, force=force, rm=rm))
+    sys.exit(modules.Project(data, rm=rm).twine(part=part, force=force, rm=rm))
 
 
 @project_p.command(name="version")
@@ -1347,7 +1574,7 @@ def __version(
         rm: bool = typer.Option(True, help="Remove cache"),
 ):
     """Project version from pyproject.toml, tag, distribution or pypi."""
-    print(Project(data, rm=rm).version(rm=rm))
+    print(modules.Project(data, rm=rm).version(rm=rm))
 
 
 @project_p.command()
@@ -1368,7 +1595,7 @@ def venv(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Creates venv, runs: `write` and `requirements`."""
-    Project(data, rm=rm).venv(version=version, clear=clear, upgrade=upgrade, quiet=quiet, rm=rm)
+    modules.Project(data, rm=rm).venv(version=version, clear=clear, upgrade=upgrade, quiet=quiet, rm=rm)
 
 
 @project_p.command()
@@ -1386,7 +1613,7 @@ def venvs(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Creates venv, runs: `write` and `requirements`."""
-    Project(data, rm=rm).venvs(upgrade=upgrade, quiet=quiet, rm=rm)
+    modules.Project(data, rm=rm).venvs(upgrade=upgrade, quiet=quiet, rm=rm)
 
 
 @project_p.command()
@@ -1401,7 +1628,7 @@ def write(
         rm: bool = typer.Option(False, help="Remove cache"),
 ):
     """Updates pyproject.toml and docs conf.py."""
-    Project(data, rm=rm).write(rm=rm)
+    modules.Project(data, rm=rm).write(rm=rm)
 
 
 if "sphinx" in sys.modules and __name__ != "__main__":
@@ -1425,7 +1652,9 @@ if "sphinx" in sys.modules and __name__ != "__main__":
         for key, value in globals().copy().items():
             if isinstance(value, typer.Typer):
                 cls = f"{NODEPS_PROJECT_NAME}.__main__:{key}"
-                new["project"]["scripts"][value.info.name] = cls
+                new["project"]["scripts"][value.info.name] = (
+                    f"{NODEPS_PROJECT_NAME}.modules.daemon:client_{key}" if key in ("gh_g", "project_p") else cls
+                )
                 text += f".. click:: {cls}_click\n"
                 text += f"    :prog: {value.info.name}\n"
                 text += "    :nested: full\n\n"
@@ -1434,7 +1663,7 @@ if "sphinx" in sys.modules and __name__ != "__main__":
         if original != text:
             file.write_text(text)
             print(f"{file}: updated!")
-        new["project"] = dict_sort(new["project"])
+        new["project"] = modules.dict_sort(new["project"])
         if toml != new:
             with pyproject_toml.open("w") as f:
                 tomlkit.dump(new, f)
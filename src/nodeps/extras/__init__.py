@@ -1,13 +1,4 @@
 """NoDeps Extras Module."""
-from . import ansi, debug, echo, log, pickle, pretty, repo, url
-from .ansi import *
-from .debug import *
-from .echo import *
-from .log import *
-from .pickle import *
-from .pretty import *
-from .repo import *
-from .url import *
+from .._lazy import lazy
 
-__all__ = (ansi.__all__ + debug.__all__ + echo.__all__ + log.__all__ + pickle.__all__ +
-           pretty.__all__ + repo.__all__ + url.__all__)
+__getattr__, __dir__ = lazy(__name__, ("ansi", "debug", "echo", "log", "pickle", "pretty", "repo", "url"))
@@ -3,10 +3,15 @@ __all__ = (
     "cache",
 )
 
+import collections
+import dataclasses
+import enum
 import functools
 import inspect
+import threading
+import time
 from collections.abc import Callable, Coroutine
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, NamedTuple, TypeVar
 
 try:
     # nodeps[pickle] extras
@@ -18,6 +23,28 @@ except ModuleNotFoundError:
     structlog = None
 
 _T = TypeVar("_T")
+_SCALARS = frozenset({bool, bytes, complex, float, int, str, type(None)})
+"""Builtin types fingerprinted with the type, since ``1 == 1.0 == True``."""
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of :func:`cache`, like :func:`functools.lru_cache`."""
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class _HashedKey(list):
+    """Key which hashes only once, like ``functools._HashedSeq``."""
+    __slots__ = ("hashvalue",)
+
+    def __init__(self, data: tuple):
+        super().__init__(data)
+        self.hashvalue = hash(data)
+
+    def __hash__(self) -> int:
+        return self.hashvalue
 
 
 class _CacheWrapper(Generic[_T]):
@@ -26,11 +53,78 @@ class _CacheWrapper(Generic[_T]):
     def __call__(self, *args: Any, **kwargs: Any) -> _T | Coroutine[Any, Any, _T]:
         ...
 
+    def cache_clear(self) -> None:
+        ...
+
+    def cache_info(self) -> CacheInfo:
+        ...
+
+
+def _fingerprint(obj: Any) -> Any:  # noqa: PLR0911
+    """Hashable fingerprint of obj, equal for equal values and types.
+
+    Tuples, lists and dicts with scalar items are fingerprinted with the types of the items,
+    otherwise item by item. Named tuples and dataclasses are fingerprinted field by field, since
+    ``P(True) == P(1.0)``. Types and enums are used as they are.
+
+    Raises:
+        TypeError: when obj or an item is of any other type, which may define ``__eq__`` across types.
+    """
+    cls = type(obj)
+    if cls in _SCALARS:
+        return cls, obj
+    if isinstance(obj, type):
+        return obj
+    if cls is tuple or cls is list:
+        if _SCALARS.issuperset(types := tuple(map(type, obj))):
+            return cls, tuple(obj), types
+        return cls, tuple(map(_fingerprint, obj))
+    if cls is dict:
+        if _SCALARS.issuperset(keys := tuple(map(type, obj))):
+            if _SCALARS.issuperset(values := tuple(map(type, obj.values()))):
+                return cls, tuple(obj.items()), keys, values
+            return cls, tuple(obj), keys, tuple(map(_fingerprint, obj.values()))
+        return cls, tuple((_fingerprint(key), _fingerprint(value)) for key, value in obj.items())
+    if cls is set or cls is frozenset:
+        return cls, frozenset(map(_fingerprint, obj))
+    if isinstance(obj, enum.Enum):
+        return cls, obj
+    if isinstance(obj, tuple) and hasattr(cls, "_fields"):
+        return cls, tuple(map(_fingerprint, obj))
+    if dataclasses.is_dataclass(obj):
+        return cls, tuple(_fingerprint(getattr(obj, f.name)) for f in dataclasses.fields(obj) if f.compare)
+    raise TypeError(cls)
+
+
+def _key(args: tuple, kwargs: dict) -> _HashedKey | str:
+    """Cache key of the arguments, from cheap to expensive.
+
+    1. Hash of builtin scalars, types and enums.
+    2. Fingerprint of tuples, lists, dicts, sets, named tuples and dataclasses (see :func:`_fingerprint`).
+    3. :func:`jsonpickle.encode` for other objects.
+
+    Raises:
+        Exception: when arguments can not be encoded by :func:`jsonpickle.encode`.
+    """
+    try:
+        return _HashedKey((_fingerprint(args), _fingerprint(kwargs)) if kwargs else _fingerprint(args))
+    except (TypeError, RecursionError):
+        return jsonpickle.encode((args, kwargs))
+
 
-def cache(
-        func: Callable[..., _T | Coroutine[Any, Any, _T]] = ...
+def cache(  # noqa: PLR0915
+        func: Callable[..., _T | Coroutine[Any, Any, _T]] = ...,
+        maxsize: int | None = 128,
+        ttl: float | None = None,
 ) -> Callable[[Callable[..., _T]], _CacheWrapper[_T]] | _T | Coroutine[Any, Any, _T] | Any:
-    """Caches previous calls to the function if object can be encoded.
+    """Caches previous calls to the function if the arguments are hashable or can be encoded.
+
+    Arguments with the same value have the same key (see :func:`_key`): the hash for builtin and hashable types,
+    a fingerprint for tuples, lists, dicts and sets, and :func:`jsonpickle.encode` for other objects.
+
+    Like :func:`functools.lru_cache`, the least recently used call is discarded when ``maxsize`` is reached,
+    and the wrapper has ``cache_info()`` and ``cache_clear()``. Calls are also discarded ``ttl`` seconds after
+    they were cached.
 
     Examples:
         >>> import asyncio
@@ -120,45 +214,91 @@ def cache(
         >>> TestNamed({}) # doctest: +IGNORE_EXCEPTION_DETAIL
         Traceback (most recent call last):
         TypeError: __init__() takes 1 positional argument but 2 were given
+        >>>
+        >>> @cache(maxsize=2, ttl=60)
+        ... def test(a):
+        ...     return a
+        >>>
+        >>> _ = [test(i) for i in (1, 2, 1, 3, 1)]
+        >>> test.cache_info()
+        CacheInfo(hits=2, misses=3, maxsize=2, currsize=2)
+        >>> test.cache_clear()
+        >>> test.cache_info()
+        CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+    Args:
+        func: function, coroutine function or class.
+        maxsize: maximum number of calls cached, None for unbounded (default: 128).
+        ttl: seconds to discard a cached call, None to never expire (default: None).
     """
+    if func is ...:
+        return functools.partial(cache, maxsize=maxsize, ttl=ttl)
     if jsonpickle is None or structlog is None:
         msg = "structlog and/or jsonpickle are not installed: installed with 'pip install nodeps[cache]'"
         raise ImportError(msg)
-    memo = {}
+    memo: collections.OrderedDict[_HashedKey | str, tuple[float | None, Any]] = collections.OrderedDict()
+    lock = threading.Lock()
+    stats = [0, 0]  # hits, misses
     log = structlog.get_logger()
-    coro = inspect.iscoroutinefunction(func)
-    if coro:
+
+    def lookup(args, kwargs) -> tuple[_HashedKey | str | None, bool, Any]:
+        """Key, found and value."""
+        try:
+            key = _key(args, kwargs)
+        except Exception as exception:  # noqa: BLE001
+            log.warning("Not cached", func=func, args=args, kwargs=kwargs, exception=exception)
+            key = None
+        with lock:
+            if key is not None and (item := memo.get(key)) is not None:
+                if item[0] is None or item[0] > time.monotonic():
+                    memo.move_to_end(key)
+                    stats[0] += 1
+                    return key, True, item[1]
+                del memo[key]
+            stats[1] += 1
+        return key, False, None
+
+    def store(key: _HashedKey | str | None, value: Any) -> None:
+        if key is None or maxsize == 0:
+            return
+        with lock:
+            memo[key] = (None if ttl is None else time.monotonic() + ttl, value)
+            memo.move_to_end(key)
+            if maxsize is not None and len(memo) > maxsize:
+                memo.popitem(last=False)
+
+    if inspect.iscoroutinefunction(func):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             """Async Cache Wrapper."""
-            key = None
-            save = True
-            try:
-                key = jsonpickle.encode((args, kwargs))
-                if key in memo:
-                    return memo[key]
-            except Exception as exception:  # noqa: BLE001
-                log.warning("Not cached", func=func, args=args, kwargs=kwargs, exception=exception)
-                save = False
+            key, found, value = lookup(args, kwargs)
+            if found:
+                return value
             value = await func(*args, **kwargs)
-            if key and save:
-                memo[key] = value
+            store(key, value)
             return value
     else:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             """Cache Wrapper."""
-            key = None
-            save = True
-            try:
-                key = jsonpickle.encode((args, kwargs))
-                if key in memo:
-                    return memo[key]
-            except Exception as exception:  # noqa: BLE001
-                log.warning("Not cached", func=func, args=args, kwargs=kwargs, exception=exception)
-                save = False
+            key, found, value = lookup(args, kwargs)
+            if found:
+                return value
             value = func(*args, **kwargs)
-            if key and save:
-                memo[key] = value
+            store(key, value)
             return value
+
+    def cache_clear() -> None:
+        """Clear the cache and statistics."""
+        with lock:
+            memo.clear()
+            stats[:] = [0, 0]
+
+    def cache_info() -> CacheInfo:
+        """Hits, misses, maxsize and currsize."""
+        with lock:
+            return CacheInfo(stats[0], stats[1], maxsize, len(memo))
+
+    wrapper.cache_clear = cache_clear
+    wrapper.cache_info = cache_info
     return wrapper
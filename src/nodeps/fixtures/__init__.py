@@ -36,7 +36,7 @@ import pytest
 from typer.testing import CliRunner, Result
 
 from nodeps.extras import Repo
-from nodeps.modules.constants import CI, DOCKER
+from nodeps.modules import constants
 from nodeps.modules.functions import in_tox
 from nodeps.modules.gh import git_config_global
 from nodeps.modules.path import Path
@@ -135,7 +135,7 @@ def local(request: FixtureRequest) -> bool:
         pytest tests/test_fixture.py  # docker -> 2 skipped
         pytest tests/test_fixture.py  # 0 skipped
     """
-    return request.config.getoption('local', False) or DOCKER or CI or in_tox()
+    return request.config.getoption('local', False) or constants.DOCKER or constants.CI or in_tox()
 
 
 @pytest.fixture(scope="session")
@@ -175,7 +175,7 @@ def pytest_collection_modifyitems(items: list[nodes.Item], config: Config) -> No
 @pytest.hookimpl
 def pytest_configure(config: Config) -> None:
     """Pytest configure. config.option.local = True."""
-    if DOCKER or CI:
+    if constants.DOCKER or constants.CI:
         config.option.local = True
 
 
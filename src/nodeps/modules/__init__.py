@@ -1,45 +1,21 @@
 """NoDeps Modules Module."""
-from . import (
-    classes,
-    constants,
-    datas,
-    enums,
-    env,
-    errors,
-    functions,
-    gh,
-    metapath,
-    path,
-    project,
-    seteuid,
-    typings,
-)
-from .classes import *
-from .constants import *
-from .datas import *
-from .enums import *
-from .env import *
-from .errors import *
-from .functions import *
-from .gh import *
-from .metapath import *
-from .path import *
-from .project import *
-from .seteuid import *
-from .typings import *
+from .._lazy import lazy
 
-__all__ = (
-        classes.__all__ +
-        constants.__all__ +
-        datas.__all__ +
-        enums.__all__ +
-        env.__all__ +
-        errors.__all__ +
-        functions.__all__ +
-        gh.__all__ +
-        metapath.__all__ +
-        path.__all__ +
-        project.__all__ +
-        seteuid.__all__ +
-        typings.__all__
-)
+__getattr__, __dir__ = lazy(__name__, (
+    "benchmarks",
+    "classes",
+    "constants",
+    "daemon",
+    "datas",
+    "enums",
+    "env",
+    "errors",
+    "functions",
+    "gh",
+    "gitconfig",
+    "metapath",
+    "path",
+    "project",
+    "seteuid",
+    "typings",
+))
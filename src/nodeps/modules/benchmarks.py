@@ -0,0 +1,446 @@
+"""Benchmarks Module."""
+__all__ = (
+    "Benchmark",
+    "benchmark",
+    "benchmark_cache",
+    "benchmark_giturl",
+    "giturl_corpus",
+)
+
+import ast
+import dataclasses
+import importlib
+import itertools
+import json
+import pathlib
+import pkgutil
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterable
+
+from . import constants
+from .constants import (
+    BENCHMARK_BUDGETS,
+    CACHE_BENCHMARK_NUMBER,
+    GITURL_BENCHMARK_SIZE,
+    NODEPS_EXECUTABLE,
+    NODEPS_PROJECT_NAME,
+)
+from .errors import InvalidArgumentError
+from .functions import stdout
+from .gh import GitUrl
+
+_SITE_INACTIVE = (
+    "import site; _addpackage = site.addpackage; "
+    f"site.addpackage = lambda d, n, k: k if n == '{NODEPS_PROJECT_NAME}.pth' else _addpackage(d, n, k); "
+    "site.main(); "
+)
+"""Runs :func:`site.main` (interpreter started with -S) skipping ``nodeps.pth``."""
+_SITE_ACTIVE = "import site; site.main(); "
+"""Runs :func:`site.main` (interpreter started with -S) with ``nodeps.pth``."""
+_IMPORT = (
+    "import sys, time; start = time.perf_counter(); import {name}; "
+    "print((time.perf_counter() - start) * 1000)"
+)
+"""Prints the milliseconds to import a module."""
+_GITURL_CORPUS = ("test_giturl_parse.py", "test_giturl_rewrite.py")
+"""Test files in the ``tests`` directory of the repository with the ``*_URLS`` urls used by :func:`giturl_corpus`."""
+
+
+@dataclasses.dataclass
+class Benchmark:
+    """Benchmark results.
+
+    Examples:
+        >>> from nodeps import Benchmark
+        >>>
+        >>> b = Benchmark(results={"import nodeps": 7.5}, budgets={"import nodeps": 5})
+        >>> b.exceeded
+        {'import nodeps': (7.5, 5)}
+        >>> b.json()
+        '{"budgets": {"import nodeps": 5}, "errors": {}, "exceeded": ["import nodeps"], "info": {}, \
+"results": {"import nodeps": 7.5}}'
+
+    Attributes:
+        budgets: budgets by name, same units as results
+        errors: errors by name, for measurements which could not be done (i.e.: module not installed)
+        info: information to compare reports, i.e.: commit and corpus size
+        results: milliseconds by name for :func:`benchmark`, see :func:`benchmark_giturl` for its units
+    """
+    budgets: dict[str, float] = dataclasses.field(default_factory=dict)
+    errors: dict[str, str] = dataclasses.field(default_factory=dict)
+    info: dict[str, str | int] = dataclasses.field(default_factory=dict)
+    results: dict[str, float] = dataclasses.field(default_factory=dict)
+
+    @property
+    def exceeded(self) -> dict[str, tuple[float, float]]:
+        """Results which exceed the budget: name and (result, budget)."""
+        return {
+            key: (value, self.budgets[key])
+            for key, value in self.results.items()
+            if key in self.budgets and value > self.budgets[key]
+        }
+
+    def json(self, file: pathlib.Path | str | None = None) -> str:
+        """JSON report, optionally written to file."""
+        rv = json.dumps({
+            "budgets": self.budgets,
+            "errors": self.errors,
+            "exceeded": list(self.exceeded),
+            "info": self.info,
+            "results": self.results,
+        }, sort_keys=True)
+        if file is not None:
+            pathlib.Path(file).write_text(rv)
+        return rv
+
+
+def _run(code: str, executable: str, pth: bool = True) -> tuple[float, str]:
+    """Runs code with a new interpreter, returns wall time in milliseconds and stdout."""
+    start = time.perf_counter()
+    p = subprocess.run([executable, "-S", "-c", f"{_SITE_ACTIVE if pth else _SITE_INACTIVE}{code}"],
+                       capture_output=True, text=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    if p.returncode != 0:
+        raise InvalidArgumentError(p.stderr.strip().splitlines()[-1] if p.stderr.strip() else p.returncode)
+    return elapsed, p.stdout
+
+
+def _measurements(executable: str) -> dict:
+    """Measurement functions by name."""
+    def _import(name):
+        return lambda: float(_run(_IMPORT.format(name=name), executable, pth=False)[1].splitlines()[-1])
+
+    def _cli(name):
+        code = f"from {NODEPS_PROJECT_NAME}.__main__ import {name}; {name}(['--help'])"
+        return lambda: _run(code, executable)[0]
+
+    extras = importlib.import_module(f"{NODEPS_PROJECT_NAME}.extras")
+
+    return {
+        "python": lambda: _run("pass", executable, pth=False)[0],
+        f"python {NODEPS_PROJECT_NAME}.pth": lambda: _run("pass", executable)[0],
+        f"import {NODEPS_PROJECT_NAME}": _import(NODEPS_PROJECT_NAME),
+        f"import {NODEPS_PROJECT_NAME}.modules": _import(f"{NODEPS_PROJECT_NAME}.modules"),
+        **{
+            f"import {extras.__name__}.{item.name}": _import(f"{extras.__name__}.{item.name}")
+            for item in pkgutil.iter_modules(extras.__path__) if not item.name.startswith("_")
+        },
+        f"{NODEPS_EXECUTABLE} --help": _cli("project_p"),
+        "g --help": _cli("gh_g"),
+    }
+
+
+def benchmark(
+    names: Iterable[str] | None = None,
+    budgets: dict[str, float] | None = None,
+    executable: str = sys.executable,
+    repeat: int = 5,
+) -> Benchmark:
+    """Measures startup and import time in milliseconds, the best of ``repeat`` runs with new interpreters.
+
+    Measurements:
+        - ``python``: bare interpreter start without ``nodeps.pth``.
+        - ``python nodeps.pth``: interpreter start with ``nodeps.pth``.
+        - ``nodeps.pth``: difference between the two above.
+        - ``import nodeps``, ``import nodeps.modules`` and ``import nodeps.extras.*``: import time
+          (without ``nodeps.pth``).
+        - ``p --help`` and ``g --help``: entry points (with ``nodeps.pth``).
+
+    Examples:
+        >>> from nodeps import benchmark
+        >>>
+        >>> b = benchmark(["import nodeps"], budgets={"import nodeps": 10_000}, repeat=1)
+        >>> assert list(b.results) == ["import nodeps"]
+        >>> assert b.exceeded == {}
+
+    Args:
+        names: measurements to run (default: all)
+        budgets: budgets in milliseconds by name (default: :data:`BENCHMARK_BUDGETS`)
+        executable: python executable
+        repeat: number of runs
+
+    Raises:
+        InvalidArgumentError: if a name is not a valid measurement.
+
+    Returns:
+        Benchmark results.
+    """
+    measurements = _measurements(executable)
+    pth = f"{NODEPS_PROJECT_NAME}.pth"
+    valid = [*measurements, pth]
+    names = valid if names is None else list(names)
+    if invalid := [name for name in names if name not in valid]:
+        msg = f"Invalid measurement names: {invalid}, valid: {valid}"
+        raise InvalidArgumentError(msg)
+
+    rv = Benchmark(budgets=BENCHMARK_BUDGETS.copy() if budgets is None else budgets)
+    needed = {*names, *(("python", f"python {pth}") if pth in names else ())}
+    for name, func in measurements.items():
+        if name not in needed:
+            continue
+        try:
+            rv.results[name] = min(func() for _ in range(repeat))
+        except (InvalidArgumentError, ValueError, IndexError) as exception:
+            rv.errors[name] = str(exception)
+    if pth in names and "python" in rv.results and f"python {pth}" in rv.results:
+        rv.results[pth] = max(rv.results[f"python {pth}"] - rv.results["python"], 0.0)
+    rv.results = {key: rv.results[key] for key in names if key in rv.results}
+    return rv
+
+
+def benchmark_cache(
+    number: int = CACHE_BENCHMARK_NUMBER,
+    budgets: dict[str, float] | None = None,
+    repeat: int = 3,
+) -> Benchmark:
+    """Measures :func:`nodeps.extras.pickle.cache` hit latency in microseconds per call with typical arguments.
+
+    Time results are the best of ``repeat`` runs of ``number`` calls, after a first call which is cached.
+
+    Measurements:
+        - ``cache hit int``: two ints.
+        - ``cache hit str``: a str and a str keyword argument.
+        - ``cache hit dict``: a dict with 50 str keys and lists of 10 ints.
+        - ``cache hit object``: an instance without ``__hash__``, keyed with :func:`jsonpickle.encode`.
+        - ``cache jsonpickle dict``: :func:`jsonpickle.encode` of the ``cache hit dict`` arguments,
+          which was the key of every call before the hash and fingerprint keys.
+
+    Examples:
+        >>> from nodeps import benchmark_cache
+        >>>
+        >>> b = benchmark_cache(100, repeat=1)  # doctest: +SKIP
+        >>> assert b.results["cache hit int"] < b.results["cache hit dict"]  # doctest: +SKIP
+
+    Args:
+        number: number of calls
+        budgets: budgets in microseconds by name (default: none)
+        repeat: number of runs
+
+    Returns:
+        Benchmark results, with python and number of calls in info, or errors if ``nodeps[pickle]`` extras
+        are not installed.
+    """
+
+    class Object:
+        def __init__(self, a):
+            self.a = a
+
+    args = {
+        "cache hit int": ((1, 2), {}),
+        "cache hit str": (("nodeps",), {"version": "3.11"}),
+        "cache hit dict": (({str(i): list(range(10)) for i in range(50)},), {}),
+        "cache hit object": ((Object({"a": 1}),), {}),
+    }
+    rv = Benchmark(budgets={} if budgets is None else budgets, info={
+        "number": number,
+        "python": platform.python_version(),
+    })
+    try:
+        import jsonpickle  # type: ignore[attr-defined]  # noqa: PLC0415
+
+        from ..extras.pickle import cache  # noqa: PLC0415
+        func = cache(lambda *args, **kwargs: args)
+    except ImportError as exception:
+        rv.errors = {name: str(exception) for name in [*args, "cache jsonpickle dict"]}
+        return rv
+
+    for name, (a, kw) in args.items():
+        func(*a, **kw)
+        rv.results[name] = min(timeit.repeat(lambda a=a, kw=kw: func(*a, **kw), number=number, repeat=repeat)) \
+            * 1_000_000 / number
+    a, kw = args["cache hit dict"]
+    rv.results["cache jsonpickle dict"] = min(timeit.repeat(lambda: jsonpickle.encode((a, kw)), number=number,
+                                                            repeat=repeat)) * 1_000_000 / number
+    return rv
+
+
+def _giturl_seeds(files: Iterable[pathlib.Path | str]) -> list[str]:
+    """Urls in the literal ``*_URLS`` assignments of the files, without importing them."""
+
+    def walk(value):
+        if isinstance(value, tuple | list):
+            for item in value:
+                yield from walk(item)
+        elif isinstance(value, str) and ":" in value and not any(c.isspace() for c in value):
+            yield value
+
+    rv = {}
+    for file in files:
+        for node in ast.parse(pathlib.Path(file).read_text()).body:
+            if isinstance(node, ast.Assign) and any(
+                    isinstance(target, ast.Name) and target.id.endswith("_URLS") for target in node.targets
+            ):
+                try:
+                    rv.update(dict.fromkeys(walk(ast.literal_eval(node.value))))
+                except ValueError:
+                    continue
+    return list(rv)
+
+
+def _giturl_files(files: Iterable[pathlib.Path | str] | None) -> list[pathlib.Path | str]:
+    """Files for :func:`giturl_corpus`, default the GitUrl parse and rewrite tests of the repository."""
+    if files is not None:
+        return list(files)
+    if (top := constants.NODEPS_TOP) is None or not (top / "tests" / _GITURL_CORPUS[0]).is_file():
+        msg = f"GitUrl tests not found, files must be provided: {_GITURL_CORPUS}"
+        raise InvalidArgumentError(msg)
+    return [top / "tests" / file for file in _GITURL_CORPUS]
+
+
+def giturl_corpus(size: int = GITURL_BENCHMARK_SIZE, files: Iterable[pathlib.Path | str] | None = None) -> list[str]:
+    """Urls of the GitUrl tests scaled up to size with synthetic repository names.
+
+    The test urls are used as they are first, and then repeated with a number appended to the repository name
+    (or to the url if it is not valid), so the urls are unique and :meth:`nodeps.GitUrl.parse` cache is not hit.
+
+    Examples:
+        >>> from nodeps import giturl_corpus
+        >>>
+        >>> urls = giturl_corpus(10_000)  # doctest: +SKIP
+        >>> assert len(urls) == len(set(urls)) == 10_000  # doctest: +SKIP
+        >>> assert "git@github.com:Org/Repo1.git" in urls  # doctest: +SKIP
+
+    Args:
+        size: number of urls
+        files: test files with the ``*_URLS`` tuples (default: GitUrl parse and rewrite tests of the repository)
+
+    Raises:
+        InvalidArgumentError: if no files are provided and the repository tests are not found, or no urls are found.
+
+    Returns:
+        List of urls.
+    """
+    files = _giturl_files(files)
+    if not (seeds := _giturl_seeds(files)):
+        msg = f"No urls found: {files=}"
+        raise InvalidArgumentError(msg)
+
+    templates = []
+    for url in seeds:
+        try:
+            record = GitUrl.parse(url)
+        except InvalidArgumentError:
+            record = None
+        head, tail = url, ""
+        if record is not None and record.repo:
+            base = url.removesuffix(record.path_raw) if record.path_raw else url
+            start, sep, end = base.rpartition(record.repo)
+            if sep:
+                head, tail = f"{start}{sep}", f"{end}{url[len(base):]}"
+        templates.append((head, tail))
+
+    rv = seeds[:size]
+    for number in itertools.count(1):
+        for head, tail in templates:
+            if len(rv) >= size:
+                return rv
+            rv.append(f"{head}{number}{tail}")
+    return rv
+
+
+def benchmark_giturl(
+    size: int = GITURL_BENCHMARK_SIZE,
+    files: Iterable[pathlib.Path | str] | None = None,
+    budgets: dict[str, float] | None = None,
+    repeat: int = 3,
+) -> Benchmark:
+    """Measures :class:`nodeps.GitUrl` parse and rewrite throughput, and memory, with :func:`giturl_corpus` urls.
+
+    The parse cache is cleared before each run, and time results are the best of ``repeat`` runs.
+
+    Measurements:
+        - ``giturl parse``: microseconds per url of :meth:`nodeps.GitUrl.parse`.
+        - ``giturl init``: microseconds per url to create :class:`nodeps.GitUrl` instances.
+        - ``giturl parse_many``: microseconds per url of :meth:`nodeps.GitUrl.parse_many`.
+        - ``giturl rewrite``: microseconds per valid url for ``normalized`` and the five ``url2*`` properties.
+        - ``giturl memory``: bytes allocated per :class:`nodeps.GitUrl` instance, including its parsed record.
+
+    Examples:
+        >>> from nodeps import benchmark_giturl
+        >>>
+        >>> b = benchmark_giturl(1_000, repeat=1)  # doctest: +SKIP
+        >>> assert b.info["size"] == 1_000 and "giturl parse" in b.results  # doctest: +SKIP
+
+    Args:
+        size: number of urls
+        files: test files with the ``*_URLS`` tuples (default: GitUrl parse and rewrite tests of the repository)
+        budgets: budgets by name, in the units of the results (default: none)
+        repeat: number of runs
+
+    Returns:
+        Benchmark results, with commit, python, number of seeds, urls and valid urls in info.
+    """
+    files = _giturl_files(files)
+    urls = giturl_corpus(size, files)
+    parse = GitUrl.parse
+    rewrites = ("normalized", "url2git", "url2githttps", "url2gitssh", "url2https", "url2ssh")
+
+    def instances(data: list[str]) -> list[GitUrl]:
+        rv = []
+        for url in data:
+            try:
+                rv.append(GitUrl(url))
+            except InvalidArgumentError:
+                continue
+        return rv
+
+    def parse_all(data: list[str]) -> None:
+        for url in data:
+            try:
+                parse(url)
+            except InvalidArgumentError:
+                continue
+
+    def rewrite_all(objs: list[GitUrl]) -> None:
+        for obj in objs:
+            for attr in rewrites:
+                try:
+                    getattr(obj, attr)
+                except KeyError:
+                    continue
+
+    def best(func: Callable, count: int, prepare: Callable[[], list]) -> float:
+        """Best microseconds per item, the cache is cleared and the argument prepared before each run."""
+        rv = []
+        for _ in range(repeat):
+            parse.cache_clear()
+            data = prepare()
+            start = time.perf_counter()
+            func(data)
+            rv.append((time.perf_counter() - start) * 1_000_000 / count)
+        return min(rv)
+
+    valid = []
+    for url in urls:
+        try:
+            if (record := parse(url)) is not None and record.domain and record.repo:
+                valid.append(url)
+        except InvalidArgumentError:
+            continue
+
+    rv = Benchmark(budgets={} if budgets is None else budgets, info={
+        "commit": (stdout(f"git -C '{top}' rev-parse HEAD") or "") if (top := constants.NODEPS_TOP) else "",
+        "python": platform.python_version(),
+        "seeds": len(_giturl_seeds(files)),
+        "size": len(urls),
+        "valid": len(valid),
+    })
+    rv.results["giturl parse"] = best(parse_all, len(urls), lambda: urls)
+    rv.results["giturl init"] = best(instances, len(urls), lambda: urls)
+    rv.results["giturl parse_many"] = best(GitUrl.parse_many, len(urls), lambda: urls)
+    rv.results["giturl rewrite"] = best(rewrite_all, len(valid), lambda: instances(valid))
+
+    parse.cache_clear()
+    tracemalloc.start()
+    try:
+        objs = instances(urls)
+        rv.results["giturl memory"] = tracemalloc.get_traced_memory()[0] / max(len(objs), 1)
+    finally:
+        tracemalloc.stop()
+        parse.cache_clear()
+    return rv
@@ -0,0 +1,317 @@
+"""Daemon Module.
+
+Resident server (``p --daemon``) with ``nodeps.__main__`` imported, which runs the ``p`` and ``g`` commands
+forwarded by the client, and caches :class:`nodeps.Project`, :class:`nodeps.Gh` and :class:`nodeps.GitUrl`
+instances between commands.
+
+The client sends argv, cwd and environment, and passes its stdin, stdout and stderr file descriptors,
+so output (including subprocesses) goes directly to the client terminal. Commands are run one at a time,
+the daemon replies :data:`_LOCAL` and the client runs the command itself when the daemon is busy, or when the
+client environment variables read on import (:data:`_ENVIRON`) differ from the daemon's.
+
+The socket is created in a private (0700) directory, and both ends check that the other end is the same user
+before the environment and file descriptors are sent.
+"""
+__all__ = (
+    "client_gh_g",
+    "client_project_p",
+    "daemon_client",
+    "daemon_serve",
+)
+
+import contextlib
+import inspect
+import json
+import os
+import pathlib
+import socket
+import struct
+import sys
+import threading
+import traceback
+
+from .constants import DAEMON_SOCKET
+
+_APPS = {"g": "gh_g", "p": "project_p"}
+"""Client app name to ``nodeps.__main__`` Typer."""
+_ENVIRON = ("CI", "GH_TOKEN", "GIT", "GITHUB_TOKEN", "GITHUB_WORKSPACE", "PICKLE_MAXSIZE", "PYTHON_DEFAULT_VERSION",
+            "TOKEN", "USER")
+"""Environment variables read by :mod:`nodeps.modules.constants` when imported."""
+_LOCAL = b"local"
+"""Daemon reply for the client to run the command, if the daemon is busy or :data:`_ENVIRON` values differ."""
+_SERVING = False
+"""True while :func:`daemon_serve` is running in this process."""
+
+
+def _peer_uid(s: socket.socket) -> int | None:
+    """Uid of the process at the other end of the unix socket, or None if not supported by the platform."""
+    if hasattr(socket, "SO_PEERCRED"):
+        return struct.unpack("3i", s.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")))[1]
+    return None
+
+
+def _private(path: pathlib.Path) -> bool:
+    """Socket and its directory are owned by the user, and the directory is not accessible by others."""
+    try:
+        directory, file = path.parent.stat(), path.lstat()
+    except OSError:
+        return False
+    return directory.st_uid == file.st_uid == os.getuid() and not directory.st_mode & 0o077
+
+
+def daemon_client(app: str, argv: list[str] | None = None, path: str = DAEMON_SOCKET) -> int | None:
+    """Runs the command with the daemon if it is running.
+
+    Examples:
+        >>> from nodeps import daemon_client
+        >>>
+        >>> assert daemon_client("p", ["--help"], path="/nonexistent.sock") is None
+
+    Args:
+        app: "p" or "g"
+        argv: arguments (default: sys.argv[1:])
+        path: daemon unix socket path
+
+    Returns:
+        Exit code or None if the daemon is not running or busy, or the command is ``p --daemon``.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if (app == "p" and "--daemon" in argv) or not pathlib.Path(path).exists():
+        return None
+    if not _private(pathlib.Path(path)):
+        print(f"{path}: not owned by the user or directory not private, running without the daemon",
+              file=sys.stderr)
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            return None
+        if _peer_uid(s) not in (None, os.getuid()):
+            return None
+        socket.send_fds(s, [b"\0"], [sys.stdin.fileno(), sys.stdout.fileno(), sys.stderr.fileno()])
+        s.sendall(json.dumps({
+            "app": app,
+            "argv": argv,
+            "cwd": str(pathlib.Path.cwd()),
+            "env": dict(os.environ),
+        }).encode())
+        s.shutdown(socket.SHUT_WR)
+        rv = b"".join(iter(lambda: s.recv(1024), b""))
+    if rv == _LOCAL:
+        return None
+    return int(rv) if rv else 1
+
+
+def client_gh_g() -> None:
+    """``g`` entry point, runs with the daemon if running."""
+    if (rv := daemon_client("g")) is None:
+        from nodeps.__main__ import gh_g  # noqa: PLC0415
+
+        rv = gh_g()
+    sys.exit(rv)
+
+
+def client_project_p() -> None:
+    """``p`` entry point, runs with the daemon if running."""
+    if (rv := daemon_client("p")) is None:
+        from nodeps.__main__ import project_p  # noqa: PLC0415
+
+        rv = project_p()
+    sys.exit(rv)
+
+
+def _cached(cls: type) -> type:
+    """Memoizes instances by arguments and cwd, while the files they are built from are not modified.
+
+    Passing ``rm=True`` or modifying ``pyproject.toml`` or ``.git`` creates a new instance.
+    The client environment is not part of the key: requests are only served when the :data:`_ENVIRON` values,
+    which are used by the instances, are the same as the daemon's.
+    """
+    memo = {}
+
+    def stamp(instance) -> tuple[int, ...]:
+        paths = [getattr(instance, "_path", None), getattr(instance, "root", None)]
+        if pyproject_toml := getattr(instance, "pyproject_toml", None):
+            paths.append(pyproject_toml.file)
+        rv = []
+        for item in paths:
+            if item is not None:
+                path = pathlib.Path(item)
+                path = path / ".git" if path.is_dir() else path
+                rv.append(path.stat().st_mtime_ns if path.exists() else 0)
+        return tuple(rv)
+
+    def wrapper(*args, **kwargs):
+        try:
+            key = (pathlib.Path.cwd(), args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return cls(*args, **kwargs)
+        if not kwargs.get("rm") and (value := memo.get(key)) and value[1] == stamp(value[0]):
+            return value[0]
+        instance = cls(*args, **kwargs)
+        memo[key] = (instance, stamp(instance))
+        return instance
+
+    wrapper.__wrapped__ = cls
+    return wrapper
+
+
+def _run(request: dict, fds: list[int]) -> int:
+    """Runs the command with the client cwd, environment, stdin, stdout and stderr.
+
+    Arguments which default to the cwd when the commands are defined default to the client cwd.
+    """
+    import nodeps.__main__ as main  # noqa: PLC0415
+
+    app = getattr(main, _APPS[request["app"]])
+    default_map = {}
+    for cmd_name, info in app.table.items():
+        defaults = {
+            name: request["cwd"]
+            for name, parameter in inspect.signature(info.callback).parameters.items()
+            if parameter.default is main._cwd
+        }
+        if defaults:
+            default_map[cmd_name] = defaults
+
+    cwd, environ = pathlib.Path.cwd(), dict(os.environ)
+    saved = [os.dup(fd) for fd in range(3)]
+    try:
+        os.environ.clear()
+        os.environ.update(request["env"])
+        for file in (sys.stdout, sys.stderr):
+            file.flush()
+        for fd, new in enumerate(fds):
+            os.dup2(new, fd)
+        try:
+            os.chdir(request["cwd"])
+            main.typer.main.get_command(app).main(
+                args=request["argv"], prog_name=request["app"], standalone_mode=True, default_map=default_map,
+            )
+        except SystemExit as exception:
+            return exception.code if isinstance(exception.code, int) else int(exception.code is not None)
+        except FileNotFoundError as exception:
+            print(f"{request['app']}: {exception}", file=sys.stderr)
+            return 1
+        except Exception:  # noqa: BLE001
+            traceback.print_exc()
+            return 1
+        return 0
+    finally:
+        for file in (sys.stdout, sys.stderr):
+            file.flush()
+        for fd, old in enumerate(saved):
+            os.dup2(old, fd)
+            os.close(old)
+        os.environ.clear()
+        os.environ.update(environ)
+        os.chdir(cwd)
+
+
+def _alive(path: pathlib.Path) -> bool:
+    """A daemon is listening on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def _receive_fds(conn: socket.socket) -> list[int]:
+    """Client stdin, stdout and stderr file descriptors, if the client is the same user.
+
+    Empty if the client closed the connection without sending anything (i.e.: :func:`_alive`).
+    """
+    if (uid := _peer_uid(conn)) not in (None, os.getuid()):
+        msg = f"peer uid {uid} is not {os.getuid()}"
+        raise PermissionError(msg)
+    data, fds, _, _ = socket.recv_fds(conn, 1, 3)
+    if not data:
+        return fds
+    if len(fds) != 3:  # noqa: PLR2004
+        for fd in fds:
+            os.close(fd)
+        msg = f"expected stdin, stdout and stderr file descriptors, received {len(fds)}"
+        raise ValueError(msg)
+    return fds
+
+
+def _serve(conn: socket.socket, busy: threading.Lock, environ: dict[str, str | None], log) -> None:
+    """Serves one connection, in its own thread, errors in the request are reported in the daemon log.
+
+    Replies :data:`_LOCAL` if other request is running or the :data:`_ENVIRON` values are not ``environ``.
+    """
+    fds, rv = [], b"1"
+    try:
+        if not (fds := _receive_fds(conn)):
+            return
+        request = json.loads(b"".join(iter(lambda: conn.recv(65536), b"")))
+        if {name: request["env"].get(name) for name in _ENVIRON} != environ or not busy.acquire(blocking=False):
+            rv = _LOCAL
+        else:
+            try:
+                rv = str(_run(request, fds)).encode()
+            finally:
+                busy.release()
+        print(f"{request['app']} {' '.join(request['argv'])}: {rv.decode()}", file=log)
+    except Exception:  # noqa: BLE001
+        traceback.print_exc(file=log)
+    finally:
+        for fd in fds:
+            os.close(fd)
+        with contextlib.suppress(OSError):
+            conn.sendall(rv)
+        conn.close()
+
+
+def daemon_serve(path: str = DAEMON_SOCKET) -> None:
+    """Serves ``p`` and ``g`` commands forwarded by :func:`daemon_client`, until interrupted.
+
+    Args:
+        path: daemon unix socket path
+
+    Raises:
+        RuntimeError: if already serving in this process (i.e.: ``p --daemon`` forwarded to the daemon),
+            or another daemon is listening on the socket.
+    """
+    global _SERVING  # noqa: PLW0603
+    import nodeps.modules  # noqa: PLC0415
+
+    path = pathlib.Path(path)
+    if _SERVING or _alive(path):
+        msg = f"{path}: daemon already running"
+        raise RuntimeError(msg)
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if (stat := path.parent.stat()).st_uid != os.getuid() or stat.st_mode & 0o077:
+        msg = f"{path.parent}: must be owned by the user and not accessible by others (0700)"
+        raise PermissionError(msg)
+    path.unlink(missing_ok=True)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        umask = os.umask(0o177)
+        try:
+            s.bind(str(path))
+        finally:
+            os.umask(umask)
+        s.listen()
+        print(f"Listening on {path}", file=sys.stderr)
+        busy, environ = threading.Lock(), {name: os.environ.get(name) for name in _ENVIRON}
+        log = os.fdopen(os.dup(sys.stderr.fileno()), "w", buffering=1)
+        classes = {name: getattr(nodeps.modules, name) for name in ("GitUrl", "Gh", "Project")}
+        _SERVING = True
+        try:
+            for name, cls in classes.items():
+                setattr(nodeps.modules, name, _cached(cls))
+            while True:
+                conn, _ = s.accept()
+                threading.Thread(target=_serve, args=(conn, busy, environ, log), daemon=True).start()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            log.close()
+            path.unlink(missing_ok=True)
+            for name, cls in classes.items():
+                setattr(nodeps.modules, name, cls)
+            _SERVING = False
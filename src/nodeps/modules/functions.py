@@ -62,6 +62,7 @@ __all__ = (
     "to_latin9",
     "tomodules",
     "urljson",
+    "urljson_many",
     "varname",
     "which",
     "yield_if",
@@ -71,10 +72,13 @@ __all__ = (
 import asyncio
 import builtins
 import collections
+import concurrent.futures
 import contextlib
 import fnmatch
 import getpass
 import grp
+import gzip
+import http.client
 import importlib.util
 import inspect
 import io
@@ -84,27 +88,31 @@ import pickle
 import pwd
 import re
 import shutil
+import ssl
 import subprocess
 import sys
 import sysconfig
 import tarfile
 import tempfile
 import textwrap
+import threading
 import time
 import types
+import urllib.error
+import urllib.parse
 import urllib.request
 from collections.abc import Callable, Generator, Iterable, Iterator, MutableMapping
 from typing import TYPE_CHECKING, Any, AnyStr, Literal, ParamSpec, TextIO, TypeVar, Union, cast
 
+from . import constants
 from .constants import (
     EXECUTABLE,
-    EXECUTABLE_SITE,
     GITHUB_TOKEN,
     MACOS,
     NODEPS_PROJECT_NAME,
-    PW_ROOT,
-    PW_USER,
     SUDO,
+    URLJSON_TIMEOUT,
+    URLJSON_WORKERS,
     USER,
 )
 from .datas import GroupUser, IdName
@@ -115,7 +123,18 @@ if TYPE_CHECKING:
     from .typings import ExcType, PathIsLiteral, RunningLoop
 
 _KT = TypeVar("_KT")
+_LOOPBACK = frozenset({"127.0.0.1", "::1", "localhost"})
+"""Hosts allowed with http by :func:`urljson`."""
+_POOL: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+"""Idle keep-alive connections by scheme and host, used by :func:`urljson`."""
+_POOL_LOCK = threading.Lock()
+_POOL_MAXSIZE = URLJSON_WORKERS
+"""Maximum idle connections kept in :data:`_POOL` by scheme and host, the rest are closed when released."""
+_REDIRECTS = 5
+_SSL_CONTEXT: ssl.SSLContext | None = None
 _T = TypeVar("_T")
+_URLJSON_PICKLE_VERSION = "etag"
+"""Pickle version of :func:`urljson` responses cached as ``(etag, data)``, discards responses cached without it."""
 _VT = TypeVar("_VT")
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -177,7 +196,7 @@ async def aiocommand(
         CompletedProcess.
     """
     proc = await asyncio.create_subprocess_shell(
-        data, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, loop=asyncio.get_running_loop()
+        data, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
     )
     out, err = await proc.communicate()
     if decode:
@@ -486,7 +505,7 @@ def cmdrun(
         m = "-m"
         if isinstance(data, str) and data.startswith("/"):
             m = ""
-        data = f"{EXECUTABLE_SITE if pysite else EXECUTABLE} {m} {data}"
+        data = f"{constants.EXECUTABLE_SITE if pysite else EXECUTABLE} {m} {data}"
     elif not shell:
         data = toiter(data)
 
@@ -1153,11 +1172,12 @@ def group_user(data: int | str = USER) -> GroupUser:
     Returns:
         GroupUser.
     """
+    pw_user, pw_root = constants.PW_USER, constants.PW_ROOT
     if isinstance(data, str):
-        struct = struct if data == (struct := PW_USER).pw_name or data == (struct := PW_ROOT).pw_name \
+        struct = struct if data == (struct := pw_user).pw_name or data == (struct := pw_root).pw_name \
             else pwd.getpwnam(data)  # noqa: PLR1714
     else:
-        struct = struct if data == (struct := PW_USER).pw_uid or data == (struct := PW_ROOT).pw_uid \
+        struct = struct if data == (struct := pw_user).pw_uid or data == (struct := pw_root).pw_uid \
             else pwd.getpwuid(data)  # noqa: PLR1714
     group = IdName(id=struct.pw_gid, name=grp.getgrgid(struct.pw_gid).gr_name)
     user = IdName(id=struct.pw_uid, name=struct.pw_name)
@@ -1656,12 +1676,110 @@ def tomodules(obj: Any, suffix: bool = True) -> str:
     return ".".join(i.removesuffix(Path(i).suffix if suffix else "") for i in toiter(obj, split=split))
 
 
+def _urlget(url: str, headers: dict[str, str], timeout: float) -> tuple[int, http.client.HTTPMessage, bytes]:
+    """GET with a keep-alive connection from the pool, following redirects and decoding gzip.
+
+    Urls for which a proxy is configured are opened with :func:`urllib.request.urlopen`, and the rest
+    with :func:`_urlpool`. The ``Authorization`` header is not sent after a redirect to another scheme or host.
+
+    Raises:
+        urllib.error.HTTPError: if status is 400 or higher.
+        urllib.error.URLError: if the connection fails.
+
+    Returns:
+        Status, headers and body.
+    """
+    for _ in range(_REDIRECTS + 1):
+        split = urllib.parse.urlsplit(url)
+        if split.scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(split.hostname or ""):
+            try:
+                with urllib.request.urlopen(urllib.request.Request(url, headers=headers),  # noqa: S310
+                                            timeout=timeout) as response:
+                    status, reason, message, body = response.status, response.reason, response.headers, response.read()
+            except urllib.error.HTTPError as err:
+                if err.code != 304:  # noqa: PLR2004
+                    raise
+                status, reason, message, body = err.code, err.reason, err.headers, b""
+        else:
+            status, reason, message, body = _urlpool(split, headers, timeout)
+
+        if message.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        if status in (301, 302, 303, 307, 308) and (location := message.get("Location")):
+            url = urllib.parse.urljoin(url, location)
+            if urllib.parse.urlsplit(url)[:2] != split[:2]:
+                headers = {key: value for key, value in headers.items() if key.lower() != "authorization"}
+            continue
+        if status >= 400:  # noqa: PLR2004
+            raise urllib.error.HTTPError(url, status, reason, message, io.BytesIO(body))
+        return status, message, body
+    msg = f"Too many redirects: {url}"
+    raise urllib.error.URLError(msg)
+
+
+def _urlpool(
+        split: urllib.parse.SplitResult, headers: dict[str, str], timeout: float
+) -> tuple[int, str, http.client.HTTPMessage, bytes]:
+    """GET with a keep-alive connection from :data:`_POOL`.
+
+    Connections are returned to the pool unless the server closes them or there are already
+    :data:`_POOL_MAXSIZE` idle connections to the host, and a request in a reused connection
+    is retried once in a new one if the server closed it while idle.
+
+    Raises:
+        urllib.error.URLError: if the connection fails.
+
+    Returns:
+        Status, reason, headers and body.
+    """
+    global _SSL_CONTEXT  # noqa: PLW0603
+
+    key = (split.scheme, split.netloc)
+    with _POOL_LOCK:
+        conn = _POOL[key].pop() if _POOL.get(key) else None
+    for reused in (True, False) if conn else (False,):
+        if not reused:
+            if split.scheme == "https":
+                _SSL_CONTEXT = _SSL_CONTEXT or ssl.create_default_context()
+                conn = http.client.HTTPSConnection(split.hostname, split.port, timeout=timeout,
+                                                   context=_SSL_CONTEXT)
+            else:
+                conn = http.client.HTTPConnection(split.hostname, split.port, timeout=timeout)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        try:
+            conn.request("GET", f"{split.path or '/'}{'?' if split.query else ''}{split.query}",
+                         headers=headers)
+            response = conn.getresponse()
+            rv = response.status, response.reason, response.headers, response.read()
+            break
+        except (http.client.HTTPException, OSError) as exception:
+            conn.close()
+            if not reused:
+                if isinstance(exception, OSError):
+                    raise
+                raise urllib.error.URLError(exception) from exception
+    with _POOL_LOCK:
+        if not response.will_close and len(idle := _POOL.setdefault(key, [])) < _POOL_MAXSIZE:
+            idle.append(conn)
+            conn = None
+    if conn is not None:
+        conn.close()
+    return rv
+
+
 def urljson(
         data: str,
         rm: bool = False,
+        timeout: float = URLJSON_TIMEOUT,
 ) -> dict:
     """Url open json.
 
+    Connections are kept alive and reused by host, and responses are requested with gzip.
+    The ``ETag`` is cached in the same pickle as the response, so a refresh (``rm=True``) is a conditional request
+    which only downloads the response if it changed.
+
     Examples:
         >>> import os
         >>> from nodeps import urljson
@@ -1675,27 +1793,83 @@ def urljson(
         >>>
         >>> pypi = urljson(f"https://pypi.org/pypi/{NODEPS_PROJECT_NAME}/json")
         >>> assert pypi['info']['name'] == NODEPS_PROJECT_NAME
+        >>> assert urljson(f"https://pypi.org/pypi/{NODEPS_PROJECT_NAME}/json", rm=True) == pypi
 
     Args:
-        data: url
-        rm: use pickle cache or remove it before
+        data: url, https or http for a loopback host (i.e.: a local server in tests)
+        rm: use pickle cache or revalidate it with the cached ``ETag`` (or remove it if no ``ETag``)
+        timeout: seconds to connect and for each read (default: :data:`nodeps.URLJSON_TIMEOUT`)
+
+    Raises:
+        ValueError: if the url is not https or a loopback http url.
+        urllib.error.HTTPError: if status is 400 or higher.
+        urllib.error.URLError: if the connection fails.
 
     Returns:
         dict:
     """
-    if not rm and (rv := Path.pickle(name=data)):
+    etag, rv = Path.pickle(name=data, version=_URLJSON_PICKLE_VERSION) or (None, None)
+    if rv and not rm:
         return rv
 
-    if data.lower().startswith("https"):
-        request = urllib.request.Request(data)
-    else:
+    if not data.lower().startswith("https") and not (
+            data.lower().startswith("http://") and urllib.parse.urlsplit(data).hostname in _LOOPBACK
+    ):
         msg = f"Non-HTTPS URL: {data}"
         raise ValueError(msg)
+    headers = {"Accept-Encoding": "gzip"}
     if "github" in data:
-        request.add_header("Authorization", f"token {GITHUB_TOKEN}")
+        headers["Authorization"] = f"token {GITHUB_TOKEN}"
+    if rv and etag:
+        headers["If-None-Match"] = etag
+
+    status, message, body = _urlget(data, headers, timeout)
+    if status == 304 and rv:  # noqa: PLR2004
+        return rv
+    rv = json.loads(body.decode())
+    Path.pickle(name=data, data=(message.get("ETag"), rv), rm=True, version=_URLJSON_PICKLE_VERSION)
+    return rv
+
+
+def urljson_many(
+        data: Iterable[str],
+        rm: bool = False,
+        timeout: float = URLJSON_TIMEOUT,
+        workers: int = URLJSON_WORKERS,
+) -> list[dict | Exception]:
+    """Url open json of many urls with concurrent requests, sharing the cache of :func:`urljson`.
+
+    Cached urls are not requested unless ``rm``, and repeated urls are requested once.
+
+    Examples:
+        >>> from nodeps import urljson_many
+        >>> from nodeps import NODEPS_PROJECT_NAME
+        >>>
+        >>> pypi, error = urljson_many([f"https://pypi.org/pypi/{NODEPS_PROJECT_NAME}/json", "http://pypi.org"])
+        >>> assert pypi['info']['name'] == NODEPS_PROJECT_NAME
+        >>> error
+        ValueError('Non-HTTPS URL: http://pypi.org')
+
+    Args:
+        data: urls
+        rm: use pickle cache or revalidate it (see :func:`urljson`)
+        timeout: seconds to connect and for each read (default: :data:`nodeps.URLJSON_TIMEOUT`)
+        workers: maximum number of concurrent requests (default: :data:`nodeps.URLJSON_WORKERS`)
+
+    Returns:
+        Results in the same order as ``data``, or the exception raised for the url.
+    """
+    data = list(data)
+
+    def fetch(url: str) -> dict | Exception:
+        try:
+            return urljson(url, rm=rm, timeout=timeout)
+        except (OSError, ValueError) as exception:
+            return exception
 
-    with urllib.request.urlopen(request) as response:  # noqa: S310
-        return Path.pickle(name=data, data=json.loads(response.read().decode()), rm=rm)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        rv = dict(zip(urls := dict.fromkeys(data), executor.map(fetch, urls), strict=True))
+    return [rv[url] for url in data]
 
 
 def varname(index=2, lower=True, prefix=None, sep="_"):
@@ -1,38 +1,67 @@
 """GH Module."""
 __all__ = (
     "GIT_CONFIG_GLOBAL",
+    "GIT_FETCH_TTL",
+    "GITHUB_WORKERS",
+    "GITURL_CACHE_SIZE",
     "GitUrl",
+    "GitUrlRecord",
     "Gh",
     "aioclone",
+    "aiogh",
+    "aiogh_sync",
     "clone",
     "git_config_global",
 )
 
-import collections
+import asyncio
+import contextlib
 import dataclasses
+import functools
 import os
 import subprocess
 import tempfile
+import time
 import urllib.error
-from typing import ClassVar, Protocol, cast, runtime_checkable
+from collections.abc import Callable, Iterable
+from typing import ClassVar, Protocol, runtime_checkable
 
+from . import constants
 from .classes import ColorLogger
-from .constants import CI, DOCKER, EMAIL, GIT, GITHUB_TOKEN, GITHUB_URL, NODEPS_PROJECT_NAME
-from .datas import GitStatus
+from .constants import AIOGH_LIMIT, CI, EMAIL, GIT, GITHUB_TOKEN, GITHUB_URL, NODEPS_PROJECT_NAME
+from .datas import GitStatus, GitSync
 from .enums import Bump
-from .errors import InvalidArgumentError
-from .functions import aiocmd, cmd, stdout, urljson
+from .errors import CmdError, InvalidArgumentError
+from .functions import aiocmd, cmd, stdout, urljson, urljson_many
+from .gitconfig import (
+    git_branch,
+    git_dir,
+    git_global_config,
+    git_ref,
+    git_remote_url,
+    git_superproject,
+    git_tags,
+    git_top,
+)
 from .path import Path
 from .platforms import (
-    PLATFORMS,
+    PLATFORMS_INDEX,
     AssemblaPlatform,
     BasePlatform,
     BitbucketPlatform,
     FriendCodePlatform,
     GitHubPlatform,
     GitLabPlatform,
+    dispatch,
 )
 
+GITHUB_WORKERS = 16
+"""Maximum number of concurrent GitHub API requests in :meth:`GitUrl.github_many`."""
+GITURL_CACHE_SIZE = 4096
+"""Maximum number of urls in :meth:`GitUrl.parse` cache."""
+GIT_FETCH_TTL = 60
+"""Seconds since the last fetch (``FETCH_HEAD`` modification time) in which :meth:`Gh.status` with ``fetch=None``
+does not fetch, used by the status commands (i.e.: prompts)."""
 GIT_CONFIG_GLOBAL = {
     "init.defaultBranch": "main",
     "pull.rebase": "false",
@@ -50,6 +79,97 @@ class _SupportsWorkingDir(Protocol):
         return
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class GitUrlRecord:
+    """Parsed Git URL record, shared by the :class:`GitUrl` instances with the same url.
+
+    Attributes are the :class:`GitUrl` attributes set when the url matches a platform pattern.
+    """
+    _user: str = ""
+    access_token: str = ""
+    branch: str = ""
+    domain: str = ""
+    groups_path: str = ""
+    owner: str = ""
+    ownerrepo: str = ""
+    path: str = ""
+    pathname: str = ""
+    path_raw: str = ""
+    platform: str = ""
+    port: str = ""
+    protocol: str = ""
+    repo: str = ""
+    url: str = ""
+    username: str = ""
+    protocols: tuple[str, ...] = ()
+    platform_obj: (
+            AssemblaPlatform | BasePlatform | BitbucketPlatform | FriendCodePlatform | GitHubPlatform | GitLabPlatform
+            | None
+    ) = None
+
+    def format(self, protocol: str) -> str:
+        """Reformat URL to protocol.
+
+        Raises:
+            KeyError: if the platform does not support the protocol.
+        """
+        return self.platform_obj.FORMATTERS[protocol](self)
+
+
+_GITURL_RECORD_ATTRS = tuple(k for k in GitUrlRecord.__slots__ if k not in ("platform_obj", "protocols"))
+"""Attributes of :class:`GitUrlRecord` set in :class:`GitUrl` as is."""
+
+
+def _giturl_parse(url: str) -> GitUrlRecord | None:
+    """Parse url with the first platform pattern that matches.
+
+    Raises:
+        InvalidArgumentError: if git+file does not have an absolute path.
+
+    Returns:
+        Parsed record or None if no pattern matches.
+    """
+    for name, plat, protocol, regex in dispatch(url):
+        # Match current regex against URL
+        if not (match := regex.match(url)):
+            # Skip if not matched
+            continue
+
+        # Skip if domain is bad
+        domain = match.group("domain")
+
+        if plat.DOMAINS and domain not in plat.DOMAINS:
+            continue
+        if plat.SKIP_DOMAINS and domain in plat.SKIP_DOMAINS:
+            continue
+
+        # add in platform defaults and matches as dictionary
+        parsed_info = {**plat.DEFAULTS, **plat.clean_data(match.groupdict(default=""))}
+
+        owner = f"{parsed_info['owner']}/" if parsed_info.get("owner") else ""
+
+        if protocol == "ssh" and "ssh" not in parsed_info["protocols"]:
+            parsed_info["protocols"].append(protocol)
+
+        if protocol == "file" and not domain.startswith("/"):
+            raise InvalidArgumentError(url)
+
+        return GitUrlRecord(**{
+            **parsed_info,
+            "url": url.removesuffix(".git")
+            if protocol != "file"
+            else url
+            if url.endswith(".git")
+            else f"{url}.git",
+            "platform": name,
+            "protocol": protocol,
+            "protocols": tuple(parsed_info["protocols"]),
+            "ownerrepo": f"{owner}{parsed_info['repo']}",
+            "platform_obj": plat,
+        })
+    return None
+
+
 @dataclasses.dataclass
 class GitUrl:
     """Parsed Git URL Helper Class.
@@ -193,7 +313,7 @@ class GitUrl:
 
     _platform_obj: (
             AssemblaPlatform | BasePlatform | BitbucketPlatform | FriendCodePlatform | GitHubPlatform | GitLabPlatform
-    ) = dataclasses.field(default_factory=BasePlatform, init=False)
+    ) = dataclasses.field(default_factory=lambda: PLATFORMS_INDEX["base"], init=False)
     _path: Path | None = dataclasses.field(default=None, init=False)
     """Path from __post_init__ method when path is provided in url argument."""
     _user: str = dataclasses.field(default="", init=False)
@@ -212,18 +332,23 @@ class GitUrl:
     port: str = dataclasses.field(default="", init=False)
     url: str | Path = dataclasses.field(default="", hash=True, init=False)
     username: str = dataclasses.field(default="", init=False)
+    _formats: dict[str, tuple[tuple[str, ...], str]] = dataclasses.field(default_factory=dict, init=False,
+                                                                          repr=False, compare=False)
+    """Memo of :meth:`format` by protocol: attributes used in the url and url."""
     api_repos_url: ClassVar[str] = f"{GITHUB_URL['api']}/repos"
+    parse: ClassVar[Callable[[str], GitUrlRecord | None]] = staticmethod(
+        functools.lru_cache(maxsize=GITURL_CACHE_SIZE)(_giturl_parse)
+    )
+    """Parse url, LRU cached by url (use ``GitUrl.parse.cache_info()`` for hits, misses and size)."""
 
-    def __post_init__(self, data: str | Path | _SupportsWorkingDir | None):  # noqa: PLR0912, PLR0915
+    def __post_init__(self, data: str | Path | _SupportsWorkingDir | None):  # noqa: PLR0912
         """Post Init."""
-        data = data.working_dir if isinstance(data, _SupportsWorkingDir) else data
+        if not isinstance(data, str | os.PathLike | None) and isinstance(data, _SupportsWorkingDir):
+            data = data.working_dir
         self.url = "" if data is None else str(data)  # because of CLI g default Path is None
-        parsed_info = collections.defaultdict(lambda: "")
-        parsed_info["protocols"] = cast(str, [])
         self._path = None
 
         if self.repo:
-            parsed_info["repo"] = self.repo
             self.url = f"https://github.com/{self.url or GIT}/{self.repo}"
         elif not self.url:
             self._path = Path.cwd().absolute()
@@ -235,78 +360,76 @@ class GitUrl:
                     self._path = Path.cwd().absolute()
             else:
                 self._path = _path.to_parent()
-        self.url = stdout(f"git -C {self._path} config --get remote.origin.url") if self._path else self.url
+        self.url = git_remote_url(self._path) if self._path else self.url
 
         if self.url is None:
             msg = f"Invalid argument: {data=}, {self.repo=}"
             raise InvalidArgumentError(msg)
 
-        found = False
-        for name, plat in PLATFORMS:
-            for protocol, regex in plat.COMPILED_PATTERNS.items():
-                # Match current regex against URL
-                if not (match := regex.match(self.url)):
-                    # Skip if not matched
-                    continue
-
-                # Skip if domain is bad
-                domain = match.group("domain")
-
-                # print('[%s] DOMAIN = %s' % (url, domain,))
-                if plat.DOMAINS and domain not in plat.DOMAINS:
-                    continue
-                if plat.SKIP_DOMAINS and domain in plat.SKIP_DOMAINS:
-                    continue
-
-                found = True
-
-                # add in platform defaults
-                parsed_info.update(plat.DEFAULTS)
-
-                # Get matches as dictionary
-                matches = plat.clean_data(match.groupdict(default=""))
-
-                # Update info with matches
-                parsed_info.update(matches)
-
-                owner = f"{parsed_info['owner']}/" if parsed_info["owner"] else ""
-
-                if protocol == "ssh" and "ssh" not in parsed_info["protocols"]:
-                    # noinspection PyUnresolvedReferences
-                    parsed_info["protocols"].append(protocol)
-
-                if protocol == "file" and not domain.startswith("/"):
-                    msg = f"Invalid argument, git+file should have an absolute path: {data=}, {self.repo=}"
-                    raise InvalidArgumentError(msg)
-
-                parsed_info.update(
-                    {
-                        "url": self.url.removesuffix(".git")
-                        if protocol != "file"
-                        else self.url
-                        if self.url.endswith(".git")
-                        else f"{self.url}.git",
-                        "platform": name,
-                        "protocol": protocol,
-                        "ownerrepo": f"{owner}{parsed_info['repo']}",
-                    }
-                )
-
-                for k, v in parsed_info.items():
-                    setattr(self, k, v)
-                break
-
-            if found:
-                break
+        try:
+            record = self.parse(self.url)
+        except InvalidArgumentError:
+            msg = f"Invalid argument, git+file should have an absolute path: {data=}, {self.repo=}"
+            raise InvalidArgumentError(msg) from None
 
-        for name, plat in PLATFORMS:
-            if name == self.platform:
-                self._platform_obj = plat
-                break
+        if record is not None:
+            for k in _GITURL_RECORD_ATTRS:
+                setattr(self, k, getattr(record, k))
+            self.protocols = list(record.protocols)
+            self._platform_obj = record.platform_obj
 
         if not self.repo and self._path:
             self.repo = self._path.name
 
+    @classmethod
+    def parse_many(cls, urls: Iterable[str]) -> dict[str, list[str | None]]:
+        r"""Parse urls in columns, without creating :class:`GitUrl` instances.
+
+        Urls are stripped and are not checked as paths. Rows which can not be parsed or are not valid
+        have the error message in the "error" column and None in the others.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>>
+            >>> rv = GitUrl.parse_many(["git@github.com:Org/Repo.git", "invalid", "https://gitlab.com/a/b/c\n"])
+            >>> rv["owner"], rv["repo"], rv["platform"]
+            (['Org', None, 'a'], ['Repo', None, 'c'], ['github', None, 'gitlab'])
+            >>> rv["url2https"]
+            ['https://github.com/Org/Repo.git', None, 'https://gitlab.com/a/b/c.git']
+            >>> rv["error"]
+            [None, "Invalid url: 'invalid'", None]
+
+        Args:
+            urls: iterable of urls, i.e.: lines of a file
+
+        Returns:
+            Dictionary of column name and list of values, with a row for each url.
+        """
+        rewrites = {f"url2{protocol.replace('+', '')}": protocol for protocol in ("git", "git+https", "git+ssh",
+                                                                                "https", "ssh")}
+        rv = {key: [] for key in ("url", "host", "owner", "repo", "protocol", "platform", *rewrites, "error")}
+        for line in urls:
+            url = line.strip()
+            error = None
+            try:
+                record = cls.parse(url)
+            except InvalidArgumentError:
+                record, error = None, f"Invalid argument, git+file should have an absolute path: {url!r}"
+            if record is None or not (record.domain and record.repo):
+                record, error = None, error or f"Invalid url: {url!r}"
+            rv["url"].append(url)
+            rv["host"].append(record and record.domain)
+            rv["owner"].append(record and record.owner)
+            rv["repo"].append(record and record.repo)
+            rv["protocol"].append(record and record.protocol)
+            rv["platform"].append(record and record.platform)
+            for key, protocol in rewrites.items():
+                rv[key].append(
+                    record.format(protocol) if record and protocol in record.platform_obj.FORMATS else None
+                )
+            rv["error"].append(error)
+        return rv
+
     def admin(self, user: str = GIT, rm: bool = False) -> bool:
         """Check if user has admin permissions.
 
@@ -354,12 +477,29 @@ class GitUrl:
         return self.github(rm=rm)["default_branch"]
 
     def format(self, protocol):  # noqa: A003
-        """Reformat URL to protocol."""
-        items = dataclasses.asdict(self)
-        items["port_slash"] = f"{self.port}/" if self.port else ""
-        items["groups_slash"] = f"{self.groups_path}/" if self.groups_path else ""
-        items["dot_git"] = "" if items["repo"].endswith(".git") else ".git"
-        return self._platform_obj.FORMATS[protocol] % items
+        """Reformat URL to protocol, memoized.
+
+        Urls are built with the platform ``FORMATTERS`` compiled from ``FORMATS``, and memoized by protocol
+        in the instance while the attributes used in the url (``FORMAT_KEYS``) do not change.
+
+        Examples:
+            >>> from nodeps import GitUrl
+            >>>
+            >>> p = GitUrl("git@github.com:Org/Private-repo.git")
+            >>> p.format("https")
+            'https://github.com/Org/Private-repo.git'
+            >>> assert p.format("https") is p.url2https
+            >>> p.owner = "Other"
+            >>> p.url2https
+            'https://github.com/Other/Private-repo.git'
+
+        Raises:
+            KeyError: if the platform does not support the protocol.
+        """
+        key = self._platform_obj.FORMAT_KEYS[protocol](self)
+        if (memo := self._formats.get(protocol)) is None or memo[0] != key:
+            memo = self._formats[protocol] = key, self._platform_obj.FORMATTERS[protocol](self)
+        return memo[1]
 
     def github(
             self,
@@ -379,6 +519,72 @@ class GitUrl:
         """
         return urljson(f"{self.api_repos_url}/{self.ownerrepo}", rm=rm)
 
+    @classmethod
+    def github_many(
+            cls,
+            data: "Iterable[str | Path | _SupportsWorkingDir | GitUrl]",
+            user: str | None = GIT,
+            repos: bool = True,
+            rm: bool = False,
+            workers: int = GITHUB_WORKERS,
+    ) -> dict[str, dict[str, bool | str | Exception]]:
+        """GitHub metadata of many repositories with concurrent requests.
+
+        Fills the same cache as :meth:`admin`, :meth:`default`, :meth:`github` and :meth:`public`,
+        so they do not request again. Repositories are requested once by owner and repo,
+        and cached responses are not requested unless ``rm``.
+
+        Examples:
+            >>> import nodeps
+            >>> from nodeps import GitUrl
+            >>>
+            >>> rv = GitUrl.github_many([nodeps.__file__, "https://github.com/octocat/Hello-World"])
+            >>> assert rv["octocat/Hello-World"]["public"] is True  # doctest: +SKIP
+
+        Args:
+            data: urls, paths or :class:`GitUrl` instances
+            user: user to check admin permission, None to not request permissions (default: $GIT)
+            repos: request repos api for default branch and visibility
+            rm: remove cache
+            workers: maximum number of concurrent requests (default: :data:`GITHUB_WORKERS`)
+
+        Returns:
+            Dictionary of owner/repo and dictionary with "admin", "default" and "public" values requested,
+            or "error" with the exception raised by the request.
+        """
+        items = {}
+        for value in data:
+            item = value if isinstance(value, GitUrl) else cls(value)
+            items.setdefault(item.ownerrepo, item)
+
+        urls = [url for ownerrepo in items for url in (
+            *([f"{cls.api_repos_url}/{ownerrepo}"] if repos else []),
+            *([f"{cls.api_repos_url}/{ownerrepo}/collaborators/{user}/permission"] if user else []),
+        )]
+        responses = dict(zip(urls, urljson_many(urls, rm=rm, workers=workers), strict=True))
+
+        rv = {}
+        for ownerrepo in items:
+            rv[ownerrepo] = value = {}
+            try:
+                if repos:
+                    if isinstance(github := responses[f"{cls.api_repos_url}/{ownerrepo}"], Exception):
+                        raise github
+                    value |= {"default": github["default_branch"], "public": github["visibility"] == "public"}
+                if user:
+                    permission = responses[f"{cls.api_repos_url}/{ownerrepo}/collaborators/{user}/permission"]
+                    if isinstance(permission, urllib.error.HTTPError) and permission.code == 403 \
+                            and permission.reason == "Forbidden":  # noqa: PLR2004
+                        value["admin"] = False
+                    elif isinstance(permission, Exception):
+                        raise permission
+                    else:
+                        value["admin"] = permission["permission"] == "admin"
+            except (OSError, KeyError, ValueError) as exception:
+                value.clear()
+                value["error"] = exception
+        return rv
+
     @property
     def groups(self):
         """List of groups. GitLab only."""
@@ -594,6 +800,20 @@ class GitUrl:
         return cls(data=data, repo=repo).valid
 
 
+def _git_status(ahead: int, behind: int, dirty: bool, local: str, upstream: str, remote: str,  # noqa: PLR0917
+                base: str = "") -> GitStatus:
+    """Git status instance from :meth:`Gh._porcelain` and the merge-base if diverged."""
+    if not upstream:
+        return GitStatus(dirty=dirty, local=local, push=bool(local))
+    if ahead and behind:
+        return GitStatus(base=base, dirty=dirty, diverge=True, local=local, pull=True, push=True, remote=remote)
+    if behind:
+        return GitStatus(base=local, dirty=dirty, diverge=dirty, local=local, pull=True, remote=remote)
+    if ahead:
+        return GitStatus(base=remote, dirty=dirty, local=local, push=True, remote=remote)
+    return GitStatus(dirty=dirty, local=local, remote=remote)
+
+
 @dataclasses.dataclass
 class Gh(GitUrl):
     """Git Repo Class.
@@ -628,6 +848,42 @@ class Gh(GitUrl):
 
         git_config_global()
 
+    def _fetch(self, fetch: bool | None) -> bool:
+        """Fetch is needed: ``fetch`` or, if None, not fetched in the last :data:`GIT_FETCH_TTL` seconds."""
+        if fetch is None:
+            fetch = True
+            if gitdir := git_dir(self._path):
+                with contextlib.suppress(FileNotFoundError):
+                    fetch = time.time() - (gitdir[0] / "FETCH_HEAD").stat().st_mtime > GIT_FETCH_TTL
+        return fetch
+
+    def _porcelain(self, out: str) -> tuple[int, int, bool, str, str, str | None]:
+        """Ahead, behind, dirty, local SHA, upstream and upstream SHA from ``git status --porcelain=v2 --branch``.
+
+        Upstream SHA is read from the refs files (see :func:`nodeps.git_ref`), None if it can not be read.
+        """
+        ahead = behind = 0
+        dirty = False
+        local = upstream = ""
+        for line in out.splitlines():
+            if not line.startswith("# "):
+                dirty = True
+            elif line.startswith("# branch.oid "):
+                local = "" if (oid := line[len("# branch.oid "):]) == "(initial)" else oid
+            elif line.startswith("# branch.upstream "):
+                upstream = line[len("# branch.upstream "):]
+            elif line.startswith("# branch.ab "):
+                a, b = line[len("# branch.ab "):].split()
+                ahead, behind = int(a), -int(b)
+
+        if not upstream or (not ahead and not behind):
+            return ahead, behind, dirty, local, upstream, local
+        return ahead, behind, dirty, local, upstream, next(
+            (sha for ref in (f"refs/{upstream}", f"refs/tags/{upstream}", f"refs/heads/{upstream}",
+                             f"refs/remotes/{upstream}") if (sha := git_ref(self._path, ref))),
+            None,
+        )
+
     def info(self, msg: str):
         """Logger info."""
         self.log.info(msg, extra={"extra": self.repo})
@@ -636,14 +892,141 @@ class Gh(GitUrl):
         """Logger warning."""
         self.log.warning(msg, extra={"extra": self.repo})
 
-    def commit(self, msg: str | None = None, force: bool = False, quiet: bool = True) -> None:
+    async def aiocommit(self, msg: str | None = None, force: bool = False, quiet: bool = True,
+                        fetch: bool | None = True) -> None:
+        """Async :meth:`commit`.
+
+        Raises:
+            CmdError: if git fails
+            RuntimeError: if diverged or dirty
+        """
+        status = await self.aiostatus(quiet=quiet, fetch=fetch)
+        if status.dirty:
+            if status.diverge and not force:
+                msg = f"Diverged: {status=}, {self.repo=}"
+                raise RuntimeError(msg)
+            if msg is None or msg == "":
+                msg = "fix: "
+            await self.aiogit("add", "-A")
+            await self.aiogit("commit", "-a", "--quiet" if quiet else "", "-m", msg)
+            self.info(self.commit.__name__)
+
+    async def aiocurrent(self) -> str:
+        """Async :meth:`current`, the branch is read from the HEAD file (see :func:`nodeps.git_branch`)."""
+        return self.current()
+
+    async def aiogit(self, *args: str) -> str:
+        """Async runs git command in the repository and returns stdout (empty args are ignored).
+
+        Examples:
+            >>> import asyncio
+            >>> from nodeps import Gh
+            >>>
+            >>> assert asyncio.run(Gh().aiogit("rev-parse", "--abbrev-ref", "HEAD")) == "main"
+
+        Raises:
+            CmdError: if git fails
+        """
+        p = await aiocmd("git", "-C", str(self._path), *filter(None, args))
+        return p.stdout.rstrip("\n") if p.stdout else ""
+
+    async def aiolatest(self) -> str:
+        """Async :meth:`latest`."""
+        latest = tags[-1] if (tags := git_tags(self._path)) else ""
+        if not latest:
+            latest = "0.0.0"
+            await self.aiocommit(msg=f"{self.latest.__name__}: {latest}", fetch=False)
+            await self._aiotag(latest)
+        return latest
+
+    async def aiopull(self, force: bool = False, quiet: bool = True, fetch: bool | None = True) -> None:
+        """Async :meth:`pull`.
+
+        Raises:
+            CmdError: if pull fails
+            RuntimeError: if diverged or dirty
+        """
+        status = await self.aiostatus(quiet=quiet, fetch=fetch)
+        if status.diverge and not force:
+            msg = f"Diverged: {status=}, {self.repo=}"
+            raise RuntimeError(msg)
+        if status.pull:
+            await self.aiogit("pull", "--force" if force else "", "--quiet" if quiet else "")
+            self.info(self.pull.__name__)
+
+    async def aiopush(self, force: bool = False, quiet: bool = True, fetch: bool | None = True) -> None:
+        """Async :meth:`push`.
+
+        Raises:
+            CmdError: if push fails
+            RuntimeError: if diverged
+        """
+        await self.aiocommit(force=force, quiet=quiet, fetch=fetch)
+        status = await self.aiostatus(quiet=quiet, fetch=False)
+        if status.push:
+            if status.pull and not force:
+                msg = f"Diverged: {status=}, {self.repo=}"
+                raise RuntimeError(msg)
+            await self.aiogit("push", "--force" if force else "", "--quiet" if quiet else "")
+            self.info(self.push.__name__)
+
+    async def aiostatus(self, quiet: bool = True, fetch: bool | None = True) -> GitStatus:
+        """Async :meth:`status`.
+
+        Examples:
+            >>> import asyncio
+            >>> from nodeps import Gh
+            >>>
+            >>> assert asyncio.run(Gh().aiostatus(fetch=False)) == Gh().status(fetch=False)
+        """
+        if self._fetch(fetch):
+            await self.aiogit("fetch", "--all", "--tags", "--prune", "--quiet" if quiet else "")
+        try:
+            out = await self.aiogit("status", "--porcelain=v2", "--branch")
+        except CmdError:
+            return GitStatus()
+        ahead, behind, dirty, local, upstream, remote = self._porcelain(out)
+        base = ""
+        if remote is None:
+            with contextlib.suppress(CmdError):
+                remote = await self.aiogit("rev-parse", "@{u}")
+        if upstream and ahead and behind:
+            with contextlib.suppress(CmdError):
+                base = await self.aiogit("merge-base", "@", "@{u}")
+        return _git_status(ahead, behind, dirty, local, upstream, remote or "", base)
+
+    async def aiosync(self) -> None:
+        """Async :meth:`sync`."""
+        await self.aiopush()
+        await self.aiopull(fetch=False)
+
+    async def _aiotag(self, tag: str, quiet: bool = True) -> None:
+        await self.aiogit("tag", tag)
+        await self.aiogit("push", "origin", tag, "--quiet" if quiet else "")
+        self.info(f"{self.tag.__name__}: {tag}")
+
+    async def aiotag(self, tag: str, quiet: bool = True) -> str | None:
+        """Async :meth:`tag`."""
+        if await self.aiolatest() == tag:
+            self.warning(f"{self.tag.__name__}: {tag} -> nothing to do")
+            return
+        await self._aiotag(tag, quiet=quiet)
+
+    def commit(self, msg: str | None = None, force: bool = False, quiet: bool = True,
+               fetch: bool | None = True) -> None:
         """commit.
 
+        Args:
+            msg: commit message
+            force: commit if diverged
+            quiet: quiet
+            fetch: fetch before status, if None only if not fetched in the last :data:`GIT_FETCH_TTL` seconds
+
         Raises:
             CalledProcessError: if  fails
             RuntimeError: if diverged or dirty
         """
-        status = self.status(quiet=quiet)
+        status = self.status(quiet=quiet, fetch=fetch)
         # print(status, file=sys.stderr)
         if status.dirty:
             if status.diverge and not force:
@@ -668,7 +1051,7 @@ class Gh(GitUrl):
             >>>
             >>> assert Gh().current() == 'main'
         """
-        return self.git_stdout("branch --show-current") or ""
+        return git_branch(self._path) or ""
 
     def gh_check_call(self, line: str):
         """Runs git command and raises exception if error (stdout is not captured and shown).
@@ -713,11 +1096,11 @@ class Gh(GitUrl):
         return stdout(f"{self.git} {line}")
 
     def latest(self) -> str:
-        """Latest tag: git {c} describe --abbrev=0 --tags."""
-        latest = self.git_stdout("tag | sort -V | tail -1") or ""
+        """Latest tag in version order (see :func:`nodeps.git_tags`), creates and pushes 0.0.0 if no tags."""
+        latest = tags[-1] if (tags := git_tags(self._path)) else ""
         if not latest:
             latest = "0.0.0"
-            self.commit(msg=f"{self.latest.__name__}: {latest}")
+            self.commit(msg=f"{self.latest.__name__}: {latest}", fetch=False)
             self._tag(latest)
         return latest
 
@@ -755,14 +1138,19 @@ class Gh(GitUrl):
                 return self._next()
         return latest
 
-    def pull(self, force: bool = False, quiet: bool = True) -> None:
+    def pull(self, force: bool = False, quiet: bool = True, fetch: bool | None = True) -> None:
         """pull.
 
+        Args:
+            force: pull if diverged
+            quiet: quiet
+            fetch: fetch before status, if None only if not fetched in the last :data:`GIT_FETCH_TTL` seconds
+
         Raises:
             CalledProcessError: if pull fails
             RuntimeError: if diverged or dirty
         """
-        status = self.status(quiet=quiet)
+        status = self.status(quiet=quiet, fetch=fetch)
         if status.diverge and not force:
             msg = f"Diverged: {status=}, {self.repo=}"
             raise RuntimeError(msg)
@@ -770,15 +1158,20 @@ class Gh(GitUrl):
             self.git_check_call(f"pull {'--force' if force else ''} {'--quiet' if quiet else ''}")
             self.info(self.pull.__name__)
 
-    def push(self, force: bool = False, quiet: bool = True) -> None:
+    def push(self, force: bool = False, quiet: bool = True, fetch: bool | None = True) -> None:
         """push.
 
+        Args:
+            force: push if diverged
+            quiet: quiet
+            fetch: fetch before status, if None only if not fetched in the last :data:`GIT_FETCH_TTL` seconds
+
         Raises:
             CalledProcessError: if push fails
             RuntimeError: if diverged
         """
-        self.commit(force=force, quiet=quiet)
-        status = self.status(quiet=quiet)
+        self.commit(force=force, quiet=quiet, fetch=fetch)
+        status = self.status(quiet=quiet, fetch=False)
         if status.push:
             if status.pull and not force:
                 msg = f"Diverged: {status=}, {self.repo=}"
@@ -788,7 +1181,7 @@ class Gh(GitUrl):
 
     def secrets(self, force: bool = False) -> int:
         """Update GitHub repository secrets."""
-        if CI or DOCKER:
+        if CI or constants.DOCKER:
             return 0
         if not self.secrets_names() or force:
             self.gh_check_call(f"secret set GH_TOKEN --body {GITHUB_TOKEN}")
@@ -807,34 +1200,38 @@ class Gh(GitUrl):
             return rv.splitlines()
         return []
 
-    def status(self, quiet: bool = True) -> GitStatus:
-        """Git status instance and fetch if necessary."""
-        base = ""
-        diverge = pull = push = False
-        local = self.git_stdout("rev-parse @")
-        self.git_check_call(f"fetch --all --tags --prune {'--quiet' if quiet else ''}")
-        remote = self.git_stdout("rev-parse @{u}")
-
-        dirty = bool(self.git_stdout("status -s"))
-        if local != remote:
-            # self.git_check_call(f"fetch --all --tags --prune {'--quiet' if quiet else ''}")
-            base = self.git_stdout("merge-base @ @{u}")
-            if local == base:
-                pull = True
-                diverge = dirty
-            elif remote == base:
-                push = True
-            else:
-                diverge = True
-                pull = True
-                push = True
-        return GitStatus(base=base, dirty=dirty, diverge=diverge, local=local, pull=pull, push=push, remote=remote)
+    def status(self, quiet: bool = True, fetch: bool | None = True) -> GitStatus:
+        """Git status instance from a single ``git status --porcelain=v2 --branch``, after fetch if ``fetch``.
+
+        Pull, push and diverge are from the ahead and behind counts. The upstream SHA is read from the refs files
+        (see :func:`nodeps.git_ref`), and ``merge-base`` only runs if the branch diverged.
+        A branch without upstream needs push.
+
+        Examples:
+            >>> from nodeps import Gh
+            >>>
+            >>> assert Gh().status(fetch=False).local == Gh().git_stdout("rev-parse @")
+
+        Args:
+            quiet: fetch quiet
+            fetch: fetch all remotes, tags and prune before if True (default), never if False, and if None
+                only if not fetched in the last :data:`GIT_FETCH_TTL` seconds (i.e.: prompts).
+        """
+        if self._fetch(fetch):
+            self.git_check_call(f"fetch --all --tags --prune {'--quiet' if quiet else ''}")
+        p = subprocess.run(["git", "-C", str(self._path), "status", "--porcelain=v2", "--branch"],
+                           capture_output=True, text=True)
+        if p.returncode != 0:
+            return GitStatus()
+        ahead, behind, dirty, local, upstream, remote = self._porcelain(p.stdout)
+        if remote is None:
+            remote = self.git_stdout("rev-parse @{u}") or ""
+        base = (self.git_stdout("merge-base @ @{u}") or "") if upstream and ahead and behind else ""
+        return _git_status(ahead, behind, dirty, local, upstream, remote, base)
 
     def superproject(self) -> Path | None:
-        """Git rev-parse --show-superproject-working-tree --show-toplevel."""
-        if v := self.git_stdout("rev-parse --show-superproject-working-tree --show-toplevel"):
-            return Path(v[0])
-        return None
+        """Superproject top if submodule, otherwise top (see :func:`nodeps.git_superproject`)."""
+        return git_superproject(self._path) or self.top()
 
     def _tag(self, tag: str, quiet: bool = True) -> None:
         self.git_check_call(f"tag {tag}")
@@ -849,15 +1246,109 @@ class Gh(GitUrl):
         self._tag(tag, quiet=quiet)
 
     def sync(self):
-        """Sync repository."""
+        """Sync repository, fetching once."""
         self.push()
-        self.pull()
+        self.pull(fetch=False)
 
     def top(self) -> Path | None:
-        """Git rev-parse --show-toplevel."""
-        if v := self.git_stdout("rev-parse --show-toplevel"):
-            return Path(v)
-        return None
+        """Worktree top (see :func:`nodeps.git_top`)."""
+        return git_top(self._path)
+
+
+async def aiogh(
+        data: Iterable[str | Path | _SupportsWorkingDir | Gh],
+        method: str = "status",
+        *args,
+        limit: int = AIOGH_LIMIT,
+        **kwargs,
+) -> list:
+    """Async runs a :class:`Gh` async method in many repositories, at most ``limit`` at the same time.
+
+    Examples:
+        >>> import asyncio
+        >>> from nodeps import Gh, aiogh
+        >>>
+        >>> assert asyncio.run(aiogh([Gh()], "aiocurrent")) == ["main"]
+        >>> assert asyncio.run(aiogh(["/tmp"], "status"))[0].__class__.__name__ == "InvalidArgumentError"
+
+    Args:
+        data: repositories paths or :class:`Gh` instances
+        method: :class:`Gh` async method name, with or without the "aio" prefix (default: "status")
+        *args: method args
+        limit: maximum number of repositories running at the same time (default: :data:`AIOGH_LIMIT`)
+        **kwargs: method kwargs
+
+    Returns:
+        Results in the same order as ``data``, or the exception raised for the repository.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    method = method if method.startswith("aio") else f"aio{method}"
+
+    async def run(item):
+        async with semaphore:
+            return await getattr(item if isinstance(item, Gh) else Gh(item), method)(*args, **kwargs)
+
+    return await asyncio.gather(*[run(item) for item in data], return_exceptions=True)
+
+
+async def aiogh_sync(
+        data: Iterable[str | Path | _SupportsWorkingDir | Gh],
+        limit: int = AIOGH_LIMIT,
+        progress: Callable[[int, int, GitSync], None] | None = None,
+) -> list[GitSync]:
+    """Async sync (push and pull) many repositories, at most ``limit`` at the same time.
+
+    Each repository is fetched once, diverged repositories are not synced,
+    and an exception is reported in its result without stopping the rest.
+
+    Examples:
+        >>> import asyncio
+        >>> from nodeps import aiogh_sync
+        >>>
+        >>> rv = asyncio.run(aiogh_sync(["/tmp"]))
+        >>> assert rv[0].error.startswith("InvalidArgumentError")
+
+    Args:
+        data: repositories paths or :class:`Gh` instances
+        limit: maximum number of repositories running at the same time (default: :data:`AIOGH_LIMIT`)
+        progress: called with the number of repositories done, total and result when a repository is done
+
+    Returns:
+        Results in the same order as ``data``.
+    """
+    data = list(data)
+    semaphore = asyncio.Semaphore(limit)
+    done = 0
+
+    async def run(item):
+        nonlocal done
+        async with semaphore:
+            start = time.perf_counter()
+            name = item.repo if isinstance(item, Gh) else Path(getattr(item, "working_dir", item)).resolve().name
+            rv = GitSync(name=name)
+            try:
+                gh = item if isinstance(item, Gh) else Gh(item)
+                rv.name = top.name if (top := gh.top()) else gh.repo
+                status = await gh.aiostatus(fetch=True)
+                if status.diverge:
+                    rv.diverged = True
+                else:
+                    if status.dirty or status.push:
+                        await gh.aiopush(fetch=False)
+                        rv.pushed = True
+                    if status.pull:
+                        await gh.aiopull(fetch=False)
+                        rv.pulled = True
+            except Exception as exception:  # noqa: BLE001
+                rv.error = f"{exception.__class__.__name__}: {exception}".strip()
+            rv.skipped = not (rv.pulled or rv.pushed or rv.diverged or rv.error)
+            rv.duration = time.perf_counter() - start
+        done += 1
+        if progress:
+            progress(done, len(data), rv)
+        return rv
+
+    return await asyncio.gather(*[run(item) for item in data])
 
 
 async def aioclone(
@@ -930,7 +1421,24 @@ def clone(
 
 
 def git_config_global():
-    """Sets values in git global config if not set."""
+    """Sets values in git global config if not set.
+
+    The global config is read natively (see :func:`nodeps.git_global_config`), so git only runs to set
+    missing values, or for each key if the global config can not be parsed.
+    Files are parsed once per process and re-read when modified, :func:`nodeps.git_config_cache_clear`
+    clears the memo.
+
+    Examples:
+        >>> from nodeps import GIT_CONFIG_GLOBAL, git_config_global, git_global_config
+        >>>
+        >>> git_config_global()
+        >>> assert (config := git_global_config()) is None or all(key.lower() in config for key in GIT_CONFIG_GLOBAL)
+    """
+    config = git_global_config()
     for key, value in GIT_CONFIG_GLOBAL.items():
-        if subprocess.run(f"git config --global {key}", capture_output=True, shell=True).returncode != 0:
-            subprocess.check_call(f"git config --global {key} {value}", shell=True)
+        if config is not None:
+            if key.lower() in config:
+                continue
+        elif subprocess.run(f"git config --global {key}", capture_output=True, shell=True).returncode == 0:
+            continue
+        subprocess.check_call(f"git config --global {key} {value}", shell=True)
@@ -0,0 +1,728 @@
+"""Git Config Module.
+
+Native reader of git config and refs files, so the remote url of a repository is read without spawning ``git``,
+i.e.: :meth:`nodeps.Project.repos` creates a :class:`nodeps.GitUrl` for each repository under home.
+
+Caveats:
+    Only the cases which can be resolved from the files are read natively, the rest are delegated to ``git``:
+    ``$GIT_DIR``, ``$GIT_COMMON_DIR``, ``$GIT_CONFIG``, ``$GIT_CONFIG_COUNT``, ``$GIT_CONFIG_PARAMETERS`` and
+    ``$GIT_CEILING_DIRECTORIES``, ``includeIf.hasconfig:``, repositories owned by other users (``safe.directory``),
+    repositories in other filesystems than the path, and files which can not be parsed.
+    The system config is ``/etc/gitconfig`` unless ``$GIT_CONFIG_SYSTEM`` is set.
+"""
+__all__ = (
+    "git_branch",
+    "git_config",
+    "git_config_cache_clear",
+    "git_config_parse",
+    "git_dir",
+    "git_global_config",
+    "git_ref",
+    "git_remote_url",
+    "git_superproject",
+    "git_tags",
+    "git_top",
+    "version_key",
+)
+
+import contextlib
+import functools
+import os
+import re
+
+from .functions import stdout
+from .path import Path
+
+_ENVIRON = (
+    "GIT_CEILING_DIRECTORIES",
+    "GIT_COMMON_DIR",
+    "GIT_CONFIG",
+    "GIT_CONFIG_COUNT",
+    "GIT_CONFIG_PARAMETERS",
+    "GIT_DIR",
+)
+"""Environment variables which change how git finds the repository or reads the config."""
+_ESCAPES = {"\n": "", "\\": "\\", '"': '"', "b": "\b", "n": "\n", "t": "\t"}
+"""Value escape sequences, backslash newline is a line continuation."""
+_INCLUDE_DEPTH = 10
+"""Maximum include depth, git fails if exceeded."""
+_KEY_RE = re.compile(r"([A-Za-z][A-Za-z0-9-]*)[ \t]*")
+_PACKED = {}
+"""Memo of parsed ``packed-refs`` by path, validated by inode, size and mtime."""
+_PARSED = {}
+"""Memo of parsed files by path, validated by inode, size and mtime."""
+_SECTION_RE = re.compile(r'\[([A-Za-z0-9.-]+)(?:[ \t]+"((?:[^"\\\n]|\\[^\n])*)")?\]')
+_SUBSECTION_ESCAPE_RE = re.compile(r"\\(.)")
+_VERSION_RE = re.compile(r"(\D*)(\d*)")
+_VERSION_SUFFIX_RE = re.compile(r"(?:\.[A-Za-z~][A-Za-z0-9~]*)*$")
+
+
+class _UnsupportedError(Exception):
+    """The config can not be read natively, git has to be used."""
+
+
+def _key(name: str) -> str:
+    """Canonical key: section and variable name are case-insensitive, subsection is case-sensitive."""
+    section, _, rest = name.partition(".")
+    subsection, _, variable = rest.rpartition(".")
+    return f"{section.lower()}.{subsection}.{variable.lower()}" if subsection else name.lower()
+
+
+def _value(text: str, i: int) -> tuple[str, int]:
+    """Parse value starting at ``i``, returns value and the index after the end of line."""
+    rv, space, quote, n = [], 0, False, len(text)
+    while i < n:
+        c = text[i]
+        i += 1
+        if c == "\n":
+            if quote:
+                raise _UnsupportedError
+            break
+        if not quote:
+            if c in " \t\f\v":
+                space += 1 if rv else 0
+                continue
+            if c in "#;":
+                i = n if (i := text.find("\n", i)) == -1 else i + 1
+                break
+        if space:
+            rv.append(" " * space)
+            space = 0
+        if c == "\\":
+            if i == n or (c := _ESCAPES.get(text[i])) is None:
+                raise _UnsupportedError
+            i += 1
+        elif c == '"':
+            quote = not quote
+            continue
+        rv.append(c)
+    if quote:
+        raise _UnsupportedError
+    return "".join(rv), i
+
+
+def _parse(text: str) -> tuple[tuple[str, str | None], ...]:
+    """Parse config text."""
+    text = text.removeprefix("\ufeff").replace("\r\n", "\n")
+    rv, section, i, n = [], None, 0, len(text)
+    while i < n:
+        c = text[i]
+        if c.isspace():
+            i += 1
+        elif c in "#;":
+            i = n if (i := text.find("\n", i)) == -1 else i + 1
+        elif c == "[":
+            if (match := _SECTION_RE.match(text, i)) is None:
+                raise _UnsupportedError
+            name, subsection = match.groups()
+            section = name.lower()
+            if subsection is not None:
+                section += "." + _SUBSECTION_ESCAPE_RE.sub(r"\1", subsection)
+            i = match.end()
+        elif section is not None and (match := _KEY_RE.match(text, i)):
+            i = match.end()
+            key = f"{section}.{match.group(1).lower()}"
+            if i < n and text[i] == "=":
+                value, i = _value(text, i + 1)
+            elif i == n or text[i] == "\n":
+                value = None
+            else:
+                raise _UnsupportedError
+            rv.append((key, value))
+        else:
+            raise _UnsupportedError
+    return tuple(rv)
+
+
+def git_config_parse(file: str | os.PathLike) -> tuple[tuple[str, str | None], ...]:
+    r"""Key and value entries of a git config file, in file order and without following includes.
+
+    Keys are canonical: section and variable names are lower case, and the subsection keeps its case.
+    Value is None for a variable without ``=`` (boolean true). Parsed files are memoized until modified.
+
+    Examples:
+        >>> import tempfile
+        >>> from nodeps import git_config_parse
+        >>>
+        >>> with tempfile.NamedTemporaryFile("w", suffix=".config") as f:
+        ...     _ = f.write('[Remote "Origin"]\n\tURL = git@github.com:a/b.git # comment\n[core]\n\tbare\n')
+        ...     f.flush()
+        ...     git_config_parse(f.name)
+        (('remote.Origin.url', 'git@github.com:a/b.git'), ('core.bare', None))
+
+    Args:
+        file: config file
+
+    Raises:
+        FileNotFoundError: if the file does not exist.
+
+    Returns:
+        Tuple of key and value.
+    """
+    file = os.fspath(file)
+    st = os.stat(file)
+    stamp = (st.st_ino, st.st_size, st.st_mtime_ns)
+    if (value := _PARSED.get(file)) is None or value[0] != stamp:
+        with open(file, encoding="utf-8", errors="surrogateescape") as f:
+            _PARSED[file] = value = (stamp, _parse(f.read()))
+    return value[1]
+
+
+def _is_git_dir(path: str) -> str | None:
+    """Common dir if path is a git directory."""
+    if not os.path.isfile(os.path.join(path, "HEAD")):
+        return None
+    common = path
+    try:
+        with open(os.path.join(path, "commondir"), encoding="utf-8") as f:
+            common = os.path.normpath(os.path.join(path, f.read().strip()))
+    except FileNotFoundError:
+        pass
+    if os.path.isdir(os.path.join(common, "objects")) and os.path.isdir(os.path.join(common, "refs")):
+        return common
+    return None
+
+
+def _git_dir(path: str) -> tuple[str, str, str | None] | None:
+    """Git dir, common dir and worktree top (None if bare or in the git dir) found from path (see :func:`git_dir`)."""
+    path = os.path.abspath(path)
+    device = os.stat(path).st_dev
+    while True:
+        dotgit = os.path.join(path, ".git")
+        if os.path.isfile(dotgit):
+            with open(dotgit, encoding="utf-8") as f:
+                line = f.readline().strip()
+            if not line.startswith("gitdir:"):
+                raise _UnsupportedError
+            gitdir = os.path.normpath(os.path.join(path, line.removeprefix("gitdir:").strip()))
+            if (common := _is_git_dir(gitdir)) is None:
+                raise _UnsupportedError
+            break
+        for gitdir in (dotgit, path):
+            if common := _is_git_dir(gitdir):
+                break
+        if common:
+            break
+        if (parent := os.path.dirname(path)) == path:
+            return None
+        path = parent
+        if os.stat(path).st_dev != device:
+            raise _UnsupportedError
+    uid = os.geteuid()
+    if os.stat(path).st_uid != uid or os.stat(gitdir).st_uid != uid:
+        raise _UnsupportedError
+    return gitdir, common, None if gitdir == path else path
+
+
+def _discover(path: str | os.PathLike | None) -> tuple[str, str, str | None] | None:
+    """Git dir, common dir and top for a file or directory (default: cwd), None if not in a repository.
+
+    Raises:
+        _UnsupportedError: if git has to be used.
+    """
+    if any(name in os.environ for name in _ENVIRON):
+        raise _UnsupportedError
+    path = os.getcwd() if path is None else os.fspath(path)
+    return _git_dir(path if os.path.isdir(path) else os.path.dirname(path))
+
+
+def git_dir(path: str | os.PathLike | None = None) -> tuple[Path, Path] | None:
+    """Git dir and common dir of the repository which contains path, found as git does.
+
+    Follows ``gitdir:`` files (submodules and worktrees) and ``commondir`` (worktrees),
+    the common dir has the config, objects and refs, and it is the same as the git dir but for worktrees.
+
+    Examples:
+        >>> from nodeps import git_dir, Path
+        >>>
+        >>> assert git_dir("/") is None
+        >>> gitdir, common = git_dir(__file__)  # doctest: +SKIP
+        >>> assert gitdir == common == Path(__file__).find_up(name=".git").path  # doctest: +SKIP
+
+    Args:
+        path: path in the repository, file or directory (default: cwd)
+
+    Returns:
+        Git dir and common dir, None if path is not in a repository or is a case git has to be used.
+    """
+    try:
+        rv = _discover(path)
+    except (_UnsupportedError, OSError):
+        return None
+    return None if rv is None else (Path(rv[0]), Path(rv[1]))
+
+
+def _packed_refs(common: str) -> dict[str, str]:
+    """Ref name and SHA in ``packed-refs``, peeled lines are skipped."""
+    file = os.path.join(common, "packed-refs")
+    try:
+        st = os.stat(file)
+    except FileNotFoundError:
+        return {}
+    stamp = (st.st_ino, st.st_size, st.st_mtime_ns)
+    if (value := _PACKED.get(file)) is None or value[0] != stamp:
+        rv = {}
+        with open(file, encoding="utf-8") as f:
+            for line in f:
+                if line[0] not in "#^":
+                    sha, _, name = line.rstrip("\n").partition(" ")
+                    rv[name] = sha
+        _PACKED[file] = value = (stamp, rv)
+    return value[1]
+
+
+def _files_refs(common: str) -> str:
+    """Common dir if refs are files, not ``reftable``.
+
+    Raises:
+        _UnsupportedError: if refs are in ``reftable`` format.
+    """
+    if os.path.isdir(os.path.join(common, "reftable")):
+        raise _UnsupportedError
+    return common
+
+
+def _ref(gitdir: str, common: str, ref: str, depth: int = 0) -> str | None:
+    """SHA of ref, following symbolic refs."""
+    if depth > 5:  # noqa: PLR2004
+        raise _UnsupportedError
+    _files_refs(common)
+    worktree = "/" not in ref or ref.startswith(("refs/bisect/", "refs/rewritten/", "refs/worktree/"))
+    try:
+        with open(os.path.join(gitdir if worktree else common, ref), encoding="utf-8") as f:
+            value = f.read().strip()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return _packed_refs(common).get(ref)
+    if value.startswith("ref:"):
+        return _ref(gitdir, common, value.removeprefix("ref:").strip(), depth + 1)
+    return value
+
+
+def git_ref(path: str | os.PathLike | None = None, ref: str = "HEAD") -> str | None:
+    """SHA of a full ref name, read from the loose refs files and ``packed-refs``, following symbolic refs.
+
+    ``HEAD`` and other per-worktree refs are read from the worktree git dir.
+
+    Examples:
+        >>> import subprocess
+        >>> from nodeps import git_ref
+        >>>
+        >>> assert git_ref() == (subprocess.run("git rev-parse HEAD", capture_output=True, shell=True,
+        ...                      text=True).stdout.strip() or None)
+        >>> assert git_ref(ref="refs/heads/nonexistent") is None
+
+    Args:
+        path: path in the repository, file or directory (default: cwd)
+        ref: full ref name, i.e.: ``refs/remotes/origin/main``
+
+    Returns:
+        SHA or None if not found, or refs can not be read natively (i.e.: reftable), and git has to be used.
+    """
+    try:
+        if (rv := _discover(path)) is None:
+            return None
+        return _ref(*rv[:2], ref)
+    except (_UnsupportedError, OSError):
+        return None
+
+
+def _version_part(text: str) -> tuple:
+    """Key of :func:`version_key` without the suffix rule."""
+    rv = []
+    for chars, digits in _VERSION_RE.findall(text):
+        if chars or digits:
+            rv.append((
+                (*(-1 if c == "~" else ord(c) if c.isalpha() else ord(c) + 256 for c in chars), 0),
+                int(digits or 0),
+            ))
+    rv.append(((0,), 0))
+    return tuple(rv)
+
+
+def version_key(text: str) -> tuple:
+    """Sort key to order as ``sort -V`` (GNU version sort).
+
+    Digits are compared numerically, letters sort before other characters and ``~`` before anything,
+    and the file suffix (i.e.: ``.tar.gz``) is only compared if the rest is equal.
+
+    Examples:
+        >>> from nodeps import version_key
+        >>>
+        >>> sorted(["v1.10.0", "v1.9.0", "v1.9.0~rc1", "v1.9.0-1", "v1.2"], key=version_key)
+        ['v1.2', 'v1.9.0~rc1', 'v1.9.0', 'v1.9.0-1', 'v1.10.0']
+
+    Args:
+        text: version, i.e.: tag
+
+    Returns:
+        Tuple to compare.
+    """
+    return (
+        not text.startswith("."),
+        _version_part(_VERSION_SUFFIX_RE.sub("", text, count=1)),
+        _version_part(text),
+        text,
+    )
+
+
+def git_branch(path: str | os.PathLike | None = None) -> str | None:
+    """Current branch read from ``HEAD``, as ``git branch --show-current``.
+
+    Examples:
+        >>> import subprocess
+        >>> from nodeps import git_branch
+        >>>
+        >>> assert git_branch() == subprocess.run("git branch --show-current", capture_output=True, shell=True,
+        ...                                       text=True).stdout.strip()
+
+    Args:
+        path: path in the repository, file or directory (default: cwd)
+
+    Returns:
+        Branch name, empty if detached, None if not in a repository.
+    """
+    try:
+        if (repo := _discover(path)) is None:
+            return None
+        _files_refs(repo[1])
+        with open(os.path.join(repo[0], "HEAD"), encoding="utf-8") as f:
+            head = f.read().strip()
+    except (_UnsupportedError, OSError):
+        return stdout(f"git -C '{path or os.getcwd()}' branch --show-current")
+    return head.removeprefix("ref: refs/heads/") if head.startswith("ref: refs/heads/") else ""
+
+
+def git_tags(path: str | os.PathLike | None = None) -> list[str] | None:
+    """Tags read from ``refs/tags`` and ``packed-refs``, sorted as ``git tag | sort -V`` (see :func:`version_key`).
+
+    Examples:
+        >>> import subprocess
+        >>> from nodeps import git_tags, version_key
+        >>>
+        >>> assert git_tags() == sorted(subprocess.run("git tag", capture_output=True, shell=True,
+        ...                             text=True).stdout.split(), key=version_key)
+
+    Args:
+        path: path in the repository, file or directory (default: cwd)
+
+    Returns:
+        Sorted tags, None if not in a repository.
+    """
+    try:
+        if (repo := _discover(path)) is None:
+            return None
+        common = _files_refs(repo[1])
+        rv = {name.removeprefix("refs/tags/") for name in _packed_refs(common) if name.startswith("refs/tags/")}
+        tags = os.path.join(common, "refs", "tags")
+        for root, _, files in os.walk(tags):
+            rel = os.path.relpath(root, tags)
+            rv.update(file if rel == "." else f"{rel}/{file}".replace(os.sep, "/") for file in files)
+    except (_UnsupportedError, OSError):
+        if (out := stdout(f"git -C '{path or os.getcwd()}' tag")) is None:
+            return None
+        rv = out.split()
+    return sorted(rv, key=version_key)
+
+
+def _top(repo: tuple[str, str, str | None]) -> str | None:
+    """Real path of the worktree top found by :func:`_discover`, None if bare or in the git dir.
+
+    Raises:
+        _UnsupportedError: if ``core.worktree`` is set.
+    """
+    if "core.worktree" in _config(repo):
+        raise _UnsupportedError
+    return None if repo[2] is None else os.path.realpath(repo[2])
+
+
+def git_top(path: str | os.PathLike | None = None) -> Path | None:
+    """Worktree top, as ``git rev-parse --show-toplevel``.
+
+    Examples:
+        >>> import subprocess
+        >>> from nodeps import git_top, Path
+        >>>
+        >>> top = subprocess.run("git rev-parse --show-toplevel", capture_output=True, shell=True, text=True).stdout
+        >>> assert git_top() == (Path(top.strip()) if top else None)
+
+    Args:
+        path: path in the repository, file or directory (default: cwd)
+
+    Returns:
+        Top or None if not in a worktree (i.e.: bare repository or in the git dir).
+    """
+    try:
+        if (repo := _discover(path)) is None:
+            return None
+        top = _top(repo)
+    except (_UnsupportedError, OSError):
+        rv = stdout(f"git -C '{path or os.getcwd()}' rev-parse --show-toplevel")
+        return Path(rv) if rv else None
+    return None if top is None else Path(top)
+
+
+def _superproject(top: str | os.PathLike, parent: str) -> str:
+    """Top of the repository which contains the submodule top directory, in its parent repository top.
+
+    Raises:
+        _UnsupportedError: if the submodule is not in ``.gitmodules`` of the parent repository.
+    """
+    superproject = os.path.realpath(parent)
+    rel = os.path.relpath(top, superproject).replace(os.sep, "/")
+    file = os.path.join(superproject, ".gitmodules")
+    if not os.path.isfile(file) or not any(
+            key.startswith("submodule.") and key.endswith(".path") and value == rel
+            for key, value in git_config_parse(file)
+    ):
+        raise _UnsupportedError
+    return superproject
+
+
+def git_superproject(path: str | os.PathLike | None = None) -> Path | None:
+    """Top of the superproject if the repository is a submodule, as ``git rev-parse --show-superproject-working-tree``.
+
+    The submodule has to be in ``.gitmodules`` of the repository which contains its top directory,
+    otherwise (i.e.: a repository inside another) git is used.
+
+    Examples:
+        >>> from nodeps import git_superproject
+        >>>
+        >>> assert git_superproject("/") is None
+
+    Args:
+        path: path in the repository, file or directory (default: cwd)
+
+    Returns:
+        Superproject top, None if not a submodule.
+    """
+    try:
+        if (top := git_top(path)) is None:
+            return None
+        if (repo := _discover(os.path.dirname(top))) is None or repo[2] is None:
+            return None
+        superproject = _superproject(top, repo[2])
+    except (_UnsupportedError, OSError):
+        rv = stdout(f"git -C '{path or os.getcwd()}' rev-parse --show-superproject-working-tree")
+        return Path(rv) if rv else None
+    return Path(superproject)
+
+
+@functools.lru_cache
+def _wildmatch(pattern: str, icase: bool = False) -> re.Pattern:
+    """Compile git wildmatch pattern with pathname semantics: ``*`` and ``?`` do not match ``/``."""
+    rv, i, n = [], 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/"):
+            if pattern.startswith("/", i + 2):
+                rv.append("(?:.*/)?")
+                i += 3
+                continue
+            if i + 2 == n:
+                rv.append(".*")
+                break
+        if c == "*":
+            rv.append("[^/]*")
+            i = len(pattern) - len(pattern[i:].lstrip("*"))
+            continue
+        if c == "?":
+            rv.append("[^/]")
+        elif c == "[" and (end := pattern.find("]", i + (3 if pattern[i + 1:i + 2] in ("!", "^") else 2))) != -1:
+            body = pattern[i + 1:end].replace("\\", "\\\\")
+            rv.append("[^" + body[1:] + "]" if body[:1] in ("!", "^") else "[" + body + "]")
+            i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            rv.append(re.escape(pattern[i]))
+        else:
+            rv.append(re.escape(c))
+        i += 1
+    return re.compile("".join(rv), re.IGNORECASE if icase else 0)
+
+
+def _include_if(condition: str, file: str, gitdir: str | None) -> bool:
+    """``includeIf`` condition is true."""
+    kind, _, pattern = condition.partition(":")
+    if kind == "hasconfig":
+        raise _UnsupportedError
+    if kind not in ("gitdir", "gitdir/i", "onbranch") or gitdir is None:
+        return False
+    if pattern.endswith("/"):
+        pattern += "**"
+    if kind == "onbranch":
+        try:
+            with open(os.path.join(gitdir, "HEAD"), encoding="utf-8") as f:
+                head = f.read().strip()
+        except OSError:
+            return False
+        return head.startswith("ref: refs/heads/") and bool(
+            _wildmatch(pattern).fullmatch(head.removeprefix("ref: refs/heads/"))
+        )
+    if pattern.startswith("~/"):
+        pattern = os.path.expanduser(pattern)
+    elif pattern.startswith("./"):
+        pattern = os.path.join(os.path.dirname(file), pattern[2:])
+    elif not os.path.isabs(pattern):
+        pattern = f"**/{pattern}"
+    regex = _wildmatch(pattern, kind == "gitdir/i")
+    return any(regex.fullmatch(text) for text in (gitdir, os.path.realpath(gitdir)))
+
+
+def _read(file: str, gitdir: str | None, rv: list[tuple[str, str | None]], depth: int = 0) -> None:
+    """Append entries of file and includes to rv, missing files are ignored."""
+    if depth > _INCLUDE_DEPTH:
+        raise _UnsupportedError
+    try:
+        entries = git_config_parse(file)
+    except FileNotFoundError:
+        return
+    for key, value in entries:
+        rv.append((key, value))
+        if value and key.endswith(".path") and (
+                key == "include.path" or (
+                key.startswith("includeif.") and _include_if(key[len("includeif."):-len(".path")], file, gitdir))
+        ):
+            include = os.path.expanduser(value)
+            _read(os.path.join(os.path.dirname(file), include), gitdir, rv, depth + 1)
+
+
+def _global_files() -> list[str]:
+    """Global config files in the order git reads them: ``$GIT_CONFIG_GLOBAL`` or XDG and ``~/.gitconfig``."""
+    if (file := os.environ.get("GIT_CONFIG_GLOBAL")) is not None:
+        return [file]
+    xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    return [os.path.join(xdg, "git", "config"), os.path.expanduser("~/.gitconfig")]
+
+
+def _config(repo: tuple[str, str, str | None] | None) -> dict[str, list[str | None]]:
+    """System, global, local and worktree config for the repository found by :func:`_discover`."""
+    gitdir, common, _ = repo or (None, None, None)
+    files = []
+    if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+        files.append(os.environ.get("GIT_CONFIG_SYSTEM", "/etc/gitconfig"))
+    entries = []
+    for file in files + _global_files():
+        if file:
+            _read(file, gitdir, entries)
+    if common is not None:
+        local = len(entries)
+        _read(os.path.join(common, "config"), gitdir, entries)
+        if any(key == "extensions.worktreeconfig" and (value is None or value.lower() in ("true", "yes", "on", "1"))
+               for key, value in entries[local:]):
+            _read(os.path.join(gitdir, "config.worktree"), gitdir, entries)
+    rv = {}
+    for key, value in entries:
+        rv.setdefault(key, []).append(value)
+    return rv
+
+
+def git_config(path: str | os.PathLike | None = None) -> dict[str, list[str | None]] | None:
+    """Config of the repository which contains path, as ``git -C path config --list`` without running git.
+
+    Reads the system, global (XDG and ``~/.gitconfig``), local and worktree config files,
+    following ``include.path``, and ``includeIf.<condition>.path`` for ``gitdir:``, ``gitdir/i:`` and ``onbranch:``.
+
+    Examples:
+        >>> from nodeps import git_config
+        >>>
+        >>> assert "core.bare" in git_config(__file__)  # doctest: +SKIP
+        >>> assert git_config("/") is None or "core.bare" not in git_config("/")
+
+    Args:
+        path: path in the repository, file or directory (default: cwd)
+
+    Returns:
+        Dictionary of canonical key (see :func:`git_config_parse`) and list of values in the order git reads them,
+        None if git has to be used.
+    """
+    try:
+        return _config(_discover(path))
+    except (_UnsupportedError, OSError):
+        return None
+
+
+def git_config_cache_clear() -> None:
+    """Clears the memo of parsed config and packed-refs files, which are otherwise re-read only when modified.
+
+    Examples:
+        >>> from nodeps import git_config_cache_clear
+        >>>
+        >>> git_config_cache_clear()
+    """
+    _PACKED.clear()
+    _PARSED.clear()
+
+
+def git_global_config() -> dict[str, list[str | None]] | None:
+    """Global config, as ``git config --global --list`` without running git (includes are not followed).
+
+    XDG and ``~/.gitconfig`` are both read as git >= 2.46 does, older versions only read ``~/.gitconfig``
+    if it exists.
+
+    Files are parsed once and re-read only when modified (see :func:`git_config_parse`),
+    so it can be called for each repository (i.e.: :func:`nodeps.git_config_global`).
+
+    Examples:
+        >>> import subprocess
+        >>> from nodeps import git_global_config
+        >>>
+        >>> config = git_global_config()
+        >>> assert config is None or ("user.name" in config) == (subprocess.run(
+        ...     "git config --global user.name", capture_output=True, shell=True).returncode == 0)
+
+    Returns:
+        Dictionary of canonical key (see :func:`git_config_parse`) and list of values in the order git reads them,
+        None if a file can not be parsed.
+    """
+    rv = {}
+    try:
+        for file in _global_files():
+            with contextlib.suppress(FileNotFoundError, NotADirectoryError):
+                for key, value in git_config_parse(file):
+                    rv.setdefault(key, []).append(value)
+    except (_UnsupportedError, OSError):
+        return None
+    return rv
+
+
+def git_remote_url(
+        path: str | os.PathLike | None = None, remote: str = "origin", insteadof: bool = False
+) -> str | None:
+    """Remote url of the repository which contains path, read natively from the config files when possible.
+
+    Same value as ``git -C path config --get remote.<remote>.url``, falls back to it if git has to be used.
+
+    Examples:
+        >>> import subprocess
+        >>> from nodeps import git_remote_url
+        >>>
+        >>> url = git_remote_url()
+        >>> assert url == (subprocess.run("git config --get remote.origin.url", capture_output=True, shell=True,
+        ...                text=True).stdout.strip() or None)
+
+    Args:
+        path: path in the repository, file or directory (default: cwd)
+        remote: remote name
+        insteadof: apply ``url.<base>.insteadOf`` rewrites, as ``git remote get-url``
+
+    Returns:
+        Url or None if the path is not in a repository or the remote has no url.
+    """
+    path = os.getcwd() if path is None else os.fspath(path)
+    if (config := git_config(path)) is None:
+        if insteadof:
+            return stdout(f"git -C '{path}' remote get-url {remote}")
+        return stdout(f"git -C '{path}' config --get {_key(f'remote.{remote}.url')}")
+    if (values := config.get(_key(f"remote.{remote}.url"))) is None:
+        return None
+    url = values[-1] or ""
+    if insteadof:
+        longest = ""
+        for key, values in config.items():
+            if key.startswith("url.") and key.endswith(".insteadof"):
+                for value in values:
+                    if value and url.startswith(value) and len(value) > len(longest):
+                        longest, base = value, key[len("url."):-len(".insteadof")]
+        if longest:
+            url = base + url[len(longest):]
+    return url
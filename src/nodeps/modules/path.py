@@ -15,28 +15,39 @@ __all__ = (
 
 import contextlib
 import dataclasses
+import fcntl
 import grp
 import hashlib
 import os
 import pathlib
 import pickle
 import pwd
+import shutil
 import stat
 import subprocess
 import sys
 import sysconfig
 import tempfile
+import threading
+import time
 import tokenize
 from collections.abc import Iterable
 from typing import IO, TYPE_CHECKING, Any, AnyStr, TypeAlias, cast
 
-from .constants import MACOS, SUDO, USER
+from .constants import MACOS, PICKLE_MAXSIZE, PICKLE_SCHEMA, SUDO, USER
+from .datas import PickleInfo
 from .errors import InvalidArgumentError
 from .typings import StrOrBytesPath
 
 if TYPE_CHECKING:
     import configparser
     import types
+    from contextlib import AbstractContextManager
+
+_PICKLE_INFO = PickleInfo()
+_PICKLE_LOCK = threading.Lock()
+_PICKLE_SIZE: dict[Path, int] = {}
+_PICKLE_HELD: set[tuple[int, Path]] = set()
 
 
 @dataclasses.dataclass
@@ -1141,11 +1152,22 @@ class Path(pathlib.Path, pathlib.PurePosixPath):
         )
 
     @classmethod
-    def pickle(cls, data=None, name=None, rm=False):
+    def pickle(cls, data=None, name=None, rm=False, *, ttl=None, namespace=None, version=None, func=None):
         """Load or dumps pickle file from ~/.pickle directory.
 
+        Files are written to a temporary file and renamed holding :meth:`pickle_lock`, so a reader never loads
+        a partial file. Each file starts with a header with :data:`nodeps.PICKLE_SCHEMA`, ``version`` and
+        expiration time, and it is discarded on load if the stamps differ, ttl has expired or it can not be
+        unpickled, holding the lock and only if the file has not been replaced since it was read.
+        Loads update the modification time, and the least recently used files are evicted when the directory
+        exceeds :data:`nodeps.PICKLE_MAXSIZE` bytes.
+
+        With ``func``, a miss calls ``func`` and dumps the result holding :meth:`pickle_lock`, so when
+        threads or processes miss the same name, only one calls ``func`` and the others load its result.
+
         Examples:
             >>> import pickle
+            >>> import time
             >>> from nodeps import Path
             >>>
             >>> assert Path.pickle(name="test") is None
@@ -1159,12 +1181,28 @@ class Path(pathlib.Path, pathlib.PurePosixPath):
             >>> assert Path.pickle(name="test") == obj2
             >>>
             >>> assert Path.pickle(name="test", rm=True) is None
+            >>>
+            >>> _ = Path.pickle(obj, name="test", ttl=0.01, namespace="tests", version=1)
+            >>> assert Path.pickle(name="test", namespace="tests", version=1) == obj
+            >>> assert Path.pickle(name="test", namespace="tests", version=2) is None
+            >>> _ = Path.pickle(obj, name="test", ttl=0.01, namespace="tests", version=1)
+            >>> time.sleep(0.01)
+            >>> assert Path.pickle(name="test", namespace="tests", version=1) is None
+            >>>
+            >>> assert Path.pickle(name="test", func=lambda: obj) == obj
+            >>> assert Path.pickle(name="test", func=lambda: obj2) == obj
+            >>> assert Path.pickle(name="test", func=lambda: obj2, rm=True) == obj2
+            >>> _ = Path.pickle(name="test", rm=True)
 
         Args:
             data: data to pickle (default: None to read from file).
             name: name.__name__ or name of object which will be used as file stem
                 (default: None to get the name from __name__ in data)
             rm: rm existing data.
+            ttl: seconds to expire the data written (default: None to never expire).
+            namespace: subdirectory of ~/.pickle (default: None).
+            version: stamp to discard data written with other version (default: None).
+            func: callable to compute and dump data when not found or ``rm`` (default: None).
 
         Raises:
             InvalidArgumentError: when no name can be derived from data.__name__ or not name provided
@@ -1178,27 +1216,128 @@ class Path(pathlib.Path, pathlib.PurePosixPath):
             raise InvalidArgumentError(msg)
         name = name.replace("/", "_")
 
-        if not (directory := cls("~/.pickle").expanduser()).exists():
-            directory.mkdir()
+        root = cls("~/.pickle").expanduser()
+        directory = root / namespace if namespace else root
         file = directory / f"{name}.pickle"
 
-        if rm or (file.is_file() and file.stat().st_size == 0):
-            file.rm()
-
-        if data is None and file.is_file():
-            with file.open("rb") as f:
-                try:
-                    return pickle.load(f)  # noqa: S301
-                except ModuleNotFoundError:
-                    file.rm()  # No module name if source has changed.
-                    return None
-        if data is None and not file.is_file():
-            return None
-        if data is not None:
-            with file.open("wb") as f:
-                pickle.dump(data, f)
-                return data
-        return None
+        if func is not None:
+            kwargs = {"name": name, "ttl": ttl, "namespace": namespace, "version": version}
+            if not rm and (rv := cls.pickle(**kwargs)) is not None:
+                return rv
+            with cls.pickle_lock(name, namespace):
+                if not rm and (rv := cls.pickle(**kwargs)) is not None:
+                    return rv
+                return None if (data := func()) is None else cls.pickle(data, **kwargs)
+
+        if rm:
+            _pickle_unlink(file)
+            _pickle_unlink_lock(file)
+
+        if data is None:
+            if rm:
+                return None
+            rv, st = _pickle_read(file, version)
+            if rv is None:
+                _pickle_count(misses=1)
+                if st is not None:
+                    _pickle_discard(file, st, cls.pickle_lock(name, namespace, blocking=False))
+            else:
+                _pickle_count(hits=1)
+                with contextlib.suppress(FileNotFoundError):
+                    os.utime(file)
+            return rv
+
+        _pickle_evict(root, _pickle_write(file, data, ttl, version, cls.pickle_lock(name, namespace)))
+        return data
+
+    @classmethod
+    def pickle_clear(cls, namespace=None):
+        """Remove ~/.pickle files, or only the ``namespace`` files.
+
+        Examples:
+            >>> from nodeps import Path
+            >>>
+            >>> _ = Path.pickle({'a': 1}, name="test", namespace="tests")
+            >>> Path.pickle_clear("tests")
+            >>> assert Path.pickle(name="test", namespace="tests") is None
+
+        Args:
+            namespace: subdirectory of ~/.pickle (default: None to remove all).
+        """
+        root = cls("~/.pickle").expanduser()
+        shutil.rmtree(root / namespace if namespace else root, ignore_errors=True)
+        _PICKLE_SIZE.pop(root, None)
+
+    @classmethod
+    @contextlib.contextmanager
+    def pickle_lock(cls, name, namespace=None, blocking=True):
+        """Exclusive advisory lock of :meth:`pickle` ``name`` between threads and processes, reentrant in a thread.
+
+        Held to replace and to discard files, and to compute and dump with :meth:`pickle` ``func``.
+        The lock file is checked to be the same after the lock is acquired, so it can be removed while held.
+
+        Examples:
+            >>> from nodeps import Path
+            >>>
+            >>> with Path.pickle_lock("test") as locked:
+            ...     _ = Path.pickle({'a': 1}, name="test")
+            >>> assert locked is True
+            >>> assert Path.pickle(name="test", rm=True) is None
+
+        Args:
+            name: name.__name__ or name of :meth:`pickle`.
+            namespace: subdirectory of ~/.pickle (default: None).
+            blocking: wait for the lock, otherwise do not wait (default: True).
+
+        Yields:
+            True if the lock is held, False if not ``blocking`` and other thread or process holds the lock.
+        """
+        name = (getattr(name, "__name__", None) or name).replace("/", "_")
+        directory = cls("~/.pickle").expanduser()
+        directory = directory / namespace if namespace else directory
+        lock = directory / f".{name}.lock"
+        if (key := (threading.get_ident(), lock)) in _PICKLE_HELD:
+            yield True
+            return
+        pathlib.Path.mkdir(directory, parents=True, exist_ok=True)
+        while True:
+            f = lock.open("wb")
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                f.close()
+                yield False
+                return
+            with contextlib.suppress(FileNotFoundError):
+                if lock.stat().st_ino == os.fstat(f.fileno()).st_ino:
+                    break
+            f.close()
+        _PICKLE_HELD.add(key)
+        try:
+            yield True
+        finally:
+            _PICKLE_HELD.discard(key)
+            f.close()
+
+    @classmethod
+    def pickle_info(cls):
+        """Statistics of :meth:`pickle` in this process, and entries and bytes in ~/.pickle.
+
+        Examples:
+            >>> from nodeps import Path
+            >>>
+            >>> _ = Path.pickle({'a': 1}, name="test")
+            >>> _ = Path.pickle(name="test")
+            >>> info = Path.pickle_info()
+            >>> assert info.hits >= 1 and info.writes >= 1 and info.entries >= 1
+            >>> _ = Path.pickle(name="test", rm=True)
+
+        Returns:
+            :class:`nodeps.PickleInfo`
+        """
+        files = _pickle_files(cls("~/.pickle").expanduser())
+        with _PICKLE_LOCK:
+            return dataclasses.replace(_PICKLE_INFO, entries=len(files), size=sum(size for _, size, _ in files))
 
     def privileges(self, effective_ids=True):
         """Return privileges of file.
@@ -1865,6 +2004,126 @@ class PathStat:
     user: str
 
 
+def _pickle_evict(root: Path, size: int) -> None:
+    """Evict least recently used files in ``root`` when exceeds :data:`nodeps.PICKLE_MAXSIZE`.
+
+    The size is scanned on the first write of the process, and then estimated with the bytes written.
+    When the estimate exceeds the maximum, the directory is scanned and files are removed by modification time
+    until 90% of the maximum.
+    """
+    with _PICKLE_LOCK:
+        if root not in _PICKLE_SIZE:
+            _PICKLE_SIZE[root] = sum(item[1] for item in _pickle_files(root))
+        else:
+            _PICKLE_SIZE[root] += size
+        if _PICKLE_SIZE[root] <= PICKLE_MAXSIZE:
+            return
+        files = sorted(_pickle_files(root))
+        total = sum(item[1] for item in files)
+        for _, item_size, path in files:
+            if total <= PICKLE_MAXSIZE * 0.9:
+                break
+            _pickle_unlink(path)
+            _pickle_unlink_lock(path)
+            _PICKLE_INFO.evictions += 1
+            total -= item_size
+        _PICKLE_SIZE[root] = total
+
+
+def _pickle_count(**kwargs: int) -> None:
+    """Increments the :class:`nodeps.PickleInfo` counters of this process."""
+    with _PICKLE_LOCK:
+        for key, value in kwargs.items():
+            setattr(_PICKLE_INFO, key, getattr(_PICKLE_INFO, key) + value)
+
+
+def _pickle_discard(file: Path, st: os.stat_result, lock: AbstractContextManager[bool]) -> None:
+    """Remove expired, stale or partial file, holding the lock and only if it has not been replaced since read."""
+    with lock as locked:
+        if locked:
+            with contextlib.suppress(FileNotFoundError):
+                if (new := file.stat()).st_ino == st.st_ino and new.st_mtime_ns == st.st_mtime_ns:
+                    _pickle_unlink(file)
+    _pickle_unlink_lock(file)
+
+
+def _pickle_files(directory: AnyPath) -> list[tuple[int, int, str]]:
+    """Modification time, size and path of the pickle files in ``directory`` and its subdirectories.
+
+    Lock files and temporary files being written are not included.
+    """
+    rv = []
+    with contextlib.suppress(FileNotFoundError), os.scandir(directory) as it:
+        for entry in it:
+            with contextlib.suppress(FileNotFoundError):
+                if entry.is_dir(follow_symlinks=False):
+                    rv.extend(_pickle_files(entry.path))
+                elif entry.name.endswith(".pickle"):
+                    st = entry.stat(follow_symlinks=False)
+                    rv.append((st.st_mtime_ns, st.st_size, entry.path))
+    return rv
+
+
+def _pickle_read(file: Path, version: Any) -> tuple[Any, os.stat_result | None]:
+    """Data of the pickle file and None, or None and the file status if expired, stale or partial.
+
+    Returns:
+        None and None if the file does not exist.
+    """
+    try:
+        f = file.open("rb")
+    except FileNotFoundError:
+        return None, None
+    with f:
+        st = os.fstat(f.fileno())
+        # Partial or previous format, or no module name if source has changed.
+        with contextlib.suppress(EOFError, ImportError, AttributeError, TypeError, ValueError,
+                                 pickle.UnpicklingError):
+            schema, stamp, expires = pickle.load(f)  # noqa: S301
+            if schema == PICKLE_SCHEMA and stamp == version:
+                if expires is None or expires >= time.time():
+                    return pickle.load(f), None  # noqa: S301
+                _pickle_count(expired=1)
+                return None, st
+    _pickle_count(stale=1)
+    return None, st
+
+
+def _pickle_unlink(path: AnyPath) -> None:
+    """Remove file if exists."""
+    pathlib.Path(path).unlink(missing_ok=True)
+
+
+def _pickle_unlink_lock(path: AnyPath) -> None:
+    """Remove the :meth:`Path.pickle_lock` file of a pickle file if it is not held."""
+    lock = pathlib.Path(path).with_name(f".{pathlib.Path(path).stem}.lock")
+    with contextlib.suppress(FileNotFoundError, BlockingIOError), lock.open("rb") as f:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        lock.unlink()
+
+
+def _pickle_write(file: Path, data: Any, ttl: float | None, version: Any, lock: AbstractContextManager[bool]) -> int:
+    """Writes the header and data to a temporary file, and replaces the file holding the lock.
+
+    Returns:
+        Bytes written.
+    """
+    pathlib.Path.mkdir(file.parent, parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{file.stem[:64]}.", suffix=".tmp", dir=file.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((PICKLE_SCHEMA, version, None if ttl is None else time.time() + ttl), f)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            size = f.tell()
+        with lock:
+            pathlib.Path(tmp).replace(file)
+    except BaseException:
+        _pickle_unlink(tmp)
+        raise
+    _pickle_count(writes=1)
+    return size
+
+
 def toiter(obj, always=False, split=" "):
     """To iter.
 
@@ -1,4 +1,6 @@
 """Platforms module."""
+import re
+
 from .assembla import AssemblaPlatform
 from .base import BasePlatform
 from .bitbucket import BitbucketPlatform
@@ -17,3 +19,63 @@ PLATFORMS = [
     # Match url
     ("base", BasePlatform()),
 ]
+
+PLATFORMS_INDEX = dict(PLATFORMS)
+"""Platform name to Platform object."""
+
+DOMAINS_INDEX = {domain: name for name, plat in PLATFORMS if plat.DOMAINS for domain in plat.DOMAINS}
+"""Domain to name of the platform which only matches its DOMAINS."""
+
+_DOMAINS_RE = re.compile("|".join(re.escape(domain) for domain in sorted(DOMAINS_INDEX, key=len, reverse=True)))
+"""Finds the DOMAINS of the platforms in the url, a platform with DOMAINS can not match if not found."""
+
+_SCHEMES = (
+    ("file://", "file"),
+    ("git+file://", "file"),
+    ("git://", "git"),
+    ("http://", "http"),
+    ("https://", "https"),
+    ("git+https://", "https"),
+)
+"""Prefix (lower case) to the only non ssh pattern protocol which can match.
+
+ssh patterns do not need a scheme but always need "@".
+"""
+
+_DISPATCH = {}
+"""Memo of candidates by scheme, "@" in url and platforms with DOMAINS found in the url."""
+
+
+def dispatch(url: str) -> list[tuple[str, BasePlatform, str, re.Pattern]]:
+    """Platform name, Platform object, protocol and compiled pattern which can match the url.
+
+    Patterns are classified by scheme and domain, and returned in the same order as :data:`PLATFORMS`
+    and the platform PATTERNS, so the first match is the same as trying all the patterns.
+
+    Examples:
+        >>> from nodeps.modules.platforms import dispatch
+        >>>
+        >>> [(name, protocol) for name, _, protocol, _ in dispatch("https://github.com/cpython/cpython")]
+        [('github', 'https'), ('gitlab', 'https'), ('base', 'https')]
+        >>> [(name, protocol) for name, _, protocol, _ in dispatch("git@bitbucket.org:AaronO/some-repo.git")]
+        [('bitbucket', 'ssh'), ('gitlab', 'ssh'), ('base', 'ssh')]
+
+    Args:
+        url: url
+
+    Returns:
+        List of platform name, Platform object, protocol and compiled pattern.
+    """
+    lower = url[:12].lower()
+    scheme = next((protocol for prefix, protocol in _SCHEMES if lower.startswith(prefix)), None)
+    names = frozenset(DOMAINS_INDEX[domain] for domain in _DOMAINS_RE.findall(url))
+    key = (scheme, "@" in url, names)
+    if (rv := _DISPATCH.get(key)) is None:
+        rv = _DISPATCH[key] = [
+            (name, plat, protocol, regex)
+            for name, plat in PLATFORMS
+            if not plat.DOMAINS or name in names
+            for protocol, regex in plat.COMPILED_PATTERNS.items()
+            if protocol == scheme or (protocol == "ssh" and key[1])
+        ]
+    return rv
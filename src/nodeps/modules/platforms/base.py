@@ -1,9 +1,64 @@
 """Base platform."""
 import dataclasses
 import itertools
+import operator
 import re
+from collections.abc import Callable
 from typing import ClassVar
 
+_FORMAT_FIELDS: dict[str, tuple[str, Callable[[object], str]]] = {
+    "dot_git": ("repo", lambda o: "" if o.repo.endswith(".git") else ".git"),
+    "groups_slash": ("groups_path", lambda o: f"{o.groups_path}/" if o.groups_path else ""),
+    "port_slash": ("port", lambda o: f"{o.port}/" if o.port else ""),
+}
+"""Attribute and function of the FORMATS fields which are not attributes of the parsed url."""
+_FORMAT_RE = re.compile(r"%\((\w+)\)s|%%")
+
+
+def formatter(template: str) -> tuple[Callable[[object], str], Callable[[object], tuple[str, ...]]]:
+    """Compile a FORMATS template to a function of the parsed url (i.e.: GitUrl) which returns the url.
+
+    The result is the same as ``template % items``, where items are the attributes and the fields
+    in :data:`_FORMAT_FIELDS`, but without building the items dictionary.
+
+    Examples:
+        >>> from types import SimpleNamespace
+        >>> from nodeps.modules.platforms.base import formatter
+        >>>
+        >>> func, key = formatter("git@%(domain)s:%(port_slash)s%(repo)s%(dot_git)s")
+        >>> o = SimpleNamespace(domain="github.com", port="", repo="cpython")
+        >>> func(o), key(o)
+        ('git@github.com:cpython.git', ('github.com', '', 'cpython'))
+
+    Args:
+        template: %-format template with named fields
+
+    Returns:
+        Function of the parsed url, and function which returns the attributes used by the url.
+    """
+    attrs, parts, start = {}, [], 0
+    for match in _FORMAT_RE.finditer(template):
+        parts.append(template[start:match.start()])
+        start = match.end()
+        if (name := match.group(1)) is None:
+            parts.append("%")
+        elif name in _FORMAT_FIELDS:
+            attr, func = _FORMAT_FIELDS[name]
+            attrs[attr] = None
+            parts.append(func)
+        else:
+            attrs[name] = None
+            parts.append(operator.attrgetter(name))
+    parts.append(template[start:])
+    funcs = tuple((lambda _, value=part: value) if isinstance(part, str) else part for part in parts if part != "")
+
+    def format_url(o: object) -> str:
+        return "".join([func(o) for func in funcs])
+
+    names = tuple(attrs)
+    key = operator.attrgetter(*names) if len(names) > 1 else lambda o: tuple(getattr(o, name) for name in names)
+    return format_url, key
+
 
 @dataclasses.dataclass
 class BasePlatform:
@@ -36,6 +91,9 @@ class BasePlatform:
         # Precompile PATTERNS
         self.COMPILED_PATTERNS = {proto: re.compile(regex, re.IGNORECASE) for proto, regex in self.PATTERNS.items()}
 
+        # Precompile FORMATS
+        self._formatters()
+
         # Supported protocols
         self.PROTOCOLS = list(self.FORMATS.keys())
 
@@ -44,6 +102,21 @@ class BasePlatform:
             if sub:
                 self.SKIP_DOMAINS = list(itertools.chain.from_iterable(sub))
 
+    def __getstate__(self):
+        """State without FORMATTERS, the compiled functions can not be pickled (i.e.: :meth:`nodeps.Project.repos`)."""
+        return {key: value for key, value in self.__dict__.items() if key not in ("FORMATTERS", "FORMAT_KEYS")}
+
+    def __setstate__(self, state):
+        """Restore state and compile FORMATTERS."""
+        self.__dict__.update(state)
+        self._formatters()
+
+    def _formatters(self):
+        """Compile FORMATTERS and FORMAT_KEYS, the attributes used by the url, from FORMATS."""
+        self.FORMATTERS, self.FORMAT_KEYS = {}, {}
+        for proto, template in self.FORMATS.items():
+            self.FORMATTERS[proto], self.FORMAT_KEYS[proto] = formatter(template)
+
     @staticmethod
     def clean_data(data):
         """Clean data."""
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 __all__ = ("Project",)
 
+import asyncio
+import concurrent.futures
 import copy
 import dataclasses
 import datetime
@@ -15,29 +17,45 @@ import sys
 import sysconfig
 import types
 from contextvars import ContextVar
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
+from . import constants
 from .classes import ColorLogger, ConfigParser
 from .constants import (
+    AIOGH_LIMIT,
     AUTHOR,
     CI,
-    DOCKER,
-    DOCKER_COMMAND,
     EMAIL,
     GIT,
     NODEPS_PIP_POST_INSTALL_FILENAME,
     NODEPS_PROJECT_NAME,
-    NODEPS_TOP,
     PYTHON_DEFAULT_VERSION,
     PYTHON_VERSIONS,
 )
 from .enums import Bump, ProjectRepos
 from .errors import CalledProcessError, InvalidArgumentError
-from .functions import completions, dict_sort, exec_module_from_file, findfile, findup, in_tox, suppress, urljson, which
-from .gh import Gh
+from .functions import (
+    aioloop,
+    completions,
+    dict_sort,
+    exec_module_from_file,
+    findfile,
+    findup,
+    in_tox,
+    suppress,
+    urljson,
+    urljson_many,
+    which,
+)
+from .gh import Gh, aiogh_sync
 from .metapath import pipmetapathfinder
 from .path import FileConfig, Path, toiter
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .datas import GitSync
+
 NODEPS_QUIET: ContextVar[bool] = ContextVar("NODEPS_QUIET", default=True)
 """Global variable to supress warn in setuptools"""
 
@@ -79,7 +97,7 @@ class Project:
 
     def __post_init__(self, rm: bool = False):  # noqa: PLR0912, PLR0915
         """Post init."""
-        self.ci = any([in_tox(), CI, DOCKER])
+        self.ci = any([in_tox(), CI, constants.DOCKER])
         self.data = self.data if self.data else Path.cwd()
         data = Path(self.data.__file__ if isinstance(self.data, types.ModuleType) else self.data)
         if (
@@ -324,7 +342,7 @@ class Project:
         ContextVar("NODEPS_QUIET").set(quiet)
 
         rc = 0
-        if not DOCKER and DOCKER_COMMAND and (dockerfile := self.root / "Dockerfile").is_file():
+        if not constants.DOCKER and constants.DOCKER_COMMAND and (dockerfile := self.root / "Dockerfile").is_file():
             for version in PYTHON_VERSIONS:
                 tag = f"{GIT}/{self.name}:{version}"
                 latest = f"-t {GIT}/{self.name}" if version == PYTHON_DEFAULT_VERSION else ""
@@ -494,6 +512,33 @@ class Project:
         """
         return urljson(f"https://pypi.org/pypi/{self.name}/json", rm=rm)
 
+    @classmethod
+    def pypi_many(
+            cls,
+            data: Iterable[str | Project],
+            rm: bool = False,
+    ) -> dict[str, dict[str, str | list | dict[str, str | list | dict[str, str | list]]] | Exception]:
+        """Pypi information for many packages with concurrent requests (see :func:`nodeps.urljson_many`).
+
+        Examples:
+            >>> from nodeps import Project
+            >>> from nodeps import NODEPS_PROJECT_NAME
+            >>>
+            >>> rv = Project.pypi_many([NODEPS_PROJECT_NAME, "pip"])
+            >>> assert rv[NODEPS_PROJECT_NAME]["info"]["name"] == NODEPS_PROJECT_NAME
+            >>> assert rv["pip"]["info"]["name"] == "pip"
+
+        Args:
+            data: package names or :class:`Project` instances
+            rm: use pickle cache or revalidate it.
+
+        Returns:
+            Dictionary of package name and pypi information, or the exception raised by the request.
+        """
+        names = [item.name if isinstance(item, Project) else item for item in data]
+        return dict(zip(names, urljson_many([f"https://pypi.org/pypi/{name}/json" for name in names], rm=rm),
+                        strict=True))
+
     def pytest(self, version: str = PYTHON_DEFAULT_VERSION) -> int:
         """Runs pytest."""
         if self.pyproject_toml.file:
@@ -521,7 +566,8 @@ class Project:
             sync: bool = False,
             archive: bool = False,
             rm: bool = False,
-    ) -> list[Path] | list[str] | dict[str, Project | str] | None:
+            workers: int = AIOGH_LIMIT,
+    ) -> list[Path] | list[str] | dict[str, Project | str] | list[GitSync]:
         """Repo paths, names or Project instances under home, Archive or parent of nodeps top.
 
         Examples:
@@ -540,16 +586,19 @@ class Project:
 
         Args:
             ret: return names, paths, dict or instances
-            sync: push or pull all repos
+            sync: push or pull all repos concurrently (see :func:`nodeps.aiogh_sync`) and return the results,
+                in a thread if called from a running event loop
             archive: look for repos under ~/Archive
             rm: remove cache
+            workers: maximum number of repos syncing at the same time
         """
         if archive:
             rm = True
-        if rm or not (rv := Path.pickle(name=cls.repos)):
+
+        def scan() -> dict[ProjectRepos, dict[str, Project] | list[str | Path]]:
             dev = home = Path.home()
             add = sorted(add.iterdir()) if (add := home / "Archive").is_dir() and archive else []
-            dev = sorted(dev.iterdir()) if NODEPS_TOP and (dev := NODEPS_TOP.parent) != home else []
+            dev = sorted(dev.iterdir()) if constants.NODEPS_TOP and (dev := constants.NODEPS_TOP.parent) != home else []
             rv = {
                 ProjectRepos.DICT: {},
                 ProjectRepos.INSTANCES: {},
@@ -557,8 +606,13 @@ class Project:
                 ProjectRepos.PATHS: [],
                 ProjectRepos.PY: {},
             }
-            for path in add + dev + sorted(home.iterdir()):
-                if path.is_dir() and (path / ".git").exists() and Gh(path).admin(rm=rm):
+            ghs = {path: Gh(path) for path in add + dev + sorted(home.iterdir())
+                   if path.is_dir() and (path / ".git").exists()}
+            admin = Gh.github_many(ghs.values(), repos=False, rm=rm)
+            for path, gh in ghs.items():
+                if error := admin[gh.ownerrepo].get("error"):
+                    raise error
+                if admin[gh.ownerrepo]["admin"]:
                     instance = cls(path)
                     name = path.name
                     rv[ProjectRepos.DICT] |= {name: path}
@@ -567,18 +621,27 @@ class Project:
                     rv[ProjectRepos.PATHS].append(path)
                     if instance.pyproject_toml.file:
                         rv[ProjectRepos.PY] |= {name: instance}
-            if not archive:
-                Path.pickle(name=cls.repos, data=rv, rm=rm)
+            return rv
 
-        if not rv:
-            rv: dict[ProjectRepos, dict[str, Project] | list[str | Path]] = Path.pickle(name=cls.repos)
+        # Archive is not cached, and parallel processes scan once.
+        rv = scan() if archive else Path.pickle(name=cls.repos, rm=rm, func=scan)
 
         if sync:
-            for item in rv[ProjectRepos.INSTANCES].values():
-                msg = f"{cls.repos.__name__}: sync -> {item.name}"
-                item.log.info(msg)
-                item.gh.sync()
-            return None
+            instances = list(rv[ProjectRepos.INSTANCES].values())
+
+            def progress(done: int, total: int, result: GitSync):
+                msg = f"{cls.repos.__name__}: sync [{done}/{total}] -> {result.state}"
+                if result.error or result.diverged:
+                    instances[0].log.warning(msg, extra={"extra": result.name})
+                else:
+                    instances[0].log.info(msg, extra={"extra": result.name})
+
+            coro = aiogh_sync([item.gh for item in instances], limit=workers, progress=progress)
+            if aioloop() is None:
+                return asyncio.run(coro)
+            # Called from a running loop (i.e.: IPython), where asyncio.run() fails.
+            with concurrent.futures.ThreadPoolExecutor(1) as executor:
+                return executor.submit(asyncio.run, coro).result()
         return rv[ret]
 
     def requirement(
@@ -0,0 +1,63 @@
+import json
+import math
+
+import pytest
+
+from nodeps import BENCHMARK_BUDGETS, InvalidArgumentError, benchmark, benchmark_cache, benchmark_giturl, giturl_corpus
+
+
+def test_benchmark():
+    b = benchmark(["import nodeps", "nodeps.pth"], repeat=1)
+    assert list(b.results) == ["import nodeps", "nodeps.pth"]
+    assert b.budgets == BENCHMARK_BUDGETS
+
+    b = benchmark(["import nodeps", "nodeps.pth"], budgets=dict.fromkeys(BENCHMARK_BUDGETS, math.inf), repeat=1)
+    assert b.exceeded == {}
+    assert json.loads(b.json())["exceeded"] == []
+
+
+def test_benchmark_exceeded(tmp_path):
+    b = benchmark(["import nodeps.modules"], budgets={"import nodeps.modules": 0}, repeat=1)
+    assert list(b.exceeded) == ["import nodeps.modules"]
+    b.json(tmp_path / "benchmark.json")
+    assert json.loads((tmp_path / "benchmark.json").read_text())["exceeded"] == ["import nodeps.modules"]
+
+
+def test_benchmark_invalid():
+    with pytest.raises(InvalidArgumentError):
+        benchmark(["import invalid"])
+
+
+def test_giturl_corpus():
+    urls = giturl_corpus(2_000)
+    assert len(urls) == len(set(urls)) == 2_000
+    assert urls[0] == "git@github.com:Org/Repo.git"
+    assert "git@github.com:Org/Repo1.git" in urls
+    assert "https://github.com/nephila/giturlparse1/blob/master/giturlparse/github.py" in urls
+
+
+def test_benchmark_giturl(tmp_path):
+    b = benchmark_giturl(500, budgets={"giturl parse": 0}, repeat=1)
+    assert b.info["size"] == 500
+    assert 0 < b.info["valid"] <= 500
+    assert list(b.exceeded) == ["giturl parse"]
+    assert set(b.results) == {"giturl parse", "giturl init", "giturl parse_many", "giturl rewrite", "giturl memory"}
+    b.json(tmp_path / "giturl.json")
+    assert json.loads((tmp_path / "giturl.json").read_text())["info"]["size"] == 500
+
+
+def test_benchmark_cache(tmp_path):
+    pytest.importorskip("jsonpickle")
+    b = benchmark_cache(10, budgets={"cache hit int": 0}, repeat=1)
+    assert b.info["number"] == 10
+    assert set(b.results) == {"cache hit int", "cache hit str", "cache hit dict", "cache hit object",
+                              "cache jsonpickle dict"}
+    assert list(b.exceeded) == ["cache hit int"]
+    b.json(tmp_path / "cache.json")
+    assert json.loads((tmp_path / "cache.json").read_text())["info"]["number"] == 10
+
+
+def test_giturl_corpus_invalid(tmp_path):
+    (tmp_path / "test.py").write_text("URLS = ('git@github.com:Org/Repo.git',)\n")
+    with pytest.raises(InvalidArgumentError):
+        giturl_corpus(10, files=[tmp_path / "test.py"])
@@ -1,6 +1,9 @@
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
+import typer.main
 
 from nodeps import IPYTHONDIR
 from nodeps import PYTHONSTARTUP
@@ -145,3 +148,23 @@ def test_version(cli: Cli):
 @pytest.mark.parametrize("cli", [[project_p, "venv"]], indirect=True)
 def test_venv(cli: Cli):
     assert cli.result.exit_code == 0
+
+
+def test_lazy_group():
+    group = typer.main.get_command(project_p)
+    assert group.commands == {}
+    assert "current" in group.list_commands(None)
+    assert group.get_command(None, "current").name == "current"
+    assert list(group.commands) == ["current"]
+    assert group.get_command(None, "invalid") is None
+
+
+def test_lazy_import():
+    code = (
+        "import sys; from nodeps.__main__ import project_p; "
+        "project_p(['--help'], standalone_mode=False); "
+        "assert 'IPython' not in sys.modules; "
+        "assert {'nodeps.modules.benchmarks', 'nodeps.modules.daemon', 'nodeps.modules.gh', "
+        "'nodeps.modules.project'}.isdisjoint(sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, check=True).returncode == 0
@@ -0,0 +1,103 @@
+import json
+import os
+import subprocess
+import sys
+import time
+import types
+
+import pytest
+from typer.testing import CliRunner
+
+import nodeps.__main__
+from nodeps import GITHUB_URL, PYTHON_VERSIONS
+from nodeps.__main__ import (
+    _completions_file,
+    _repos_completions,
+    _scheme_completions,
+    _versions_completions,
+    project_p,
+)
+
+
+class Context:
+    params = {}
+
+
+@pytest.fixture()
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture()
+def spawned(home, monkeypatch):
+    rv = []
+    popen = types.SimpleNamespace(Popen=lambda *args, **kwargs: rv.append(args), DEVNULL=subprocess.DEVNULL)
+    monkeypatch.setattr(nodeps.__main__, "subprocess", popen)
+    monkeypatch.setattr(nodeps.__main__.modules.Project, "repos", lambda *args, **kwargs: pytest.fail("scan"))
+    return rv
+
+
+def test_completions_missing(spawned):
+    assert list(_repos_completions(Context(), [], "")) == []
+    assert list(_versions_completions(Context(), [], "")) == list(PYTHON_VERSIONS)
+    assert list(_scheme_completions(Context(), [], "git+")) == [i for i in GITHUB_URL if i.startswith("git+")]
+    assert len(spawned) == 1
+    assert not _completions_file().exists()
+
+
+def test_completions_index(spawned):
+    _completions_file().parent.mkdir()
+    _completions_file().write_text(json.dumps({"repos": ["foo", "bar", "foobar"]}))
+    assert list(_repos_completions(Context(), [], "foo")) == ["foo", "foobar"]
+    assert spawned == []
+
+    # Stale index is refreshed once in the background, and served meanwhile
+    old = time.time() - nodeps.__main__._COMPLETIONS_TTL - 1
+    os.utime(_completions_file(), (old, old))
+    assert list(_repos_completions(Context(), [], "bar")) == ["bar"]
+    assert len(spawned) == 1
+    assert "_completions_refresh()" in spawned[0][0][-1]
+    assert list(_repos_completions(Context(), [], "bar")) == ["bar"]
+    assert len(spawned) == 1
+
+
+def test_completions_background(spawned, home):
+    file = _completions_file()
+    file.parent.mkdir()
+    file.write_text(json.dumps({"repos": ["stale"]}))
+    old = time.time() - nodeps.__main__._COMPLETIONS_TTL - 1
+    os.utime(file, (old, old))
+    assert list(_repos_completions(Context(), [], "")) == ["stale"]
+    assert file.with_suffix(".refresh").exists()
+
+    # The background command writes the index with the scan
+    executable, option, code = spawned[0][0]
+    patch = "import nodeps.modules; nodeps.modules.Project.repos = classmethod(lambda *args, **kwargs: ['foo']); "
+    subprocess.run([executable, option, patch + code], env=os.environ | {"HOME": str(home)}, check=True)
+    assert json.loads(file.read_text())["repos"] == ["foo"]
+    assert not file.with_suffix(".refresh").exists()
+    assert list(_repos_completions(Context(), [], "")) == ["foo"]
+    assert len(spawned) == 1
+
+
+def test_completions_refresh(home, monkeypatch):
+    subprocess.run(["git", "init", "-q", str(repo := home / "foo")], check=True)
+    subprocess.run(["git", "-C", str(repo), "remote", "add", "origin", "https://github.com/j5pu/foo"], check=True)
+    monkeypatch.setattr(nodeps.__main__.modules.Project, "repos", lambda *args, **kwargs: ["foo"])
+    assert CliRunner().invoke(project_p, ["repos", str(repo)]).exit_code == 0
+    index = json.loads(_completions_file().read_text())
+    assert index["repos"] == ["foo"]
+    assert index["versions"] == list(PYTHON_VERSIONS)
+
+    # Failed scan keeps the index, and the marker until the next refresh is due
+    def fail(*args, **kwargs):
+        raise OSError
+
+    monkeypatch.setattr(nodeps.__main__.modules.Project, "repos", fail)
+    assert CliRunner().invoke(project_p, ["repos", str(repo)]).exit_code == 1
+    _completions_file().with_suffix(".refresh").touch()
+    with pytest.raises(OSError):
+        nodeps.__main__._completions_refresh()
+    assert json.loads(_completions_file().read_text()) == index
+    assert _completions_file().with_suffix(".refresh").exists()
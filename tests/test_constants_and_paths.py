@@ -1,6 +1,7 @@
 import importlib
 import os
 import pathlib
+import subprocess
 import sys
 
 import pytest
@@ -48,6 +49,18 @@ def test_nodeps_paths():
     assert NODEPS_SRC.name == "src"
 
 
+def test_constants_lazy():
+    code = (
+        "import sys; import nodeps.modules.constants as c; "
+        "lazy = {'DOCKER', 'DOCKER_COMMAND', 'EXECUTABLE_SITE', 'LOCAL', 'NODEPS_TOP', 'PW_ROOT', 'PW_USER'}; "
+        "assert not lazy & set(vars(c)); "
+        "assert c.LOCAL is (not c.CI and not c.DOCKER); "
+        "assert {'DOCKER', 'LOCAL'} <= set(vars(c))"
+    )
+    assert subprocess.run([sys.executable, "-c", code], check=True).returncode == 0
+    assert nodeps.modules.constants.PW_USER.pw_name == nodeps.modules.constants.USER
+
+
 @pytest.mark.skipif(_IN_TOX is True, reason='running in tox')
 def test_constants_venv():
     if RUNNING_IN_VENV:
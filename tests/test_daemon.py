@@ -0,0 +1,152 @@
+import io
+import json
+import os
+import pathlib
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from nodeps import daemon_client
+from nodeps.fixtures import Repos, repos
+from nodeps.modules.daemon import _ENVIRON, _serve
+
+CLIENT = "from nodeps.modules.daemon import client_{}; client_{}()"
+
+
+@pytest.fixture()
+def daemon(tmp_path):
+    sock = tmp_path / "run" / "nodeps.sock"
+    env = os.environ | {"NODEPS_DAEMON_SOCKET": str(sock)}
+    with (tmp_path / "daemon.log").open("w") as log:
+        p = subprocess.Popen([sys.executable, "-m", "nodeps", "--daemon"], env=env, stderr=log)
+    for _ in range(100):
+        if sock.exists():
+            break
+        time.sleep(0.1)
+    yield env
+    p.terminate()
+    p.wait()
+
+
+def client(env: dict, app: str, *args: str, cwd=None) -> subprocess.CompletedProcess:
+    name = "gh_g" if app == "g" else "project_p"
+    return subprocess.run([sys.executable, "-c", CLIENT.format(name, name), *args], env=env, cwd=cwd,
+                          capture_output=True, text=True, timeout=60)
+
+
+def served(env: dict) -> list[str]:
+    """Commands served by the daemon, the client runs the command without the daemon if it is not running."""
+    log = pathlib.Path(env["NODEPS_DAEMON_SOCKET"]).parent.parent / "daemon.log"
+    return [line for line in log.read_text().splitlines() if line.startswith(("g ", "p "))]
+
+
+def test_daemon(daemon: dict, repos: Repos):
+    sock = pathlib.Path(daemon["NODEPS_DAEMON_SOCKET"])
+    assert sock.stat().st_mode & 0o777 == 0o600
+    assert sock.parent.stat().st_mode & 0o777 == 0o700
+
+    rv = client(daemon, "g", "current", cwd=repos.local.top)
+    assert rv.returncode == 0
+    assert rv.stdout == "main\n"
+
+    rv = client(daemon, "p", "remote", cwd=repos.local.top)
+    assert rv.returncode == 0
+    assert rv.stdout == subprocess.check_output(["git", "remote", "get-url", "origin"], cwd=repos.local.top,
+                                                text=True)
+
+    rv = client(daemon, "p", "invalid")
+    assert rv.returncode == 2
+    assert "invalid" in rv.stderr
+
+    assert served(daemon) == ["g current: 0", "p remote: 0", "p invalid: 2"]
+
+
+def test_daemon_errors(daemon: dict, tmp_path: pathlib.Path):
+    # Malformed request, without file descriptors
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(daemon["NODEPS_DAEMON_SOCKET"])
+        s.sendall(b"{")
+        s.shutdown(socket.SHUT_WR)
+        assert s.recv(1024) == b"1"
+
+    # Malformed request
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(daemon["NODEPS_DAEMON_SOCKET"])
+        socket.send_fds(s, [b"\0"], [0, 1, 2])
+        s.sendall(json.dumps({"app": "p"}).encode())
+        s.shutdown(socket.SHUT_WR)
+        assert s.recv(1024) == b"1"
+
+    # Missing cwd, reported in the client stderr
+    r, w = os.pipe()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(daemon["NODEPS_DAEMON_SOCKET"])
+        socket.send_fds(s, [b"\0"], [0, 1, w])
+        s.sendall(json.dumps({"app": "p", "argv": ["--help"], "cwd": str(tmp_path / "missing"),
+                              "env": daemon}).encode())
+        s.shutdown(socket.SHUT_WR)
+        assert s.recv(1024) == b"1"
+    os.close(w)
+    with os.fdopen(r) as f:
+        assert "No such file or directory" in f.read()
+
+    rv = client(daemon, "p", "--help")
+    assert rv.returncode == 0
+    assert served(daemon) == ["p --help: 1", "p --help: 0"]
+
+
+def test_daemon_nested(daemon: dict):
+    # Not forwarded, and not served by the client while the daemon is running
+    rv = client(daemon, "p", "--daemon")
+    assert rv.returncode == 1
+    assert "daemon already running" in rv.stderr
+
+    # Not served again by the daemon if forwarded
+    r, w = os.pipe()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(daemon["NODEPS_DAEMON_SOCKET"])
+        socket.send_fds(s, [b"\0"], [0, 1, w])
+        s.sendall(json.dumps({"app": "p", "argv": ["--daemon"], "cwd": os.getcwd(), "env": daemon}).encode())
+        s.shutdown(socket.SHUT_WR)
+        assert s.recv(1024) == b"1"
+    os.close(w)
+    with os.fdopen(r) as f:
+        assert "daemon already running" in f.read()
+
+    assert client(daemon, "p", "--help").returncode == 0
+    assert served(daemon) == ["p --daemon: 1", "p --help: 0"]
+    log = pathlib.Path(daemon["NODEPS_DAEMON_SOCKET"]).parent.parent / "daemon.log"
+    assert log.read_text().count("Listening on") == 1
+
+
+def test_daemon_local(daemon: dict, repos: Repos):
+    # Other environment
+    rv = client(daemon | {"GIT": "other"}, "g", "current", cwd=repos.local.top)
+    assert rv.returncode == 0
+    assert rv.stdout == "main\n"
+    assert served(daemon) == ["g current: local"]
+
+    # A connection waiting for the request does not block other clients
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(daemon["NODEPS_DAEMON_SOCKET"])
+        assert client(daemon, "g", "current", cwd=repos.local.top).returncode == 0
+    assert served(daemon) == ["g current: local", "g current: 0"]
+
+    # Busy
+    busy, environ = threading.Lock(), {name: os.environ.get(name) for name in _ENVIRON}
+    a, b = socket.socketpair()
+    with a, busy:
+        socket.send_fds(a, [b"\0"], [0, 1, 2])
+        a.sendall(json.dumps({"app": "p", "argv": ["--help"], "cwd": os.getcwd(), "env": dict(os.environ)}).encode())
+        a.shutdown(socket.SHUT_WR)
+        _serve(b, busy, environ, log := io.StringIO())
+        assert a.recv(1024) == b"local"
+    assert log.getvalue() == "p --help: local\n"
+
+
+def test_daemon_not_running(tmp_path):
+    assert daemon_client("p", ["--help"], path=str(tmp_path / "nodeps.sock")) is None
@@ -0,0 +1,157 @@
+import asyncio
+import copy
+import dataclasses
+import enum
+import time
+import typing
+
+import pytest
+
+pytest.importorskip("jsonpickle")
+pytest.importorskip("structlog")
+
+from nodeps.extras.pickle import _key, cache  # noqa: E402
+
+
+def test_lru():
+    calls = []
+
+    @cache(maxsize=3)
+    def func(a, b=None):
+        calls.append((a, b))
+        return [a, b]
+
+    for i in range(1000):
+        func(i, b={"i": i})
+    assert func.cache_info() == (0, 1000, 3, 3)
+    assert func(999, b={"i": 999}) == [999, {"i": 999}]
+    assert func(997, b={"i": 997}) == [997, {"i": 997}]
+    func(1000)
+    assert func.cache_info() == (2, 1001, 3, 3)
+
+    # 998 was the least recently used
+    calls.clear()
+    func(998, b={"i": 998})
+    func(997, b={"i": 997})
+    assert calls == [(998, {"i": 998})]
+
+    func.cache_clear()
+    assert func.cache_info() == (0, 0, 3, 0)
+
+    @cache(maxsize=0)
+    def func(a):
+        calls.append(a)
+        return a
+
+    calls.clear()
+    func(1)
+    func(1)
+    assert calls == [1, 1]
+    assert func.cache_info() == (0, 2, 0, 0)
+
+
+def test_ttl():
+    calls = []
+
+    @cache(ttl=0.05)
+    async def func(a):
+        calls.append(a)
+        return a
+
+    assert asyncio.run(func({})) == {}
+    assert asyncio.run(func({})) == {}
+    assert calls == [{}]
+    time.sleep(0.05)
+    assert asyncio.run(func({})) == {}
+    assert calls == [{}, {}]
+    assert func.cache_info() == (1, 2, 128, 1)
+
+
+def test_unbounded():
+    @cache(maxsize=None)
+    def func(a):
+        return a
+
+    for i in range(200):
+        func(i)
+    assert func.cache_info().currsize == 200
+    assert cache(func.__wrapped__).cache_info().maxsize == 128
+
+
+class Color(enum.Enum):
+    RED = 1
+
+
+@dataclasses.dataclass(frozen=True)
+class Frozen:
+    a: int
+
+
+class Object:
+    def __init__(self, a):
+        self.a = a
+
+
+class Point(typing.NamedTuple):
+    a: typing.Any
+
+
+class Eq:
+    def __init__(self, a):
+        self.a = a
+
+    def __eq__(self, other):
+        return self.a == other.a
+
+    def __hash__(self):
+        return hash(self.a)
+
+
+def test_key():
+    # Equal values, the same key
+    for args, kwargs in (
+            ((1, "a", None, b"b", 1.5, True), {}),
+            (({"a": [1, 2], "b": {"c": (3, {4})}}, Color.RED, Frozen(1), int), {"d": {"e": [1]}}),
+            ((Object({"a": 1}),), {}),
+    ):
+        assert _key(args, kwargs) == _key(*copy.deepcopy((args, kwargs)))
+
+    assert isinstance(_key((1, [2], {"a": (3,)}, Color.RED, Frozen(1)), {"b": 1}), list)
+    assert isinstance(_key((Object(1),), {}), str)
+    assert isinstance(_key(([Object(1)],), {}), str)
+    assert isinstance(_key(({"a": Object(1)},), {}), str)
+
+    # Equal but different types, or positional and keyword arguments, are different keys
+    keys = [_key(args, kwargs) for args, kwargs in (
+        ((1,), {}), ((1.0,), {}), ((True,), {}), (("1",), {}), ((b"1",), {}),
+        (([1],), {}), (((1,),), {}), (({1},), {}), ((frozenset({1}),), {}), (([1.0],), {}),
+        (({"a": 1},), {}), (({"a": 1.0},), {}), (({"a": [1]},), {}), (({"a": (1,)},), {}), (({1: "a"},), {}),
+        ((), {"a": 1}), ((1,), {"a": 1}), ((1, 1), {}), ((Color.RED,), {}), ((Frozen(1),), {}), ((int,), {}),
+        ((Point(True),), {}), ((Point(1.0),), {}), ((Point([1]),), {}), ((Frozen(True),), {}), ((Frozen(1.0),), {}),
+        ((Eq(True),), {}), ((Eq(1.0),), {}),
+    )]
+    assert all(a != b for i, a in enumerate(keys) for b in keys[i + 1:])
+
+
+def test_key_hit():
+    calls = []
+
+    @cache
+    def func(*args, **kwargs):
+        calls.append(args)
+        return args
+
+    func({"a": [1, 2]}, Object(1), b=Frozen(2))
+    func({"a": [1, 2]}, Object(1), b=Frozen(2))
+    func({"a": [1, 2.0]}, Object(1), b=Frozen(2))
+    func(Object(2))
+    func(Object(2))
+    assert len(calls) == 3
+
+    # Equal named tuples, dataclasses or user types with different field types are different keys
+    calls.clear()
+    for cls in (Point, Frozen, Eq):
+        assert func(cls(True)) == (cls(True),)
+        assert type(func(cls(1.0))[0].a) is float
+        assert func(cls(True))[0].a is True
+    assert len(calls) == 6
@@ -1,7 +1,16 @@
+import os
+import time
+
+import pytest
 import typer
 
+from nodeps import GIT_FETCH_TTL
 from nodeps import Gh
 from nodeps import Path
+from nodeps import Project
+from nodeps import ProjectRepos
+from nodeps import aiogh
+from nodeps import aiogh_sync
 from nodeps.__main__ import _dirty
 from nodeps.__main__ import _diverge
 from nodeps.__main__ import _needpull
@@ -214,3 +223,139 @@ def test_needs_push(repos: Repos):
     assert invoke(_needpush, [str(repos.local.top)]).exit_code == 0
 
     sync(local)
+
+
+def test_fetch(repos: Repos):
+    local = Gh(repos.local)
+
+    Path(repos.clone.top).touch("test.text")
+    repos.clone.git.add(".")
+    repos.clone.git.commit("-a", "-m", "First commit.")
+    repos.clone.remote(name='origin').push()
+
+    assert local.status(fetch=False).pull is False
+    status = local.status()
+    assert status.pull is True
+    assert status.base == status.local == repos.local.git.rev_parse("@")
+    assert status.remote == repos.local.git.rev_parse("@{u}") == repos.clone.git.rev_parse("@")
+
+    sync(local)
+
+
+def test_no_upstream(repos: Repos):
+    repos.local.git.checkout("-b", "no-upstream")
+
+    status = Gh(repos.local).status(fetch=False)
+    assert status.push is True
+    assert status.dirty == status.diverge == status.pull is False
+    assert status.local == repos.local.git.rev_parse("@")
+
+
+def test_fetch_ttl(repos: Repos, monkeypatch):
+    local = Gh(repos.local)
+    fetches = []
+    git_check_call = Gh.git_check_call
+
+    def counted(self, line):
+        if line.startswith("fetch"):
+            fetches.append(line)
+        return git_check_call(self, line)
+
+    monkeypatch.setattr(Gh, "git_check_call", counted)
+
+    Path(repos.local.top).touch("test.text")
+    local.sync()
+    assert len(fetches) == 1
+    assert local.status(fetch=None).push is False
+    assert len(fetches) == 1
+
+    fetch_head = Path(repos.local.git_dir) / "FETCH_HEAD"
+    os.utime(fetch_head, (fetch_head.stat().st_atime, time.time() - GIT_FETCH_TTL - 1))
+    local.status(fetch=None)
+    assert len(fetches) == 2
+    local.status()
+    assert len(fetches) == 3
+    local.status(fetch=False)
+    assert len(fetches) == 3
+
+    # Status commands fetch only if not fetched in GIT_FETCH_TTL, pull and push always fetch
+    top = str(repos.local.top)
+    for args, count in (
+        (["needpull", top], 3),
+        (["status", top], 3),
+        (["needpull", "--fetch", top], 4),
+        (["pull", top], 5),
+        (["pull", "--no-fetch", top], 5),
+        (["push", top], 6),
+    ):
+        invoke(gh_g, args)
+        assert len(fetches) == count, args
+
+
+@pytest.mark.asyncio
+async def test_aio(repos: Repos, tmp_path):
+    local, clone = Gh(repos.local), Gh(repos.clone)
+    assert await local.aiostatus() == local.status(fetch=False)
+    assert await local.aiocurrent() == local.current() == "main"
+
+    Path(repos.clone.top).touch("test.text")
+    await clone.aiopush()
+    assert clone.status(fetch=False).push is False
+
+    status = await local.aiostatus()
+    assert status == local.status(fetch=False)
+    assert status.pull is True
+    assert status.remote == repos.clone.git.rev_parse("@")
+
+    Path(repos.local.top).touch("test_local.text")
+    with pytest.raises(RuntimeError, match="Diverged"):
+        await local.aiocommit()
+
+    Path(repos.local.top).rm("test_local.text")
+    rv = await aiogh([local, repos.clone.top, tmp_path], "sync", limit=2)
+    assert rv[:2] == [None, None]
+    assert rv[2].__class__.__name__ == "InvalidArgumentError"
+    for status in await aiogh([local, clone], local.aiostatus.__name__):
+        assert status.dirty == status.diverge == status.pull == status.push is False
+
+    await local.aiotag("0.0.1")
+    assert await clone.aiolatest() != "0.0.1"
+    await clone.aiostatus()
+    assert await clone.aiolatest() == local.latest() == "0.0.1"
+
+
+@pytest.mark.asyncio
+async def test_aiogh_sync(repos: Repos, tmp_path):
+    Path(repos.clone.top).touch("test.text")
+    progress = []
+    rv = await aiogh_sync([repos.clone, Gh(repos.local), tmp_path], limit=1,
+                          progress=lambda done, total, _: progress.append((done, total)))
+    assert [result.state for result in rv[:2]] == ["pushed", "pulled"]
+    assert rv[2].name == tmp_path.name
+    assert rv[2].state.startswith("error: InvalidArgumentError")
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert all(result.duration > 0 for result in rv)
+
+    rv = await aiogh_sync([repos.clone, repos.local])
+    assert all(result.skipped for result in rv)
+
+    rv = await aiogh_sync([f"{repos.local.top}/", f"{repos.local.top}/."], limit=1)
+    assert [result.name for result in rv] == [Path(repos.local.top).name] * 2
+
+    Path(repos.local.top).touch("test_local.text")
+    Path(repos.clone.top).touch("test_remote.text")
+    rv = await aiogh_sync([repos.clone, repos.local], limit=1)
+    assert rv[0].pushed is True
+    assert rv[1].diverged is True
+    assert rv[1].state == "diverged"
+    assert not (Path(repos.local.top) / "test_remote.text").exists()
+
+
+@pytest.mark.asyncio
+async def test_repos_sync_running_loop(repos: Repos, monkeypatch):
+    instances = {"clone": Project(repos.clone.top), "local": Project(repos.local.top)}
+    monkeypatch.setattr(Path, "pickle", classmethod(lambda cls, **kwargs: {ProjectRepos.INSTANCES: instances}))
+
+    Path(repos.clone.top).touch("test.text")
+    rv = Project.repos(sync=True, workers=1)
+    assert [result.state for result in rv] == ["pushed", "pulled"]
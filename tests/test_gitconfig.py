@@ -0,0 +1,205 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from nodeps import GIT_CONFIG_GLOBAL
+from nodeps import git_branch
+from nodeps import git_config
+from nodeps import git_config_cache_clear
+from nodeps import git_config_global
+from nodeps import git_dir
+from nodeps import git_global_config
+from nodeps import git_ref
+from nodeps import git_remote_url
+from nodeps import git_superproject
+from nodeps import git_tags
+from nodeps import git_top
+
+
+def git(cwd, *args):
+    return subprocess.run(["git", "-C", str(cwd), *args], capture_output=True, check=True, text=True).stdout.strip()
+
+
+def git_url(cwd, key="remote.origin.url"):
+    return subprocess.run(["git", "-C", str(cwd), "config", "--get", key], capture_output=True,
+                          text=True).stdout.removesuffix("\n") or None
+
+
+@pytest.fixture()
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+    for name in ("GIT_DIR", "GIT_CONFIG", "GIT_CONFIG_GLOBAL", "GIT_CONFIG_COUNT", "GIT_CEILING_DIRECTORIES"):
+        monkeypatch.delenv(name, raising=False)
+    (tmp_path / "home").mkdir()
+    (tmp_path / "home/.gitconfig").write_text("[user]\n\tname = test\n\temail = test@example.com\n"
+                                              "[init]\n\tdefaultBranch = main\n")
+    return tmp_path / "home"
+
+
+@pytest.fixture()
+def repo(tmp_path, home):
+    path = tmp_path / "repo"
+    path.mkdir()
+    git(path, "init", "-q")
+    git(path, "remote", "add", "origin", "https://github.com/owner/repo")
+    (path / "sub").mkdir()
+    (path / "README.md").touch()
+    git(path, "add", ".")
+    git(path, "commit", "-q", "-m", "First commit.")
+    return path
+
+
+def test_remote_url(repo):
+    assert git_remote_url(repo) == git_url(repo) == "https://github.com/owner/repo"
+    assert git_remote_url(repo / "sub") == git_url(repo / "sub")
+    assert git_remote_url(repo / "README.md") == git_url(repo)
+    assert git_remote_url(repo, remote="upstream") is None
+    assert git_dir(repo / "sub") == (repo / ".git", repo / ".git")
+
+
+def test_not_repo(tmp_path, home):
+    assert git_dir(tmp_path) is None
+    assert git_remote_url(tmp_path) is None
+
+
+def test_worktree_and_submodule(repo, tmp_path):
+    worktree = tmp_path / "worktree"
+    git(repo, "worktree", "add", "-q", str(worktree))
+    assert git_remote_url(worktree) == git_url(worktree) == "https://github.com/owner/repo"
+    assert git_dir(worktree) == (repo / ".git/worktrees/worktree", repo / ".git")
+
+    git(repo, "-c", "protocol.file.allow=always", "submodule", "add", "-q", str(repo), "module")
+    assert (repo / "module/.git").is_file()
+    assert git_remote_url(repo / "module") == git_url(repo / "module") == str(repo)
+    assert git_dir(repo / "module") == (repo / ".git/modules/module", repo / ".git/modules/module")
+
+
+def test_syntax(repo):
+    with (repo / ".git/config").open("a") as f:
+        f.write('[Remote "Other"]\n  URL = " git@github.com:a/b.git" ; comment\n'
+                '[remote.legacy] url = https://x.com/a\\\n/b # comment\n'
+                '[section "sub\\"section"]\n\tkey\n')
+    assert git_remote_url(repo, remote="Other") == git_url(repo, "remote.Other.url") == " git@github.com:a/b.git"
+    assert git_remote_url(repo, remote="legacy") == git_url(repo, "remote.legacy.url") == "https://x.com/a/b"
+    assert git_config(repo)['section.sub"section.key'] == [None]
+
+
+def test_includes(repo, home, tmp_path):
+    (home / "include").write_text("[remote \"origin\"]\n\turl = https://github.com/include/repo\n")
+    (home / "gitdir").write_text("[remote \"origin\"]\n\turl = https://github.com/gitdir/repo\n")
+    (home / "onbranch").write_text("[remote \"origin\"]\n\turl = https://github.com/onbranch/repo\n")
+    with (home / ".gitconfig").open("a") as f:
+        f.write(f'[include]\n\tpath = include\n[includeIf "gitdir:{tmp_path}/"]\n\tpath = ~/gitdir\n')
+    # Local config is read after global.
+    assert git_remote_url(repo) == git_url(repo) == "https://github.com/owner/repo"
+    git(repo, "config", "--unset", "remote.origin.url")
+    assert git_remote_url(repo) == git_url(repo) == "https://github.com/gitdir/repo"
+    with (repo / ".git/config").open("a") as f:
+        f.write('[includeIf "onbranch:ma*"]\n\tpath = ../../home/onbranch\n')
+    assert git_remote_url(repo) == git_url(repo) == "https://github.com/onbranch/repo"
+    git(repo, "checkout", "-q", "-b", "other")
+    assert git_remote_url(repo) == git_url(repo) == "https://github.com/gitdir/repo"
+
+
+def test_insteadof(repo, home):
+    with (home / ".gitconfig").open("a") as f:
+        f.write('[url "git@github.com:"]\n\tinsteadOf = https://github.com/\n'
+                '[url "git@github.com:owner/"]\n\tinsteadOf = https://github.com/owner/\n')
+    assert git_remote_url(repo) == git_url(repo) == "https://github.com/owner/repo"
+    assert git_remote_url(repo, insteadof=True) == git(repo, "remote", "get-url", "origin") == \
+           "git@github.com:owner/repo"
+
+
+def test_fallback(repo, home, monkeypatch):
+    with (home / ".gitconfig").open("a") as f:
+        f.write('[includeIf "hasconfig:remote.*.url:https://github.com/**"]\n\tpath = hasconfig\n')
+    (home / "hasconfig").write_text("[user]\n\tname = hasconfig\n")
+    assert git_config(repo) is None
+    assert git_remote_url(repo) == git_url(repo)
+
+    monkeypatch.setenv("GIT_DIR", str(Path(repo) / ".git"))
+    assert git_config(repo) is None
+
+
+def test_refs(repo, tmp_path):
+    assert git_branch(repo / "sub") == git(repo, "branch", "--show-current") == "main"
+    assert git_ref(repo) == git(repo, "rev-parse", "HEAD")
+    assert git_top(repo / "sub") == Path(git(repo / "sub", "rev-parse", "--show-toplevel")) == repo.resolve()
+    assert git_top(repo / ".git") is None
+    assert git_superproject(repo) is None
+
+    for tag in ("v1.10.0", "v1.9.0", "v1.9.0-rc1", "v1.2", "nested/v2"):
+        git(repo, "tag", tag)
+    git(repo, "pack-refs", "--all")
+    git(repo, "tag", "v1.11.0")
+    assert (repo / ".git/refs/tags/v1.11.0").is_file()
+    expected = subprocess.run(f"git -C {repo} tag | sort -V", shell=True, capture_output=True, text=True).stdout
+    assert git_tags(repo) == expected.split()
+    assert git_ref(repo, "refs/tags/v1.2") == git(repo, "rev-parse", "refs/tags/v1.2")
+
+    git(repo, "checkout", "-q", "--detach")
+    assert git_branch(repo) == git(repo, "branch", "--show-current") == ""
+    git(repo, "checkout", "-q", "--orphan", "unborn")
+    assert git_branch(repo) == "unborn"
+
+    # reftable is read with git
+    (repo / ".git/reftable").mkdir()
+    assert git_ref(repo) is None
+    assert git_tags(repo) == expected.split()
+    assert git_branch(repo) == "unborn"
+
+
+def test_superproject(repo, tmp_path):
+    git(repo, "-c", "protocol.file.allow=always", "submodule", "add", "-q", str(repo), "module")
+    assert git_superproject(repo / "module") == Path(
+        git(repo / "module", "rev-parse", "--show-superproject-working-tree")) == repo.resolve()
+    assert git_top(repo / "module") == (repo / "module").resolve()
+
+    # Not in .gitmodules
+    nested = repo / "nested"
+    nested.mkdir()
+    git(nested, "init", "-q")
+    assert git_superproject(nested) is None
+
+
+def test_global(home, monkeypatch):
+    (home / ".gitconfig").write_text("[Pull]\n\tRebase = false\n[user]\n\tname = home\n[include]\n\tpath = include\n")
+    (home / "include").write_text("[user]\n\temail = include@example.com\n")
+    expected = {}
+    for line in git(home, "config", "--global", "--list").splitlines():
+        key, _, value = line.partition("=")
+        expected.setdefault(key, []).append(value)
+    assert git_global_config() == expected == {"pull.rebase": ["false"], "user.name": ["home"],
+                                               "include.path": ["include"]}
+
+    # Both files as git >= 2.46
+    (home / ".config/git").mkdir(parents=True)
+    (home / ".config/git/config").write_text("[user]\n\tname = xdg\n")
+    assert git_global_config()["user.name"] == ["xdg", "home"]
+
+    calls = []
+    run, check_call = subprocess.run, subprocess.check_call
+    monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: calls.append(args[0]) or run(*args, **kwargs))
+    monkeypatch.setattr(subprocess, "check_call",
+                        lambda *args, **kwargs: calls.append(args[0]) or check_call(*args, **kwargs))
+    git_config_global()
+    assert calls == [f"git config --global {key} {value}" for key, value in GIT_CONFIG_GLOBAL.items()
+                     if key.lower() not in expected]
+    assert all(key.lower() in git_global_config() for key in GIT_CONFIG_GLOBAL)
+
+    calls.clear()
+    git_config_global()
+    git_config_cache_clear()
+    git_config_global()
+    assert calls == []
+
+    (home / "other").write_text('[user]\n\tname = "unterminated\n')
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(home / "other"))
+    assert git_global_config() is None
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(home / ".gitconfig"))
+    monkeypatch.setattr("nodeps.modules.gh.git_global_config", lambda: None)
+    git_config_global()
+    assert calls == [f"git config --global {key}" for key in GIT_CONFIG_GLOBAL]
@@ -0,0 +1,93 @@
+import http.server
+import json
+import threading
+import time
+import urllib.error
+
+import pytest
+
+from nodeps import GitUrl
+
+LATENCY = 0.1
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):  # noqa: N802
+        self.requests.append(self.path)
+        time.sleep(LATENCY)
+        parts = self.path.strip("/").split("/")
+        owner, repo = parts[1:3]
+        if owner == "missing":
+            self.send_error(404, "Not Found")
+            return
+        if len(parts) == 3:
+            body = {"default_branch": f"{repo}-main", "visibility": "private" if repo == "private" else "public"}
+        elif owner == "forbidden":
+            self.send_error(403, "Forbidden")
+            return
+        else:
+            body = {"permission": "admin" if parts[4] == "admin" else "write"}
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def api(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(GitUrl, "api_repos_url", f"http://127.0.0.1:{server.server_port}/repos")
+    Handler.requests.clear()
+    yield Handler.requests
+    server.shutdown()
+    server.server_close()
+
+
+def test_github_many(api):
+    urls = [f"https://github.com/owner/repo{i}" for i in range(8)] + ["git@github.com:owner/repo0.git"]
+    start = time.perf_counter()
+    rv = GitUrl.github_many(urls, user="admin")
+    elapsed = time.perf_counter() - start
+
+    assert list(rv) == [f"owner/repo{i}" for i in range(8)]
+    assert rv["owner/repo1"] == {"default": "repo1-main", "public": True, "admin": True}
+    assert len(api) == 16
+    # Serial would be 16 * LATENCY, each repo makes two sequential requests.
+    assert elapsed < 8 * LATENCY
+
+    # Same cache as the methods.
+    api.clear()
+    url = GitUrl(urls[1])
+    assert url.admin("admin") is True
+    assert url.default() == "repo1-main"
+    assert url.public() is True
+    assert GitUrl.github_many(urls, user="admin") == rv
+    assert api == []
+
+    rv = GitUrl.github_many(urls[:2], user="admin", rm=True)
+    assert len(api) == 4
+
+
+def test_github_many_errors(api):
+    rv = GitUrl.github_many(["https://github.com/owner/private", "https://github.com/missing/repo",
+                             "https://github.com/forbidden/repo"], user="other")
+    assert rv["owner/private"] == {"default": "private-main", "public": False, "admin": False}
+    assert isinstance(rv["missing/repo"]["error"], urllib.error.HTTPError)
+    assert rv["missing/repo"]["error"].code == 404
+    assert rv["forbidden/repo"] == {"default": "repo-main", "public": True, "admin": False}
+
+    api.clear()
+    assert GitUrl.github_many(["https://github.com/owner/private"], user=None, repos=False) == {"owner/private": {}}
+    assert GitUrl.github_many(["https://github.com/owner/private"], user="other", repos=False) == {
+        "owner/private": {"admin": False}}
+    assert api == []
@@ -0,0 +1,28 @@
+import dataclasses
+import unittest
+
+from nodeps import GitUrl, GitUrlRecord
+
+
+class UrlCacheTestCase(unittest.TestCase):
+    def test_cache(self):
+        url = "git@github.com:Org/Cached-Repo.git"
+        before = GitUrl.parse.cache_info()
+        p1 = GitUrl(url)
+        p2 = GitUrl(url)
+        after = GitUrl.parse.cache_info()
+        self.assertEqual(after.misses, before.misses + 1)
+        self.assertEqual(after.hits, before.hits + 1)
+        self.assertEqual(p1, p2)
+        self.assertIsNot(p1.protocols, p2.protocols)
+        self.assertIs(GitUrl.parse(url), GitUrl.parse(url))
+
+    def test_record(self):
+        record = GitUrl.parse("https://gitlab.com/owner/group/repo")
+        self.assertIsInstance(record, GitUrlRecord)
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertEqual((record.platform, record.owner, record.groups_path, record.repo),
+                         ("gitlab", "owner", "group", "repo"))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            record.repo = "foo"
+        self.assertIsNone(GitUrl.parse("invalid"))
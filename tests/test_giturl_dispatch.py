@@ -0,0 +1,42 @@
+import itertools
+import unittest
+
+from nodeps.modules.platforms import PLATFORMS, dispatch
+
+from test_giturl_parse import INVALID_PARSE_URLS, VALID_PARSE_URLS
+from test_giturl_rewrite import REWRITE_URLS
+
+URLS = (
+    *(url for _, (url, _) in VALID_PARSE_URLS),
+    *(url for _, url in INVALID_PARSE_URLS),
+    *(url for url, *_ in REWRITE_URLS),
+    *(
+        f"{scheme}{user}{host}{path}"
+        for scheme, user, host, path in itertools.product(
+            ("", "https://", "git+https://", "git://", "ssh://", "git+file://", "HTTPS://"),
+            ("", "git@", "u:t@", "a@evil.com/x@"),
+            ("github.com", "bitbucket.org", "friendco.de", "git.assembla.com", "GitHub.com", "host:8080"),
+            ("/o/r", ":o/r.git", "/o/g/r/blob/main/x.py", "/o@user/r.git"),
+        )
+    ),
+)
+
+
+def first(candidates, url):
+    """Name and protocol of the first pattern that matches with the platform domains."""
+    for name, plat, protocol, regex in candidates:
+        if not (match := regex.match(url)):
+            continue
+        domain = match.group("domain")
+        if (plat.DOMAINS and domain not in plat.DOMAINS) or (plat.SKIP_DOMAINS and domain in plat.SKIP_DOMAINS):
+            continue
+        return name, protocol
+    return None
+
+
+class UrlDispatchTestCase(unittest.TestCase):
+    def test_dispatch(self):
+        for url in URLS:
+            every = [(name, plat, protocol, regex) for name, plat in PLATFORMS
+                     for protocol, regex in plat.COMPILED_PATTERNS.items()]
+            self.assertEqual(first(every, url), first(dispatch(url), url), url)
@@ -0,0 +1,31 @@
+import unittest
+
+from nodeps import GitUrl
+
+from test_giturl_parse import INVALID_PARSE_URLS, VALID_PARSE_URLS
+from test_giturl_rewrite import REWRITE_URLS
+
+URLS = [url for _, (url, _) in VALID_PARSE_URLS] + [url for url, *_ in REWRITE_URLS]
+
+
+class UrlParseManyTestCase(unittest.TestCase):
+    def test_valid_urls(self):
+        rv = GitUrl.parse_many(URLS)
+        self.assertEqual(rv["url"], URLS)
+        for i, url in enumerate(URLS):
+            p = GitUrl(url)
+            self.assertIsNone(rv["error"][i], url)
+            for key in ("host", "owner", "repo", "protocol", "platform"):
+                self.assertEqual(rv[key][i], getattr(p, key), url)
+            for key in ("url2git", "url2githttps", "url2gitssh", "url2https", "url2ssh"):
+                try:
+                    expected = getattr(p, key)
+                except KeyError:
+                    expected = None
+                self.assertEqual(rv[key][i], expected, url)
+
+    def test_invalid_urls(self):
+        urls = [url for _, url in INVALID_PARSE_URLS]
+        rv = GitUrl.parse_many(urls)
+        self.assertTrue(all(rv["error"]))
+        self.assertEqual(rv["repo"], [None] * len(urls))
@@ -1,3 +1,5 @@
+import dataclasses
+import pickle
 import unittest
 
 from nodeps import GitUrl
@@ -93,6 +95,39 @@ class UrlRewriteTestCase(unittest.TestCase):
         for data in REWRITE_URLS:
             self._test_rewrite(*data)
 
+    def test_formatters(self):
+        for source, protocol, _ in REWRITE_URLS:
+            parsed = GitUrl(source)
+            items = {**dataclasses.asdict(parsed), "port_slash": f"{parsed.port}/" if parsed.port else "",
+                     "groups_slash": f"{parsed.groups_path}/" if parsed.groups_path else "",
+                     "dot_git": "" if parsed.repo.endswith(".git") else ".git"}
+            self.assertEqual(parsed.format(protocol), parsed._platform_obj.FORMATS[protocol] % items)
+
+    def test_memoized(self):
+        source = "git@gitlab.com:Org/Group/Memo-Repo.git"
+        parsed = GitUrl(source)
+        self.assertEqual(parsed._formats, {})
+        self.assertIs(parsed.url2https, parsed.url2https)
+        self.assertEqual(GitUrl.parse(source).format("https"), parsed.url2https)
+        self.assertEqual(list(parsed._formats), ["https"])
+        self.assertEqual(parsed._formats["https"][1], "https://gitlab.com/Org/Group/Memo-Repo.git")
+        self.assertEqual(GitUrl(source)._formats, {})
+
+    def test_memo_mutation(self):
+        source = "git@github.com:Org/Repo.git"
+        parsed = GitUrl(source)
+        self.assertEqual(parsed.url2https, "https://github.com/Org/Repo.git")
+        parsed.owner = "Other"
+        parsed.repo = "X"
+        self.assertEqual(parsed.url2https, "https://github.com/Other/X.git")
+        self.assertEqual(GitUrl(source).url2ssh, "git@github.com:Org/Repo.git")
+        self.assertEqual(GitUrl(source).url2https, "https://github.com/Org/Repo.git")
+
+    def test_pickle(self):
+        for source, protocol, expected in REWRITE_URLS:
+            parsed = pickle.loads(pickle.dumps(GitUrl(source)))
+            self.assertEqual(parsed.format(protocol), expected)
+
 
 # Test Suite
 suite = unittest.TestLoader().loadTestsFromTestCase(UrlRewriteTestCase)
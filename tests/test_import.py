@@ -1,4 +1,5 @@
 import subprocess
+import sys
 
 import nodeps
 
@@ -11,3 +12,48 @@ def test_import() -> None:
     with Path.tempfile() as tmp:
         tmp.write_text(f"import sys; sys.path.insert(0, '{str(NODEPS_SRC)}'); import {NODEPS_NAME}")
         assert subprocess.run([EXECUTABLE_SITE, tmp], check=True).returncode == 0
+
+
+def test_import_lazy() -> None:
+    """Test that submodules are imported when their names are accessed."""
+    code = (
+        f"import sys; sys.path.insert(0, '{str(NODEPS_SRC)}'); import {NODEPS_NAME}; "
+        "assert not {'IPython', 'pip', 'nodeps.modules.functions'} & set(sys.modules), sys.modules.keys(); "
+        f"assert {NODEPS_NAME}.Path.__module__ == 'nodeps.modules.path'; "
+        "assert 'nodeps.modules.path' in sys.modules and 'nodeps.modules.gh' not in sys.modules"
+    )
+    assert subprocess.run([EXECUTABLE_SITE, "-c", code], check=True).returncode == 0
+
+
+def test_import_all() -> None:
+    """Test that ``__all__`` is built from the submodules ``__all__``."""
+    from nodeps import extras, ipython_variables, modules, setup
+
+    assert nodeps.__all__ == extras.__all__ + ipython_variables.__all__ + modules.__all__ + setup.__all__
+    for name in nodeps.__all__:
+        getattr(nodeps, name)
+    assert "Path" in dir(nodeps)
+
+
+def test_import_names(tmp_path, monkeypatch) -> None:
+    """Test that literal ``__all__`` is parsed without importing the submodule, and computed ``__all__`` imported."""
+    from nodeps._lazy import _names
+
+    package = tmp_path / "lazy_names"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "paren.py").write_text('__all__ = (\n    "a",  # (a)\n    ")",\n)\nraise ImportError\n')
+    (package / "listed.py").write_text('"""Docstring."""\n__all__ = [\n    "b",\n]\nraise ImportError\n')
+    (package / "computed.py").write_text('__all__ = tuple(name for name in ("c", "d"))\n')
+    (package / "extended.py").write_text('__all__ = ("e",)\n__all__ += ("f",)\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    __import__("lazy_names")
+
+    assert _names("lazy_names", "paren") == ("a", ")")
+    assert _names("lazy_names", "listed") == ("b",)
+    assert _names("lazy_names", "computed") == ("c", "d")
+    assert _names("lazy_names", "extended") == ("e", "f")
+    assert {"lazy_names.computed", "lazy_names.extended"} < set(sys.modules)
+    assert not {"lazy_names.paren", "lazy_names.listed"} & set(sys.modules)
+    for name in [name for name in sys.modules if name.startswith("lazy_names")]:
+        del sys.modules[name]
@@ -0,0 +1,142 @@
+import concurrent.futures
+import contextlib
+import os
+import pickle
+import subprocess
+import sys
+import time
+
+import pytest
+
+import nodeps.modules.path
+from nodeps import PICKLE_SCHEMA
+from nodeps import Path
+
+
+@pytest.fixture()
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path / ".pickle"
+
+
+def test_format(home):
+    assert Path.pickle({"a": 1}, name="a/b", version="1") == {"a": 1}
+    file = home / "a_b.pickle"
+    with file.open("rb") as f:
+        assert pickle.load(f) == (PICKLE_SCHEMA, "1", None)
+        assert pickle.load(f) == {"a": 1}
+    assert [p.name for p in home.glob("*.pickle")] == ["a_b.pickle"]
+
+    # Previous format, partial and empty files are discarded
+    for content in (pickle.dumps({"a": 1}), file.read_bytes()[:-3], b""):
+        file.write_bytes(content)
+        assert Path.pickle(name="a/b", version="1") is None
+        assert not file.exists()
+
+
+def test_ttl_namespace(home):
+    Path.pickle(1, name="a", ttl=0.05)
+    Path.pickle(2, name="a", namespace="other")
+    assert Path.pickle(name="a") == 1
+    assert Path.pickle(name="a", namespace="other") == 2
+    time.sleep(0.05)
+    assert Path.pickle(name="a") is None
+    assert Path.pickle(name="a", namespace="other") == 2
+
+    Path.pickle(1, name="a")
+    Path.pickle_clear("other")
+    assert Path.pickle(name="a", namespace="other") is None
+    assert Path.pickle(name="a") == 1
+
+
+def test_evict_info(home, monkeypatch):
+    monkeypatch.setattr(nodeps.modules.path, "PICKLE_MAXSIZE", 10_000)
+    before = Path.pickle_info()
+    data = b"x" * 1000
+    home.mkdir()
+    (tmp := home / ".0.in-flight.tmp").write_bytes(data * 20)
+    for i in range(8):
+        Path.pickle(data, name=str(i))
+        os.utime(home / f"{i}.pickle", ns=(i, i))
+    assert Path.pickle(name="0") == data  # least recently used is now 1
+    for i in range(8, 12):
+        Path.pickle(data, name=str(i))
+
+    rv = sorted(int(p.stem) for p in home.glob("*.pickle"))
+    assert rv == [0, *range(13 - len(rv), 12)]
+    assert sorted(int(p.name[1:-5]) for p in home.glob(".*.lock")) == rv
+    assert Path.pickle(name="missing") is None
+    info = Path.pickle_info()
+    assert info.evictions - before.evictions == 12 - info.entries
+    assert info.writes - before.writes == 12
+    assert info.hits - before.hits == 1
+    assert info.misses - before.misses == 1
+    assert 7_000 < info.size <= 10_000
+    assert tmp.exists()
+
+
+def test_info_threads(home):
+    Path.pickle(1, name="a")
+    before = Path.pickle_info()
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda _: Path.pickle(name="a"), range(800)))
+    assert Path.pickle_info().hits - before.hits == 800
+
+
+def test_single_flight(home, tmp_path):
+    calls = tmp_path / "calls"
+    code = f"""
+import time
+from nodeps import Path
+def scan():
+    with open({str(calls)!r}, "a") as f:
+        f.write("call\\n")
+    time.sleep(0.3)
+    return {{"scan": 1}}
+print(Path.pickle(name="scan", func=scan))
+"""
+    procs = [subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE, text=True) for _ in range(4)]
+    assert [proc.communicate()[0] for proc in procs] == ["{'scan': 1}\n"] * 4
+    assert calls.read_text() == "call\n"
+
+    def scan():
+        calls.write_text(calls.read_text() + "call\n")
+        time.sleep(0.1)
+        return {"scan": 2}
+
+    Path.pickle(name="scan", rm=True)
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        rv = list(executor.map(lambda _: Path.pickle(name="scan", func=scan), range(4)))
+    assert rv == [{"scan": 2}] * 4
+    assert calls.read_text() == "call\ncall\n"
+    assert not list(home.glob("*.tmp"))
+
+
+def test_discard(home, monkeypatch):
+    Path.pickle(1, name="a", version="1")
+    file = home / "a.pickle"
+    fresh = file.read_bytes()
+    Path.pickle(1, name="a", version="0")
+
+    # Stale file replaced by other process after it is read is not removed
+    pickle_lock = Path.pickle_lock
+
+    @contextlib.contextmanager
+    def replace(name, namespace=None, blocking=True):
+        (tmp := home / ".a.tmp").write_bytes(fresh)
+        os.replace(tmp, file)
+        with pickle_lock(name, namespace, blocking) as locked:
+            yield locked
+
+    with monkeypatch.context() as m:
+        m.setattr(Path, "pickle_lock", replace)
+        assert Path.pickle(name="a", version="1") is None
+    assert Path.pickle(name="a", version="1") == 1
+
+    # Stale file is not removed while other thread or process holds the lock
+    with concurrent.futures.ThreadPoolExecutor(1) as executor, Path.pickle_lock("a"):
+        assert executor.submit(Path.pickle, name="a", version="2").result() is None
+        assert file.exists()
+    assert Path.pickle(name="a", version="2") is None
+    assert not file.exists()
+    assert not list(home.iterdir())
@@ -0,0 +1,170 @@
+import gzip
+import http.server
+import json
+import socket
+import threading
+import time
+import urllib.error
+
+import pytest
+
+import nodeps.modules.functions
+from nodeps import Path
+from nodeps import urljson
+from nodeps import urljson_many
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    authorization = []
+    connections = set()
+    requests = []
+    version = 1
+
+    def do_GET(self):  # noqa: N802
+        self.authorization.append(self.headers.get("Authorization"))
+        self.connections.add(self.client_address)
+        self.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/slow":
+            time.sleep(1)
+        if self.path.startswith("/latency"):
+            time.sleep(0.2)
+        if self.path.startswith("/redirect"):
+            self.send_response(301)
+            location = {"/redirect": "/data", "/redirect-host": f"http://localhost:{self.server.server_port}/data"}
+            self.send_header("Location", location[self.path])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/missing":
+            self.send_error(404, "Not Found")
+            return
+        etag = f'"v{self.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        data = json.dumps({"path": self.path, "version": self.version}).encode()
+        self.send_response(200)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if self.path != "/no-etag":
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    for name in ("http_proxy", "HTTP_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    Handler.authorization.clear()
+    Handler.connections.clear()
+    Handler.requests.clear()
+    Handler.version = 1
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_keep_alive(server):
+    for i in range(5):
+        assert urljson(f"{server}/data{i}") == {"path": f"/data{i}", "version": 1}
+    assert len(Handler.requests) == 5
+    assert len(Handler.connections) == 1
+
+    assert urljson(f"{server}/redirect") == {"path": "/data", "version": 1}
+    assert [path for path, _ in Handler.requests[-2:]] == ["/redirect", "/data"]
+    assert len(Handler.connections) == 1
+
+
+def test_redirect_authorization(server):
+    headers = {"Authorization": "token secret"}
+    _, _, body = nodeps.modules.functions._urlget(f"{server}/redirect", headers, 5)
+    assert json.loads(body) == {"path": "/data", "version": 1}
+    assert Handler.authorization == ["token secret", "token secret"]
+
+    _, _, body = nodeps.modules.functions._urlget(f"{server}/redirect-host", headers, 5)
+    assert json.loads(body) == {"path": "/data", "version": 1}
+    assert Handler.authorization[2:] == ["token secret", None]
+    assert headers == {"Authorization": "token secret"}
+
+
+def test_etag(server):
+    url = f"{server}/data"
+    assert urljson(url) == {"path": "/data", "version": 1}
+    assert urljson(url) == {"path": "/data", "version": 1}
+    assert Handler.requests == [("/data", None)]
+    assert Path.pickle(name=url, version="etag") == ('"v1"', {"path": "/data", "version": 1})
+
+    assert urljson(url, rm=True) == {"path": "/data", "version": 1}
+    assert Handler.requests[-1] == ("/data", '"v1"')
+
+    Handler.version = 2
+    assert urljson(url, rm=True) == {"path": "/data", "version": 2}
+    assert Handler.requests[-1] == ("/data", '"v1"')
+    assert Path.pickle(name=url, version="etag") == ('"v2"', {"path": "/data", "version": 2})
+    assert urljson(url) == {"path": "/data", "version": 2}
+    assert len(Handler.requests) == 3
+
+    url = f"{server}/no-etag"
+    urljson(url)
+    urljson(url, rm=True)
+    assert Handler.requests[-1] == ("/no-etag", None)
+
+
+def test_errors(server):
+    with pytest.raises(urllib.error.HTTPError) as exc_info:
+        urljson(f"{server}/missing")
+    assert exc_info.value.code == 404
+    assert Path.pickle(name=f"{server}/missing") is None
+
+    with pytest.raises(socket.timeout):
+        urljson(f"{server}/slow", timeout=0.1)
+    assert urljson(f"{server}/data") == {"path": "/data", "version": 1}
+
+    with pytest.raises(ValueError, match="Non-HTTPS"):
+        urljson("http://example.com/data")
+
+
+def test_urljson_many(server):
+    urls = [f"{server}/latency{i}" for i in range(5)]
+    start = time.perf_counter()
+    rv = urljson_many([*urls, f"{server}/missing", urls[0], "http://example.com/data"])
+    elapsed = time.perf_counter() - start
+
+    assert rv[:5] == [{"path": f"/latency{i}", "version": 1} for i in range(5)]
+    assert isinstance(rv[5], urllib.error.HTTPError)
+    assert rv[5].code == 404
+    assert rv[6] is rv[0]
+    assert isinstance(rv[7], ValueError)
+    assert sorted(path for path, _ in Handler.requests) == [*(f"/latency{i}" for i in range(5)), "/missing"]
+    # Serial would be 5 * 0.2
+    assert elapsed < 0.6
+
+    # Same cache as urljson
+    Handler.requests.clear()
+    assert urljson(urls[1]) == rv[1]
+    assert urljson_many(urls) == rv[:5]
+    assert Handler.requests == []
+
+    assert urljson_many(urls[:2], rm=True, workers=1) == rv[:2]
+    assert Handler.requests == [("/latency0", '"v1"'), ("/latency1", '"v1"')]
+
+
+def test_pool_maxsize(server, monkeypatch):
+    monkeypatch.setattr(nodeps.modules.functions, "_POOL_MAXSIZE", 2)
+    monkeypatch.setattr(nodeps.modules.functions, "_POOL", {})
+    urljson_many([f"{server}/latency{i}" for i in range(5)], workers=5)
+    assert len(Handler.connections) == 5
+    assert [len(idle) for idle in nodeps.modules.functions._POOL.values()] == [2]